@@ -2,30 +2,184 @@ import logging
 import os
 from functools import lru_cache
 from pathlib import Path
+from typing import Iterator
 import duckdb
+from fastapi import HTTPException, Request
 from src.core.fetch_config import FetchConfig
-from src.db.connection import DuckDBConnection
+from src.db.connection import DuckDBConnection, DuckDBConnectionPool
+from src.db.data_version import DataVersion
+from src.db.generation import Generation, GenerationCursor, GenerationHolder
+from src.db.manifest import MANIFEST
+from src.db.snapshot import CURRENT, current_snapshot, snapshot_meta
 from src.db.ingest_registry import IngestRegistry
 from src.db.processed_registry import ProcessedRegistry
 from src.db.curated_registry import CuratedRegistry
 
 logger = logging.getLogger("app.dependencies")
 
+DB_POOL_SIZE      = int(os.environ.get("QRL_DB_POOL_SIZE", "8"))
+DB_POOL_TIMEOUT_S = float(os.environ.get("QRL_DB_POOL_TIMEOUT_S", "30"))
+DUCKDB_THREADS    = os.environ.get("QRL_DUCKDB_THREADS")
+DUCKDB_MEMORY     = os.environ.get("QRL_DUCKDB_MEMORY_LIMIT")
+DATA_VERSION_TTL_S = float(os.environ.get("QRL_DATA_VERSION_TTL_S", "5"))
+# "auto" opens data/snapshot/CURRENT when it matches the Parquet data version,
+# "off" always registers Parquet views, anything else is a .duckdb path to open
+SNAPSHOT          = os.environ.get("QRL_SNAPSHOT", "auto")
+# how often the watcher checks for a newly published manifest or snapshot (0 = never),
+# and how long a reload waits for requests on the old generation before moving on
+RELOAD_INTERVAL_S = float(os.environ.get("QRL_RELOAD_INTERVAL_S", "30"))
+RELOAD_DRAIN_S    = float(os.environ.get("QRL_RELOAD_DRAIN_S", "60"))
+
+
 @lru_cache(maxsize=1)
-def get_db() -> duckdb.DuckDBPyConnection:
+def _config() -> FetchConfig:
     base_dir = Path(
         os.environ.get(
             "QRL_BASE_DIR",
             Path(__file__).resolve().parent.parent
         )
     )
-    config = FetchConfig(base_dir=base_dir)
+    return FetchConfig(base_dir=base_dir)
+
+
+def _published_before_snapshot(config: FetchConfig) -> bool:
+    # CURRENT is written once the snapshot it names is built. when that is after both
+    # layer manifests, the snapshot holds what the pipeline last published, and the
+    # Parquet tree need not be walked to confirm it. a layer without a manifest is
+    # published by any Parquet write, so only the data version can tell
+    manifests = [_mtime(root / MANIFEST) for root in (config.processed_dir, config.curated_dir)]
+    return all(manifests) and _mtime(config.snapshot_dir / CURRENT) > max(manifests)
+
+
+def _open_snapshot(config: FetchConfig) -> DuckDBConnection | None:
+    if SNAPSHOT == "off":
+        return None
+    path = current_snapshot(config.snapshot_dir) if SNAPSHOT == "auto" else Path(SNAPSHOT)
+    if path is None:
+        return None
+    if not path.exists():
+        raise FileNotFoundError(f"QRL_SNAPSHOT not found: {path}")
+
+    db_conn = DuckDBConnection(path, threads=DUCKDB_THREADS, memory_limit=DUCKDB_MEMORY, read_only=True)
+    if SNAPSHOT != "auto" or _published_before_snapshot(config):
+        return db_conn
+    built   = snapshot_meta(db_conn.get())["data_version"]
+    parquet = get_data_version().current()
+    # a deploy may ship only the snapshot ("0-" = no Parquet to compare against)
+    if built != parquet and not parquet.startswith("0-"):
+        logger.warning("Snapshot %s is for data version %s, Parquet is at %s; using Parquet views.", path, built, parquet)
+        db_conn.close()
+        return None
+    return db_conn
+
+
+def _open_generation() -> Generation:
+    config = _config()
+    # a fresh fingerprint, so a reload or cold start never reuses one the watcher took
+    # before the publish; it walks the Parquet tree only if something asks for it
+    get_data_version.cache_clear()
+    db_conn = _open_snapshot(config)
+
+    if db_conn is not None:
+        source  = f"snapshot {db_conn.db_path.name}"
+        version = snapshot_meta(db_conn.get())["data_version"]
+        updated = db_conn.db_path.stat().st_mtime
+    else:
+        # views only, so an in-memory catalog: each generation gets its own, and the
+        # pipeline keeps the lock on data/duckdb for its builders
+        db_conn = DuckDBConnection(
+            db_path=Path(":memory:"),
+            threads=DUCKDB_THREADS,
+            memory_limit=DUCKDB_MEMORY,
+        )
+        # the queried layers register from the pipeline's manifests where present,
+        # so startup does not expand globs over the data directories
+        IngestRegistry(db_conn=db_conn, config=config).register_all()
+        ProcessedRegistry(db_conn=db_conn, config=config, use_manifest=True).register_all()
+        CuratedRegistry(db_conn=db_conn, config=config, use_manifest=True).register_all()
+        dv      = get_data_version()
+        source  = "Parquet views"
+        version = dv.current()
+        updated = dv.last_modified()
+
+    pool = DuckDBConnectionPool(db_conn, size=DB_POOL_SIZE, timeout_s=DB_POOL_TIMEOUT_S)
+    logger.info("DuckDB connection established from %s (data version %s). Cursor pool size=%d.", source, version, pool.size)
+    return Generation(pool, version=version, updated=updated, source=source)
+
+
+generations = GenerationHolder(_open_generation, drain_timeout_s=RELOAD_DRAIN_S)
+
+
+def get_generation() -> Generation:
+    return generations.current()
+
+
+def get_pool() -> DuckDBConnectionPool:
+    return generations.current().pool
+
+
+def _mtime(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def published_version() -> str:
+    # what the pipeline has published: the snapshot pointer and the layer manifests.
+    # a layer without a manifest is registered by globbing, so any Parquet write to
+    # it counts as a publish
+    config = _config()
+    marks  = []
+    if SNAPSHOT == "auto":
+        marks.append(_mtime(config.snapshot_dir / CURRENT))
+    elif SNAPSHOT != "off":
+        marks.append(_mtime(Path(SNAPSHOT)))
+    manifests = [_mtime(root / MANIFEST) for root in (config.processed_dir, config.curated_dir)]
+    marks.extend(manifests)
+    if not all(manifests):
+        marks.append(get_data_version().current())
+    return "|".join(str(m) for m in marks)
+
+
+def reload_generation() -> Generation:
+    # opens the published data next to the active generation, swaps it in and
+    # closes the old one once its requests finish
+    return generations.reload()
+
+
+@lru_cache(maxsize=1)
+def get_data_version() -> DataVersion:
+    # the API only reads processed and curated views
+    config = _config()
+    return DataVersion([config.processed_dir, config.curated_dir], ttl_s=DATA_VERSION_TTL_S)
+
+
+def request_generation(request: Request) -> Generation:
+    # the generation get_db checked out for this request; a swap since then
+    # does not change which data the request's cursor reads
+    generation = getattr(request.state, "generation", None)
+    return generation if generation is not None else get_generation()
+
+
+class RequestCursor(GenerationCursor):
 
-    db_conn = DuckDBConnection(db_path=config.duckdb_path)
+    def cursor(self):
+        try:
+            return super().cursor()
+        except TimeoutError as e:
+            raise HTTPException(status_code=503, detail=str(e))
 
-    IngestRegistry(db_conn=db_conn, config=config).register_all()
-    ProcessedRegistry(db_conn=db_conn, config=config).register_all()
-    CuratedRegistry(db_conn=db_conn, config=config).register_all()
 
-    logger.info("DuckDB connection established. All views registered.")
-    return db_conn.get()
+def get_db(request: Request) -> Iterator[GenerationCursor]:
+    # a cursor from the active generation, taken from the pool only once the route
+    # queries. the request keeps its generation open until it finishes, even if a
+    # reload swaps in a newer one meanwhile
+    generation = generations.checkout()
+    request.state.generation = generation
+    db = RequestCursor(generation)
+    try:
+        yield db
+    finally:
+        db.release()
+        generations.checkin(generation)
@@ -1,13 +1,30 @@
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.routers import chain, vix, scenario, portfolio, var, market
+from app.dependencies import generations, get_generation, get_pool
+from app.services.data_watcher import data_watcher
+from app.services.response_cache import response_cache
+from app.services.single_flight import single_flight
 
 logging.basicConfig(level=logging.INFO)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    data_watcher.start()
+    # open before the first request instead of on it
+    get_generation()
+    yield
+    data_watcher.stop()
+    generations.close()
+
+
 app = FastAPI(
     title="Quant Risk Console API",
     description="EOD derivatives risk console for Indian Index F&O",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.include_router(chain.router)
@@ -19,7 +36,31 @@ app.include_router(market.router)
 
 @app.get("/health")
 def health():
-    return {"status": "ok"}
+    return {
+        "status":  "ok",
+        **get_generation().describe(),
+        "reloads": data_watcher.stats(),
+    }
+
+
+@app.get("/health/db")
+def health_db():
+    pool = get_pool()
+    return {
+        "status":    "ok",
+        "database":  str(pool.db_conn.db_path),
+        "read_only": pool.db_conn.read_only,
+        "pool":      pool.stats(),
+    }
+
+
+@app.get("/health/cache")
+def health_cache():
+    return {
+        "status":        "ok",
+        "responses":     response_cache.stats(),
+        "single_flight": single_flight.stats(),
+    }
 
 #run
 """
@@ -1,16 +1,68 @@
 import duckdb
 from datetime import date
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 
 from app.dependencies import get_db
-from app.schemas.chain import ChainResponse
-from app.services.chain_service import get_option_chain
+from app.schemas.chain import ChainResponse, ChainColumnarResponse, ChainShockResponse, StrikesResponse
+from app.services.chain_service import (
+    ARROW_STREAM, LAYOUTS, ChainFilter, get_option_chain, get_option_chain_arrow, get_chain_shock, get_strikes,
+)
+from app.services.response_cache import cached_response
+from src.quant.scenario_engine import Shock
 
 router = APIRouter(prefix="/chain", tags=["chain"])
 
 VALID_SYMBOLS = {"NIFTY", "BANKNIFTY", "FINNIFTY", "MIDCPNIFTY"}
 
+
+def chain_format(
+    layout: str           = Query(default="rows", description="JSON layout: 'rows' (one object per contract) or 'columnar' (one array per field)."),
+    accept: Optional[str] = Header(default=None),
+) -> str:
+    # Accept: application/vnd.apache.arrow.stream wins over the JSON layout
+    if accept and ARROW_STREAM in accept:
+        return "arrow"
+    if layout not in LAYOUTS:
+        raise HTTPException(status_code=400, detail=f"Invalid layout: '{layout}'. Expected one of {LAYOUTS}.")
+    return layout
+
+
+def chain_filter(
+    fields:      Optional[str]   = Query(default=None, description="Comma-separated columns to return, e.g. 'strike,option_type,iv'. Rows then carry only these keys."),
+    atm_window:  Optional[int]   = Query(default=None, ge=0, description="Listed strikes either side of the ATM strike (closest to spot)."),
+    moneyness:   Optional[float] = Query(default=None, gt=0, description="Max |strike / spot - 1|, e.g. 0.05 for ±5%."),
+    option_type: Optional[str]   = Query(default=None, description="CE or PE."),
+    min_oi:      Optional[int]   = Query(default=None, ge=0, description="Minimum open interest."),
+) -> ChainFilter:
+    try:
+        return ChainFilter(
+            fields=tuple(f.strip() for f in fields.split(",") if f.strip()) if fields is not None else None,
+            atm_window=atm_window,
+            moneyness=moneyness,
+            option_type=option_type.upper() if option_type else None,
+            min_oi=min_oi,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/strikes/{symbol}/{trade_date}/{expiry_date}", response_model=StrikesResponse)
+@cached_response("chain.strikes")
+def strikes_endpoint(
+    symbol:      str,
+    trade_date:  date,
+    expiry_date: date,
+    db:          duckdb.DuckDBPyConnection = Depends(get_db),
+):
+    symbol = symbol.upper()
+    if symbol not in VALID_SYMBOLS:
+        raise HTTPException(status_code=400, detail=f"Unknown symbol: {symbol}")
+    return get_strikes(symbol, trade_date, expiry_date, db)
+
+
 @router.get("/expiries/{symbol}/{trade_date}")
+@cached_response("chain.expiries")
 def expiries_endpoint(
     symbol:     str,
     trade_date: date,
@@ -21,20 +73,63 @@ def expiries_endpoint(
         raise HTTPException(status_code=400, detail=f"Unknown symbol: {symbol}")
 
     result = db.execute("""
-        SELECT DISTINCT CAST(expiry_date AS DATE) AS expiry_date
+        SELECT DISTINCT expiry_date
         FROM v_curated_option_chain
         WHERE symbol = ?
-          AND CAST(trade_date AS DATE) = ?
+          AND year = ? AND month = ?
+          AND trade_date = ?
         ORDER BY expiry_date ASC
-    """, [symbol, trade_date]).fetchall()
+    """, [symbol, trade_date.year, trade_date.month, trade_date]).fetchall()
 
     return {"expiries": [str(r[0]) for r in result]}
 
-@router.get("/{symbol}/{trade_date}/{expiry_date}", response_model=ChainResponse)
+@router.get("/{symbol}/{trade_date}/shock", response_model=ChainShockResponse)
+@cached_response("chain.shock")
+def chain_shock_endpoint(
+    symbol:          str,
+    trade_date:      date,
+    spot_shock_pct:  float = Query(default=0.0, description="Percentage. -1.5 means spot drops 1.5%."),
+    vol_shock_abs:   float = Query(default=0.0, description="Absolute vol points. +2.0 means IV rises 2 points."),
+    rate_shock_bps:  float = Query(default=0.0, description="Basis points. +20 means rate rises 20bps."),
+    rate_shock_3m_bps: float = Query(default=0.0, description="Basis points at the 3m tenor, interpolated per expiry."),
+    rate_shock_6m_bps: float = Query(default=0.0, description="Basis points at the 6m tenor, interpolated per expiry."),
+    rate_shock_1y_bps: float = Query(default=0.0, description="Basis points at the 1y tenor, interpolated per expiry."),
+    db:              duckdb.DuckDBPyConnection = Depends(get_db),
+):
+    symbol = symbol.upper()
+    if symbol not in VALID_SYMBOLS:
+        raise HTTPException(status_code=400, detail=f"Unknown symbol: {symbol}")
+
+    shock = Shock(
+        spot_shock_pct=spot_shock_pct,
+        vol_shock_abs=vol_shock_abs,
+        rate_shock_bps=rate_shock_bps,
+        tenor_shocks_bps={
+            "3m": rate_shock_3m_bps,
+            "6m": rate_shock_6m_bps,
+            "1y": rate_shock_1y_bps,
+        },
+    )
+    result = get_chain_shock(symbol, trade_date, shock, db)
+    if result.row_count == 0:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No option chain found for {symbol} trade_date={trade_date}."
+        )
+    return result
+
+@router.get(
+    "/{symbol}/{trade_date}/{expiry_date}",
+    response_model=ChainResponse | ChainColumnarResponse,
+    responses={200: {"content": {ARROW_STREAM: {}}}},
+)
+@cached_response("chain.chain")
 def chain_endpoint(
     symbol: str,
     trade_date: date,
     expiry_date: date,
+    fmt: str = Depends(chain_format),
+    filters: ChainFilter = Depends(chain_filter),
     db: duckdb.DuckDBPyConnection = Depends(get_db),
 ):
     symbol = symbol.upper()
@@ -45,12 +140,15 @@ def chain_endpoint(
     if expiry_date < trade_date:
         raise HTTPException(status_code=400, detail="expiry_date must be >= trade_date")
 
-    return get_option_chain(symbol, trade_date, expiry_date, db)
+    if fmt == "arrow":
+        return Response(content=get_option_chain_arrow(symbol, trade_date, expiry_date, db, filters), media_type=ARROW_STREAM)
+    return get_option_chain(symbol, trade_date, expiry_date, db, layout=fmt, chain_filter=filters)
 
 @router.get("/latest-date", response_model=dict)
+@cached_response("chain.latest_date")
 def latest_date_endpoint(db: duckdb.DuckDBPyConnection = Depends(get_db)):
     query = """
-        SELECT MAX(CAST(trade_date AS DATE)) AS latest_date
+        SELECT MAX(trade_date) AS latest_date
         FROM v_curated_option_chain
     """
     result = db.execute(query).fetchone()
@@ -5,12 +5,14 @@ import duckdb
 from app.dependencies import get_db
 from app.schemas.market import MarketSummaryResponse, VIXData, YieldData
 from app.services.market_service import get_market_summary
+from app.services.response_cache import cached_response
 
 
 router = APIRouter(prefix="/market", tags=["market"])
 
 
 @router.get("/summary/{trade_date}", response_model=MarketSummaryResponse)
+@cached_response("market.summary")
 def fetch_market_summary(
     trade_date: date,
     conn: duckdb.DuckDBPyConnection = Depends(get_db)
@@ -28,5 +30,7 @@ def fetch_market_summary(
             ),
             chart_data=result['chart_data']
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch market summary: {str(e)}")
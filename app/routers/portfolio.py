@@ -1,24 +1,31 @@
 import duckdb
 from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
 
 from app.dependencies import get_db
-from app.schemas.portfolio import PortfolioResponse, ShockInput
-from app.services.portfolio_service import analyze_portfolio
+from app.services.single_flight import request_key, single_flight
+from app.schemas.portfolio import PortfolioResponse, PortfolioColumnarResponse, ShockInput
+from app.services.portfolio_service import analyze_portfolio, replay_portfolio
 from src.quant.scenario_engine import Shock
 
 router = APIRouter(prefix="/portfolio", tags=["portfolio"])
 
 VALID_SYMBOLS = {"NIFTY", "BANKNIFTY", "FINNIFTY", "MIDCPNIFTY"}
+MAX_REPLAY_DAYS = 1830
 
 
-@router.post("/analyze", response_model=PortfolioResponse)
+@router.post("/analyze", response_model=PortfolioResponse | PortfolioColumnarResponse)
 def portfolio_endpoint(
     trade_date:      date        = Form(...),
     spot_shock_pct:  float       = Form(...),
     vol_shock_abs:   float       = Form(...),
     rate_shock_bps:  float       = Form(...),
     file:            UploadFile  = File(...),
+    rate_shock_3m_bps: float     = Form(0.0),
+    rate_shock_6m_bps: float     = Form(0.0),
+    rate_shock_1y_bps: float     = Form(0.0),
+    layout:          str         = Form("rows"),
     db:              duckdb.DuckDBPyConnection = Depends(get_db),
 ):
     if not file.filename.endswith(".csv"):
@@ -32,14 +39,61 @@ def portfolio_endpoint(
         spot_shock_pct=spot_shock_pct,
         vol_shock_abs=vol_shock_abs,
         rate_shock_bps=rate_shock_bps,
+        tenor_shocks_bps={
+            "3m": rate_shock_3m_bps,
+            "6m": rate_shock_6m_bps,
+            "1y": rate_shock_1y_bps,
+        },
     )
 
+    # the same book uploaded by several desks at once is priced once
+    key = request_key(
+        "portfolio.analyze", db, file_bytes,
+        trade_date=trade_date, shock=shock, layout=layout,
+    )
     try:
-        return analyze_portfolio(
+        return single_flight.do(key, lambda: analyze_portfolio(
             file_bytes=file_bytes,
             trade_date=trade_date,
             shock=shock,
             db=db,
+            layout=layout,
+        ))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/replay")
+def replay_endpoint(
+    start_date:  date        = Form(...),
+    end_date:    date        = Form(...),
+    file:        UploadFile  = File(...),
+    db:          duckdb.DuckDBPyConnection = Depends(get_db),
+):
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="end_date must be >= start_date")
+
+    if (end_date - start_date).days > MAX_REPLAY_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Replay range cannot exceed {MAX_REPLAY_DAYS} calendar days."
+        )
+
+    if not file.filename.endswith(".csv"):
+        raise HTTPException(status_code=400, detail="Uploaded file must be a CSV.")
+
+    file_bytes = file.file.read()
+    if len(file_bytes) == 0:
+        raise HTTPException(status_code=400, detail="Uploaded CSV is empty.")
+
+    try:
+        lines = replay_portfolio(
+            file_bytes=file_bytes,
+            start_date=start_date,
+            end_date=end_date,
+            db=db,
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(lines, media_type="application/x-ndjson")
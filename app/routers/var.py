@@ -3,7 +3,8 @@ from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
 
 from app.dependencies import get_db
-from app.schemas.var import VaRResponse
+from app.services.single_flight import request_key, single_flight
+from app.schemas.var import VaRResponse, VaRColumnarResponse
 from app.services.var_service import analyze_var
 
 router = APIRouter(prefix="/var", tags=["var"])
@@ -11,12 +12,13 @@ router = APIRouter(prefix="/var", tags=["var"])
 VALID_SYMBOLS = {"NIFTY", "BANKNIFTY", "FINNIFTY", "MIDCPNIFTY"}
 
 
-@router.post("/analyze", response_model=VaRResponse)
+@router.post("/analyze", response_model=VaRResponse | VaRColumnarResponse)
 def var_endpoint(
     symbol:        str        = Form(...),
     trade_date:    date       = Form(...),
     lookback_days: int        = Form(default=252),
     file:          UploadFile = File(...),
+    layout:        str        = Form("rows"),
     db:            duckdb.DuckDBPyConnection = Depends(get_db),
 ):
     symbol = symbol.upper()
@@ -37,13 +39,18 @@ def var_endpoint(
     if len(file_bytes) == 0:
         raise HTTPException(status_code=400, detail="Uploaded CSV is empty.")
 
+    key = request_key(
+        "var.analyze", db, file_bytes,
+        symbol=symbol, trade_date=trade_date, lookback_days=lookback_days, layout=layout,
+    )
     try:
-        return analyze_var(
+        return single_flight.do(key, lambda: analyze_var(
             file_bytes=file_bytes,
             symbol=symbol,
             trade_date=trade_date,
             lookback_days=lookback_days,
             db=db,
-        )
+            layout=layout,
+        ))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -4,12 +4,14 @@ from fastapi import APIRouter, Depends
 
 from app.dependencies import get_db
 from app.schemas.vix import VIXResponse
+from app.services.response_cache import cached_response
 from app.services.vix_service import get_vix
 
 router = APIRouter(prefix="/vix", tags=["vix"])
 
 
 @router.get("/{trade_date}", response_model=VIXResponse)
+@cached_response("vix")
 def vix_endpoint(
     trade_date: date,
     db: duckdb.DuckDBPyConnection = Depends(get_db),
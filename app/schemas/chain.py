@@ -37,3 +37,69 @@ class ChainResponse(BaseModel):
     iv_computed_count: int
     iv_avg: float | None = None
     rows: list[ChainRow]
+
+
+class ChainColumns(BaseModel):
+    trade_date:     list[date]
+    symbol:         list[str]
+    expiry_date:    list[date]
+    strike:         list[float]
+    option_type:    list[str]
+    open:           list[float]
+    high:           list[float]
+    low:            list[float]
+    close:          list[float]
+    settle:         list[float]
+    contracts:      list[int]
+    open_interest:  list[int]
+    chg_in_oi:      list[int]
+    dte:            list[int]
+    spot:           list[float]
+    div_yield:      list[float]
+    rate:           list[float]
+    iv:             list[Optional[float]]
+    delta:          list[Optional[float]]
+    gamma:          list[Optional[float]]
+    vega:           list[Optional[float]]
+    theta:          list[Optional[float]]
+    rho:            list[Optional[float]]
+
+
+class ChainColumnarResponse(BaseModel):
+    symbol:             str
+    trade_date:         date
+    expiry_date:        date
+    row_count:          int
+    iv_computed_count:  int
+    iv_avg:             float | None = None
+    rows:               ChainColumns
+
+
+class ChainShockResponse(BaseModel):
+    symbol:          str
+    trade_date:      date
+    spot_shock_pct:  float
+    vol_shock_abs:   float
+    rate_shock_bps:  float
+    lot_size:        int
+    row_count:       int
+    repriced_count:  int
+    expiry_date:     list[date]
+    strike:          list[float]
+    option_type:     list[str]
+    dte:             list[int]
+    base_price:      list[Optional[float]]
+    shocked_price:   list[Optional[float]]
+    pnl_per_lot:     list[Optional[float]]
+    delta:           list[Optional[float]]
+    gamma:           list[Optional[float]]
+    vega:            list[Optional[float]]
+    theta:           list[Optional[float]]
+    rho:             list[Optional[float]]
+
+
+class StrikesResponse(BaseModel):
+    symbol:       str
+    trade_date:   date
+    expiry_date:  date
+    strikes:      list[float]
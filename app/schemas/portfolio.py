@@ -17,6 +17,9 @@ class ShockInput(BaseModel):
     spot_shock_pct:  float = Field(..., description="Percentage. -1.5 means spot drops 1.5%.")
     vol_shock_abs:   float = Field(..., description="Absolute vol points. +2.0 means IV rises 2 points.")
     rate_shock_bps:  float = Field(..., description="Basis points. +20 means rate rises 20bps.")
+    rate_shock_3m_bps: float = Field(default=0.0, description="Basis points added at the 3m tenor; interpolated per leg DTE.")
+    rate_shock_6m_bps: float = Field(default=0.0, description="Basis points added at the 6m tenor; interpolated per leg DTE.")
+    rate_shock_1y_bps: float = Field(default=0.0, description="Basis points added at the 1y tenor; interpolated per leg DTE.")
 
 
 class PortfolioRequest(BaseModel):
@@ -54,9 +57,54 @@ class PortfolioSummary(BaseModel):
     net_vega:           float
     net_theta:          float
     net_rho:            float
+    key_rate_rho:       dict[str, float] = Field(default_factory=dict, description="Net rho bucketed by tenor (per 1% bump of that tenor).")
 
 
 class PortfolioResponse(BaseModel):
     trade_date:  date
     positions:   list[PositionResult]
     summary:     PortfolioSummary
+
+
+class PositionColumns(BaseModel):
+    symbol:         list[str]
+    expiry_date:    list[date]
+    strike:         list[float]
+    option_type:    list[str]
+    quantity:       list[int]
+    lot_size:       list[int]
+    entry_date:     list[date]
+    entry_price:    list[float]
+    current_price:  list[Optional[float]]
+    mtm_pnl:        list[float]
+    scenario_pnl:   list[float]
+    total_pnl:      list[float]
+    method:         list[str]
+    delta:          list[Optional[float]]
+    gamma:          list[Optional[float]]
+    vega:           list[Optional[float]]
+    theta:          list[Optional[float]]
+    rho:            list[Optional[float]]
+    dte:            list[Optional[int]]
+
+
+class PortfolioColumnarResponse(BaseModel):
+    trade_date:  date
+    row_count:   int
+    positions:   PositionColumns
+    summary:     PortfolioSummary
+
+
+class ReplayPoint(BaseModel):
+    trade_date:    date
+    mtm_pnl:       float
+    realized_pnl:  float
+    total_pnl:     float
+    net_delta:     float
+    net_gamma:     float
+    net_vega:      float
+    net_theta:     float
+    net_rho:       float
+    open_legs:     int
+    expired_legs:  int
+    no_data_legs:  int
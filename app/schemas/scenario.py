@@ -13,6 +13,9 @@ class ScenarioRequest(BaseModel):
     spot_shock_pct: float = Field(..., description="Percentage. -1.5 means spot drops 1.5%.")
     vol_shock_abs:  float = Field(..., description="Absolute vol points. +2.0 means IV rises 2 points.")
     rate_shock_bps: float = Field(..., description="Basis points. +20 means rate rises 20bps.")
+    rate_shock_3m_bps: float = Field(default=0.0, description="Basis points added at the 3m tenor; interpolated at the contract DTE.")
+    rate_shock_6m_bps: float = Field(default=0.0, description="Basis points added at the 6m tenor; interpolated at the contract DTE.")
+    rate_shock_1y_bps: float = Field(default=0.0, description="Basis points added at the 1y tenor; interpolated at the contract DTE.")
 
 
 class ScenarioResponse(BaseModel):
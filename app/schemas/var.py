@@ -32,3 +32,14 @@ class VaRSummary(BaseModel):
 class VaRResponse(BaseModel):
     summary:          VaRSummary
     pnl_distribution: list[ScenarioPnLPoint]
+
+
+class ScenarioPnLColumns(BaseModel):
+    date:            list[str]
+    spot_return_pct: list[float]
+    portfolio_pnl:   list[float]
+
+
+class VaRColumnarResponse(BaseModel):
+    summary:          VaRSummary
+    pnl_distribution: ScenarioPnLColumns
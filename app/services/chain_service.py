@@ -1,8 +1,158 @@
+import logging
+
 import duckdb
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from dataclasses import dataclass
 from datetime import date
 
-from app.schemas.chain import ChainRow, ChainResponse
+from app.schemas.chain import (
+    ChainRow, ChainColumns, ChainResponse, ChainColumnarResponse, ChainShockResponse, StrikesResponse,
+)
+from app.services.market_snapshot import get_market_day
+from app.services.scenario_service import _query_lot_size
+from src.quant.scenario_engine import Shock, scenario_chain
+
+logger = logging.getLogger("app.chain_service")
+
+LAYOUTS = ("rows", "columnar")
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+CHAIN_FIELDS = tuple(ChainRow.model_fields)
+OPTION_TYPES = ("CE", "PE")
+
+
+@dataclass(frozen=True)
+class ChainFilter:
+    # pushed into the DuckDB query; the default selects the full chain
+    fields:      tuple[str, ...] | None = None
+    atm_window:  int | None   = None
+    moneyness:   float | None = None
+    option_type: str | None   = None
+    min_oi:      int | None   = None
+
+    def __post_init__(self):
+        if self.fields is not None:
+            unknown = [f for f in self.fields if f not in CHAIN_FIELDS]
+            if unknown or not self.fields:
+                raise ValueError(f"Invalid fields: {unknown or 'empty'}. Expected a subset of {CHAIN_FIELDS}.")
+            # canonical order, so equivalent requests share a cache entry
+            object.__setattr__(self, "fields", tuple(f for f in CHAIN_FIELDS if f in self.fields))
+        if self.option_type is not None and self.option_type not in OPTION_TYPES:
+            raise ValueError(f"Invalid option_type: '{self.option_type}'. Expected one of {OPTION_TYPES}.")
+        if self.atm_window is not None and self.atm_window < 0:
+            raise ValueError(f"atm_window must be >= 0. Got: {self.atm_window}")
+        if self.moneyness is not None and self.moneyness <= 0:
+            raise ValueError(f"moneyness must be > 0. Got: {self.moneyness}")
+        if self.min_oi is not None and self.min_oi < 0:
+            raise ValueError(f"min_oi must be >= 0. Got: {self.min_oi}")
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        # iv is always read: the response summary is computed from it
+        if self.fields is None:
+            return CHAIN_FIELDS
+        return tuple(f for f in CHAIN_FIELDS if f in self.fields or f == "iv")
+
+    def query(self, symbol: str, trade_date: date, expiry_date: date) -> tuple[str, list]:
+        select = ",\n        ".join(self.columns)
+        # symbol / year / month prune whole hive partitions before any file is opened
+        params     = [symbol, trade_date.year, trade_date.month, trade_date, expiry_date]
+        conditions = [
+            "symbol = ?",
+            "year = ?",
+            "month = ?",
+            "trade_date = ?",
+            "expiry_date = ?",
+        ]
+        source = "v_curated_option_chain"
+        prefix = ""
+
+        if self.atm_window is not None:
+            # rank the whole strike ladder first, so the window is N listed strikes
+            # either side of ATM regardless of the type / OI filters below. a day
+            # without spot has no ATM, and the window is empty rather than centred
+            # on the lowest strike
+            ladder = " AND ".join(conditions)
+            prefix = f"""
+    WITH ladder AS (
+        SELECT *, DENSE_RANK() OVER (ORDER BY strike) AS strike_rank
+        FROM v_curated_option_chain
+        WHERE {ladder}
+    ),
+    atm AS (
+        SELECT strike_rank FROM ladder WHERE spot IS NOT NULL ORDER BY ABS(strike - spot), strike LIMIT 1
+    )"""
+            source     = "ladder"
+            conditions = ["ABS(strike_rank - (SELECT strike_rank FROM atm)) <= ?"]
+            params.append(self.atm_window)
+
+        if self.moneyness is not None:
+            conditions.append("ABS(strike / spot - 1) <= ?")
+            params.append(self.moneyness)
+        if self.option_type is not None:
+            conditions.append("option_type = ?")
+            params.append(self.option_type)
+        if self.min_oi is not None:
+            conditions.append("open_interest >= ?")
+            params.append(self.min_oi)
+
+        where = "\n      AND ".join(conditions)
+        sql = f"""{prefix}
+    SELECT
+        {select}
+    FROM {source}
+    WHERE {where}
+    ORDER BY strike ASC, option_type ASC
+"""
+        return sql, params
+
+
+def _warn_if_no_spot(db, chain_filter: ChainFilter, symbol: str, trade_date: date, expiry_date: date, row_count: int):
+    # an empty ATM window is either an unlisted expiry or a day without spot; only
+    # the second is worth a warning, and only empty results pay for the check
+    if chain_filter.atm_window is None or row_count:
+        return
+    listed, with_spot = db.execute("""
+        SELECT COUNT(*), COUNT(spot)
+        FROM v_curated_option_chain
+        WHERE symbol = ? AND year = ? AND month = ? AND trade_date = ? AND expiry_date = ?
+    """, [symbol, trade_date.year, trade_date.month, trade_date, expiry_date]).fetchone()
+    if listed and not with_spot:
+        logger.warning(
+            "%s %s expiry %s has no spot; atm_window=%d returns no strikes.",
+            symbol, trade_date, expiry_date, chain_filter.atm_window,
+        )
+
+
+def _to_columns(df: pd.DataFrame, fields: tuple[str, ...] = CHAIN_FIELDS) -> dict[str, list]:
+    columns = {}
+    for name in fields:
+        column = df[name]
+        if column.dtype.kind == "f":
+            columns[name] = [None if np.isnan(v) else v for v in column.tolist()]
+        elif column.dtype.kind == "M":
+            columns[name] = column.dt.date.tolist()
+        else:
+            columns[name] = column.tolist()
+    return columns
+
+
+def _projected(symbol, trade_date, expiry_date, df, iv_computed, iv_avg, fields, layout) -> dict:
+    # a field subset doesn't fit ChainRow / ChainColumns, so it is returned as plain JSON
+    columns = _to_columns(df, fields)
+    rows    = columns if layout == "columnar" else [dict(zip(columns, v)) for v in zip(*columns.values())]
+    return {
+        "symbol":            symbol,
+        "trade_date":        trade_date,
+        "expiry_date":       expiry_date,
+        "row_count":         len(df),
+        "iv_computed_count": iv_computed,
+        "iv_avg":            iv_avg,
+        "rows":              rows,
+    }
 
 
 def get_option_chain(
@@ -10,41 +160,37 @@ def get_option_chain(
     trade_date: date,
     expiry_date: date,
     db: duckdb.DuckDBPyConnection,
-) -> ChainResponse:
-    query = """
-        SELECT
-            CAST(trade_date AS DATE)    AS trade_date,
-            symbol,
-            CAST(expiry_date AS DATE)   AS expiry_date,
-            strike,
-            option_type,
-            open, high, low, close, settle,
-            contracts, open_interest, chg_in_oi, dte,
-            spot, div_yield, rate,
-            iv, delta, gamma, vega, theta, rho
-        FROM v_curated_option_chain
-        WHERE symbol      = ?
-          AND CAST(trade_date AS DATE)   = ?
-          AND CAST(expiry_date AS DATE)  = ?
-        ORDER BY strike ASC, option_type ASC
-    """
-    df: pd.DataFrame = db.execute(query, [symbol, trade_date, expiry_date]).df()
+    layout: str = "rows",
+    chain_filter: ChainFilter = ChainFilter(),
+) -> ChainResponse | ChainColumnarResponse | dict:
+    if layout not in LAYOUTS:
+        raise ValueError(f"Invalid layout: '{layout}'. Expected one of {LAYOUTS}.")
+
+    sql, params = chain_filter.query(symbol, trade_date, expiry_date)
+    df: pd.DataFrame = db.execute(sql, params).df()
+    _warn_if_no_spot(db, chain_filter, symbol, trade_date, expiry_date, len(df))
 
     if df.empty:
-        return ChainResponse(
+        iv_computed, iv_avg = 0, 0
+    else:
+        iv_computed = int(df["iv"].notna().sum())
+        iv_values = df[df["iv"].notna()]["iv"].values
+        iv_avg = float(iv_values.mean()) if len(iv_values) > 0 else None
+
+    if chain_filter.fields is not None:
+        return _projected(symbol, trade_date, expiry_date, df, iv_computed, iv_avg, chain_filter.fields, layout)
+
+    if layout == "columnar":
+        return ChainColumnarResponse(
             symbol=symbol,
             trade_date=trade_date,
             expiry_date=expiry_date,
-            row_count=0,
-            iv_computed_count=0,
-            iv_avg=0,
-            rows=[],
+            row_count=len(df),
+            iv_computed_count=iv_computed,
+            iv_avg=iv_avg,
+            rows=ChainColumns(**_to_columns(df)),
         )
 
-    iv_computed = int(df["iv"].notna().sum())
-    iv_values = df[df["iv"].notna()]["iv"].values
-    iv_avg = float(iv_values.mean()) if len(iv_values) > 0 else None
-
     rows = [ChainRow(**row) for row in df.to_dict(orient="records")]
 
     return ChainResponse(
@@ -56,3 +202,118 @@ def get_option_chain(
         iv_avg=iv_avg,
         rows=rows,
     )
+
+
+def get_option_chain_arrow(
+    symbol: str,
+    trade_date: date,
+    expiry_date: date,
+    db: duckdb.DuckDBPyConnection,
+    chain_filter: ChainFilter = ChainFilter(),
+) -> bytes:
+    # Arrow IPC stream straight from DuckDB's record batches; the chain summary
+    # travels as schema metadata. NaN IV/Greeks are sent as nulls, as in JSON
+    sql, params = chain_filter.query(symbol, trade_date, expiry_date)
+    result = db.execute(sql, params)
+    reader = result.to_arrow_reader() if hasattr(result, "to_arrow_reader") else result.fetch_record_batch()
+    table  = reader.read_all()
+    _warn_if_no_spot(db, chain_filter, symbol, trade_date, expiry_date, table.num_rows)
+
+    for name in ("iv", "delta", "gamma", "vega", "theta", "rho"):
+        i = table.schema.get_field_index(name)
+        if i < 0:
+            continue
+        column = table.column(i)
+        table  = table.set_column(i, name, pc.if_else(pc.is_nan(column), None, column))
+
+    iv_computed = table.num_rows - table.column("iv").null_count
+    iv_avg      = pc.mean(table.column("iv")).as_py() if iv_computed else None
+    if table.num_rows == 0:
+        iv_avg = 0
+
+    if chain_filter.fields is not None:
+        table = table.select(list(chain_filter.fields))
+    table = table.replace_schema_metadata({
+        "symbol":            symbol,
+        "trade_date":        str(trade_date),
+        "expiry_date":       str(expiry_date),
+        "row_count":         str(table.num_rows),
+        "iv_computed_count": str(iv_computed),
+        "iv_avg":            "" if iv_avg is None else repr(float(iv_avg)),
+    })
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def get_strikes(
+    symbol: str,
+    trade_date: date,
+    expiry_date: date,
+    db: duckdb.DuckDBPyConnection,
+) -> StrikesResponse:
+    # answered from the per-day snapshot's contract index: a key-range scan, no chain rows
+    market = get_market_day(db, trade_date)
+    return StrikesResponse(
+        symbol=symbol,
+        trade_date=trade_date,
+        expiry_date=expiry_date,
+        strikes=market.strikes(symbol, expiry_date).tolist(),
+    )
+
+
+def _nullable(values: np.ndarray) -> list:
+    return [None if np.isnan(v) else float(v) for v in values]
+
+
+def get_chain_shock(
+    symbol: str,
+    trade_date: date,
+    shock: Shock,
+    db: duckdb.DuckDBPyConnection,
+) -> ChainShockResponse:
+    query = """
+        SELECT
+            expiry_date,
+            strike,
+            option_type,
+            dte,
+            spot, div_yield, rate, iv
+        FROM v_curated_option_chain
+        WHERE symbol = ?
+          AND year = ? AND month = ?
+          AND trade_date = ?
+        ORDER BY expiry_date ASC, strike ASC, option_type ASC
+    """
+    df: pd.DataFrame = db.execute(query, [symbol, trade_date.year, trade_date.month, trade_date]).df()
+    lot_size = _query_lot_size(db, symbol, trade_date)
+
+    shocked = scenario_chain(df, shock) if not df.empty else {
+        col: np.array([]) for col in
+        ["base_price", "shocked_price", "pnl", "delta", "gamma", "vega", "theta", "rho"]
+    }
+
+    return ChainShockResponse(
+        symbol=symbol,
+        trade_date=trade_date,
+        spot_shock_pct=shock.spot_shock_pct,
+        vol_shock_abs=shock.vol_shock_abs,
+        rate_shock_bps=shock.rate_shock_bps,
+        lot_size=lot_size,
+        row_count=len(df),
+        repriced_count=int((~np.isnan(shocked["pnl"])).sum()),
+        expiry_date=pd.to_datetime(df["expiry_date"]).dt.date.tolist(),
+        strike=df["strike"].astype(float).tolist(),
+        option_type=df["option_type"].tolist(),
+        dte=df["dte"].astype(int).tolist(),
+        base_price=_nullable(shocked["base_price"]),
+        shocked_price=_nullable(shocked["shocked_price"]),
+        pnl_per_lot=_nullable(shocked["pnl"] * lot_size),
+        delta=_nullable(shocked["delta"]),
+        gamma=_nullable(shocked["gamma"]),
+        vega=_nullable(shocked["vega"]),
+        theta=_nullable(shocked["theta"]),
+        rho=_nullable(shocked["rho"]),
+    )
@@ -0,0 +1,77 @@
+import logging
+import threading
+import time
+
+from app.dependencies import RELOAD_INTERVAL_S, published_version, reload_generation
+from app.services.market_snapshot import snapshot_cache
+
+logger = logging.getLogger("app.data_watcher")
+
+
+class DataWatcher:
+    # polls for a newly published manifest or snapshot and hot-swaps the database,
+    # so the 13:30 run shows up without a restart. the new generation is opened on
+    # this thread; requests keep using the old one until the swap
+
+    def __init__(self, interval_s: float):
+        self.interval_s   = interval_s
+        self.reloads      = 0
+        self.failures     = 0
+        self.last_reload_s: float | None = None
+        self.last_error:    str | None   = None
+        self._seen:         str | None   = None
+        self._stop   = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        if self.interval_s <= 0 or self._thread is not None:
+            return
+        # taken before the first open, so anything published after it is reloaded
+        self._seen = published_version()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="qrl-data-watcher", daemon=True)
+        self._thread.start()
+        logger.info("Watching for published data every %.0fs.", self.interval_s)
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def check(self) -> bool:
+        published = published_version()
+        if published == self._seen:
+            return False
+        start = time.perf_counter()
+        generation = reload_generation()
+        # days are keyed by data version, so this only frees the old generation's
+        snapshot_cache.retain(generation.version)
+        self._seen         = published
+        self.reloads      += 1
+        self.last_reload_s = round(time.perf_counter() - start, 3)
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            try:
+                self.check()
+            except Exception as e:
+                # keep serving the active generation; the next check retries
+                self.failures  += 1
+                self.last_error = repr(e)
+                logger.exception("Reload failed; still serving the previous data.")
+
+    def stats(self) -> dict:
+        return {
+            "interval_s":    self.interval_s,
+            "running":       self._thread is not None,
+            "reloads":       self.reloads,
+            "failures":      self.failures,
+            "last_reload_s": self.last_reload_s,
+            "last_error":    self.last_error,
+        }
+
+
+data_watcher = DataWatcher(RELOAD_INTERVAL_S)
@@ -0,0 +1,238 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+from src.db.generation import data_version_of
+from src.quant.contract_index import ContractIndex
+from src.quant.lot_size_index import LotSizeIndex
+
+logger = logging.getLogger("app.market_snapshot")
+
+SNAPSHOT_CACHE_MB = float(os.environ.get("QRL_SNAPSHOT_CACHE_MB", "256"))
+# int64 key + int64 row offset + hash table slot + sorted key copy
+INDEX_ENTRY_BYTES = 40
+
+OPTIONS_QUERY = """
+    SELECT
+        trade_date,
+        symbol,
+        expiry_date,
+        strike,
+        option_type,
+        dte,
+        spot,
+        div_yield,
+        rate,
+        iv,
+        delta, gamma, vega, theta, rho
+    FROM v_curated_option_chain
+    WHERE year = ? AND month = ?
+      AND trade_date = ?
+"""
+
+FUTURES_QUERY = """
+    SELECT
+        trade_date,
+        symbol,
+        expiry_date,
+        dte,
+        spot,
+        div_yield,
+        rate,
+        settle
+    FROM v_curated_futures
+    WHERE trade_date = ?
+"""
+
+LOT_SIZE_QUERY = """
+    SELECT
+        symbol,
+        start_date,
+        end_date,
+        lot_size
+    FROM v_processed_lot_size
+"""
+
+
+@dataclass
+class MarketDay:
+    trade_date:    date
+    options:       pd.DataFrame
+    futures:       pd.DataFrame
+    option_index:  ContractIndex = field(repr=False)
+    futures_index: ContractIndex = field(repr=False)
+    nbytes:        int  = 0
+
+    @property
+    def empty(self) -> bool:
+        return self.options.empty and self.futures.empty
+
+    def option_row(self, symbol: str, expiry_date: date, strike: float, option_type: str) -> pd.Series | None:
+        i = self.option_index.get(symbol, expiry_date, strike, option_type)
+        return None if i is None else self.options.iloc[i]
+
+    def strikes(self, symbol: str, expiry_date: date) -> np.ndarray:
+        return np.union1d(
+            self.option_index.strikes(symbol, expiry_date, "CE"),
+            self.option_index.strikes(symbol, expiry_date, "PE"),
+        )
+
+    def futures_row(self, symbol: str, expiry_date: date) -> pd.Series | None:
+        i = self.futures_index.get(symbol, expiry_date, 0.0, "XX")
+        return None if i is None else self.futures.iloc[i]
+
+
+def _to_dates(df: pd.DataFrame, *cols: str) -> pd.DataFrame:
+    for col in cols:
+        df[col] = pd.to_datetime(df[col], errors="coerce").dt.date
+    return df
+
+
+def _load_day(db: duckdb.DuckDBPyConnection, trade_date: date) -> MarketDay:
+    options = _to_dates(db.execute(OPTIONS_QUERY, [trade_date.year, trade_date.month, trade_date]).df(), "trade_date", "expiry_date")
+    futures = _to_dates(db.execute(FUTURES_QUERY, [trade_date]).df(), "trade_date", "expiry_date")
+
+    option_index  = ContractIndex.from_frame(options)
+    futures_index = ContractIndex.from_frame(futures)
+
+    nbytes = (
+        int(options.memory_usage(deep=True).sum())
+        + int(futures.memory_usage(deep=True).sum())
+        + (len(option_index) + len(futures_index)) * INDEX_ENTRY_BYTES
+    )
+    return MarketDay(
+        trade_date=trade_date,
+        options=options,
+        futures=futures,
+        option_index=option_index,
+        futures_index=futures_index,
+        nbytes=nbytes,
+    )
+
+
+class MarketSnapshotCache:
+    # entries are keyed by (data version, trade date): during a hot reload requests on
+    # the old and new generation run side by side and must not read each other's days.
+    # retain() then drops every other version seen so far; days loaded later on a
+    # retired generation are served but not stored
+
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self._days: OrderedDict[tuple[str | None, date], MarketDay] = OrderedDict()
+        self._lot_sizes: dict[str | None, tuple[pd.DataFrame, LotSizeIndex]] = {}
+        self._seen:    set[str | None] = set()
+        self._retired: set[str | None] = set()
+        self._lock   = threading.Lock()
+        self.nbytes  = 0
+        self.hits    = 0
+        self.misses  = 0
+        self.evictions = 0
+
+    def _storable(self, version: str | None) -> bool:
+        # caller holds the lock
+        self._seen.add(version)
+        return version not in self._retired
+
+    def get(self, db: duckdb.DuckDBPyConnection, trade_date: date) -> MarketDay:
+        key = (data_version_of(db), trade_date)
+        with self._lock:
+            day = self._days.get(key)
+            if day is not None:
+                self._days.move_to_end(key)
+                self.hits += 1
+                return day
+            self.misses += 1
+
+        day = _load_day(db, trade_date)
+        # an empty day may just mean the pipeline hasn't run yet; don't pin it
+        if not day.empty:
+            self._put(key, day)
+        return day
+
+    def _put(self, key: tuple[str | None, date], day: MarketDay):
+        if day.nbytes > self.budget_bytes:
+            logger.warning(
+                "Snapshot for %s is %.1f MB, over the %.1f MB budget; serving uncached.",
+                day.trade_date, day.nbytes / 1e6, self.budget_bytes / 1e6,
+            )
+            return
+        with self._lock:
+            if not self._storable(key[0]):
+                return
+            old = self._days.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+            self._days[key] = day
+            self.nbytes += day.nbytes
+            while self.nbytes > self.budget_bytes:
+                (_, evicted_date), evicted = self._days.popitem(last=False)
+                self.nbytes    -= evicted.nbytes
+                self.evictions += 1
+                logger.info("Evicted snapshot %s (%.1f MB)", evicted_date, evicted.nbytes / 1e6)
+
+    def lot_sizes(self, db: duckdb.DuckDBPyConnection) -> pd.DataFrame:
+        return self._load_lot_sizes(db)[0]
+
+    def lot_size_index(self, db: duckdb.DuckDBPyConnection) -> LotSizeIndex:
+        return self._load_lot_sizes(db)[1]
+
+    def _load_lot_sizes(self, db: duckdb.DuckDBPyConnection) -> tuple[pd.DataFrame, LotSizeIndex]:
+        version = data_version_of(db)
+        with self._lock:
+            cached = self._lot_sizes.get(version)
+            if cached is not None:
+                return cached
+        df    = _to_dates(db.execute(LOT_SIZE_QUERY).df(), "start_date", "end_date")
+        index = LotSizeIndex.from_frame(df)
+        with self._lock:
+            if self._storable(version):
+                self._lot_sizes[version] = (df, index)
+        return df, index
+
+    def retain(self, version: str):
+        # after a reload: keep only the new generation's entries
+        with self._lock:
+            self._retired = (self._retired | self._seen) - {version}
+            for key in [k for k in self._days if k[0] != version]:
+                self.nbytes -= self._days.pop(key).nbytes
+            self._lot_sizes = {v: c for v, c in self._lot_sizes.items() if v == version}
+
+    def clear(self):
+        with self._lock:
+            self._days.clear()
+            self._lot_sizes.clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "days":      len(self._days),
+                "versions":  len({k[0] for k in self._days}),
+                "mb":        round(self.nbytes / 1e6, 2),
+                "budget_mb": round(self.budget_bytes / 1e6, 2),
+                "hits":      self.hits,
+                "misses":    self.misses,
+                "evictions": self.evictions,
+            }
+
+
+snapshot_cache = MarketSnapshotCache(int(SNAPSHOT_CACHE_MB * 1e6))
+
+
+def get_market_day(db: duckdb.DuckDBPyConnection, trade_date: date) -> MarketDay:
+    return snapshot_cache.get(db, trade_date)
+
+
+def get_lot_sizes(db: duckdb.DuckDBPyConnection) -> pd.DataFrame:
+    return snapshot_cache.lot_sizes(db)
+
+
+def get_lot_size_index(db: duckdb.DuckDBPyConnection) -> LotSizeIndex:
+    return snapshot_cache.lot_size_index(db)
@@ -2,68 +2,88 @@ import io
 import pandas as pd
 import duckdb
 from datetime import date
-from app.schemas.portfolio import (PortfolioResponse, PositionResult, PortfolioSummary)
+from typing import Iterator
+from app.schemas.portfolio import (PortfolioResponse, PortfolioColumnarResponse, PositionColumns, PositionResult, PortfolioSummary, ReplayPoint)
 from src.quant.scenario_engine import Shock
-from src.quant.portfolio import run_portfolio
+from src.quant.portfolio import run_portfolio, _validate_csv
+from src.quant.replay import run_replay
+from app.services.market_snapshot import get_market_day, get_lot_sizes, get_lot_size_index
 
-def _query_curated_options(db: duckdb.DuckDBPyConnection, trade_date: date) -> pd.DataFrame:
-    query = """
+def _placeholders(values: list) -> str:
+    return ", ".join(["?"] * len(values))
+
+
+def _query_replay_options(
+    db: duckdb.DuckDBPyConnection,
+    legs: pd.DataFrame,
+    start_date: date,
+    end_date: date,
+) -> pd.DataFrame:
+    symbols  = sorted(legs["symbol"].unique().tolist())
+    expiries = sorted(legs["expiry_date"].unique().tolist())
+    strikes  = sorted(legs["strike"].unique().tolist())
+    query = f"""
         SELECT
-            CAST(trade_date AS DATE)  AS trade_date,
+            trade_date,
             symbol,
-            CAST(expiry_date AS DATE) AS expiry_date,
+            expiry_date,
             strike,
             option_type,
             dte,
             spot,
             div_yield,
             rate,
+            settle,
             iv,
             delta, gamma, vega, theta, rho
         FROM v_curated_option_chain
-        WHERE CAST(trade_date AS DATE) = ?
+        WHERE (
+                trade_date BETWEEN ? AND ?
+             OR trade_date IN ({_placeholders(expiries)})
+          )
+          AND symbol IN ({_placeholders(symbols)})
+          AND expiry_date IN ({_placeholders(expiries)})
+          AND strike IN ({_placeholders(strikes)})
     """
-    df = db.execute(query, [trade_date]).df()
+    params = [start_date, end_date, *expiries, *symbols, *expiries, *strikes]
+    df = db.execute(query, params).df()
     df["trade_date"]  = pd.to_datetime(df["trade_date"]).dt.date
     df["expiry_date"] = pd.to_datetime(df["expiry_date"]).dt.date
     return df
 
 
-def _query_curated_futures(db: duckdb.DuckDBPyConnection, trade_date: date) -> pd.DataFrame:
-    query = """
+def _query_replay_futures(
+    db: duckdb.DuckDBPyConnection,
+    legs: pd.DataFrame,
+    start_date: date,
+    end_date: date,
+) -> pd.DataFrame:
+    symbols  = sorted(legs["symbol"].unique().tolist())
+    expiries = sorted(legs["expiry_date"].unique().tolist())
+    query = f"""
         SELECT
-            CAST(trade_date AS DATE)  AS trade_date,
+            trade_date,
             symbol,
-            CAST(expiry_date AS DATE) AS expiry_date,
+            expiry_date,
             dte,
             spot,
             div_yield,
             rate,
             settle
         FROM v_curated_futures
-        WHERE CAST(trade_date AS DATE) = ?
+        WHERE (
+                trade_date BETWEEN ? AND ?
+             OR trade_date IN ({_placeholders(expiries)})
+          )
+          AND symbol IN ({_placeholders(symbols)})
     """
-    df = db.execute(query, [trade_date]).df()
+    params = [start_date, end_date, *expiries, *symbols]
+    df = db.execute(query, params).df()
     df["trade_date"]  = pd.to_datetime(df["trade_date"]).dt.date
     df["expiry_date"] = pd.to_datetime(df["expiry_date"]).dt.date
     return df
 
 
-def _query_lot_size(db: duckdb.DuckDBPyConnection) -> pd.DataFrame:
-    query = """
-        SELECT
-            symbol,
-            CAST(start_date AS DATE) AS start_date,
-            CAST(end_date   AS DATE) AS end_date,
-            lot_size
-        FROM v_processed_lot_size
-    """
-    df = db.execute(query).df()
-    df["start_date"] = pd.to_datetime(df["start_date"]).dt.date
-    df["end_date"]   = pd.to_datetime(df["end_date"]).dt.date
-    return df
-
-
 def _parse_csv(file_bytes: bytes) -> pd.DataFrame:
     try:
         df = pd.read_csv(io.BytesIO(file_bytes))
@@ -72,32 +92,11 @@ def _parse_csv(file_bytes: bytes) -> pd.DataFrame:
     return df
 
 
-def _to_response(result) -> PortfolioResponse:
-    positions = [
-        PositionResult(
-            symbol=p.symbol,
-            expiry_date=p.expiry_date,
-            strike=p.strike,
-            option_type=p.option_type,
-            quantity=p.quantity,
-            lot_size=p.lot_size,
-            entry_date=p.entry_date,
-            entry_price=p.entry_price,
-            current_price=p.current_price,
-            mtm_pnl=p.mtm_pnl,
-            scenario_pnl=p.scenario_pnl,
-            total_pnl=p.total_pnl,
-            method=p.method,
-            delta=p.delta,
-            gamma=p.gamma,
-            vega=p.vega,
-            theta=p.theta,
-            rho=p.rho,
-        )
-        for p in result.positions
-    ]
+LAYOUTS = ("rows", "columnar")
+
 
-    summary = PortfolioSummary(
+def _to_summary(result) -> PortfolioSummary:
+    return PortfolioSummary(
         total_mtm_pnl=result.summary.total_mtm_pnl,
         total_scenario_pnl=result.summary.total_scenario_pnl,
         total_pnl=result.summary.total_pnl,
@@ -106,12 +105,25 @@ def _to_response(result) -> PortfolioResponse:
         net_vega=result.summary.net_vega,
         net_theta=result.summary.net_theta,
         net_rho=result.summary.net_rho,
+        key_rate_rho=result.summary.key_rate_rho,
     )
 
+
+def _to_response(result) -> PortfolioResponse:
+    positions = [PositionResult(**record) for record in result.positions.to_records()]
     return PortfolioResponse(
         trade_date=result.trade_date,
         positions=positions,
-        summary=summary,
+        summary=_to_summary(result),
+    )
+
+
+def _to_columnar_response(result) -> PortfolioColumnarResponse:
+    return PortfolioColumnarResponse(
+        trade_date=result.trade_date,
+        row_count=len(result.positions),
+        positions=PositionColumns(**result.positions.to_columns()),
+        summary=_to_summary(result),
     )
 
 
@@ -120,25 +132,71 @@ def analyze_portfolio(
     trade_date: date,
     shock: Shock,
     db: duckdb.DuckDBPyConnection,
-) -> PortfolioResponse:
-    positions_df     = _parse_csv(file_bytes)
-    curated_options  = _query_curated_options(db, trade_date)
-    curated_futures  = _query_curated_futures(db, trade_date)
-    lot_size_df      = _query_lot_size(db)
+    layout: str = "rows",
+) -> PortfolioResponse | PortfolioColumnarResponse:
+    if layout not in LAYOUTS:
+        raise ValueError(f"Invalid layout: '{layout}'. Expected one of {LAYOUTS}.")
 
-    if curated_options.empty and curated_futures.empty:
+    positions_df = _parse_csv(file_bytes)
+    market       = get_market_day(db, trade_date)
+
+    if market.empty:
         raise ValueError(
             f"No curated data found for trade_date={trade_date}. "
             f"Check that the pipeline has run for this date."
         )
 
     result = run_portfolio(
+        positions_df=positions_df,
+        curated_options=market.options,
+        curated_futures=market.futures,
+        lot_size_df=get_lot_sizes(db),
+        option_index=market.option_index,
+        futures_index=market.futures_index,
+        lot_size_index=get_lot_size_index(db),
+        shock=shock,
+        trade_date=str(trade_date),
+    )
+
+    return _to_columnar_response(result) if layout == "columnar" else _to_response(result)
+
+
+def replay_portfolio(
+    file_bytes: bytes,
+    start_date: date,
+    end_date: date,
+    db: duckdb.DuckDBPyConnection,
+) -> Iterator[str]:
+    positions_df = _validate_csv(_parse_csv(file_bytes))
+    is_fut       = positions_df["option_type"] == "XX"
+    lot_size_df  = get_lot_sizes(db)
+
+    curated_options = (
+        _query_replay_options(db, positions_df[~is_fut], start_date, end_date)
+        if (~is_fut).any() else pd.DataFrame()
+    )
+    curated_futures = (
+        _query_replay_futures(db, positions_df[is_fut], start_date, end_date)
+        if is_fut.any() else pd.DataFrame()
+    )
+
+    if curated_options.empty and curated_futures.empty:
+        raise ValueError(
+            f"No curated data found for the book between {start_date} and {end_date}. "
+            f"Check that the pipeline has run for this range."
+        )
+
+    series = run_replay(
         positions_df=positions_df,
         curated_options=curated_options,
         curated_futures=curated_futures,
         lot_size_df=lot_size_df,
-        shock=shock,
-        trade_date=str(trade_date),
+        start_date=str(start_date),
+        end_date=str(end_date),
     )
 
-    return _to_response(result)
+    def _lines() -> Iterator[str]:
+        for row in series.to_dict(orient="records"):
+            yield ReplayPoint(**row).model_dump_json() + "\n"
+
+    return _lines()
@@ -0,0 +1,254 @@
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.dependencies import request_generation
+from app.services.single_flight import single_flight
+
+logger = logging.getLogger("app.response_cache")
+
+RESPONSE_CACHE_MB  = float(os.environ.get("QRL_RESPONSE_CACHE_MB", "64"))
+RESPONSE_CACHE_DIR = os.environ.get("QRL_RESPONSE_CACHE_DIR")
+# request-scoped arguments that are not part of the response identity
+SKIP_PARAMS = {"db", "conn"}
+JSON = "application/json"
+
+
+def _render(result) -> tuple[str, bytes]:
+    # same bytes FastAPI would send: pydantic JSON for models (NaN -> null),
+    # JSONResponse otherwise; a Response (e.g. Arrow) is stored as-is
+    if isinstance(result, Response):
+        return result.media_type, result.body
+    if isinstance(result, BaseModel):
+        return JSON, result.model_dump_json().encode()
+    return JSON, JSONResponse(jsonable_encoder(result)).body
+
+
+def _etag(key: tuple) -> str:
+    # strong: the rendered body is a pure function of endpoint, params and data version
+    return '"' + hashlib.sha1(repr(key).encode()).hexdigest()[:20] + '"'
+
+
+def _not_modified(request: Request, etag: str, last_modified: float) -> bool:
+    # If-None-Match wins over If-Modified-Since when both are sent (RFC 9110 13.2.2)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified) <= since
+    return False
+
+
+class ResponseCache:
+    # rendered (media_type, body) pairs keyed by (endpoint, params, data_version). memory tier
+    # is a byte-bounded LRU; the optional disk tier keeps one directory per
+    # data version and drops the others once a new version is seen
+
+    def __init__(self, budget_bytes: int, disk_dir: Path | None = None):
+        self.budget_bytes = budget_bytes
+        self.disk_dir     = Path(disk_dir) if disk_dir else None
+        self._entries: OrderedDict[tuple, tuple[str, bytes]] = OrderedDict()
+        self._version: str | None = None
+        self._generation: int | None = None
+        self._lock     = threading.Lock()
+        self.nbytes    = 0
+        self.hits      = 0
+        self.disk_hits = 0
+        self.misses    = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.not_modified  = 0
+
+    def _check_version(self, version: str, generation: int | None = None) -> bool:
+        # caller holds the lock. the version only moves forward: during a reload's
+        # drain, requests on the retired generation still arrive with its version, and
+        # stepping back to it would drop the new version's entries and directory.
+        # False for those; they neither read nor store. generation None (scripts,
+        # tests) always moves forward
+        if version != self._version:
+            if generation is not None and self._generation is not None and generation < self._generation:
+                return False
+            if self._version is not None:
+                self.invalidations += 1
+                logger.info("Data version %s -> %s; dropping %d cached responses", self._version, version, len(self._entries))
+            self._entries.clear()
+            self.nbytes   = 0
+            self._version = version
+            if self.disk_dir is not None and self.disk_dir.exists():
+                for stale in self.disk_dir.iterdir():
+                    if stale.is_dir() and stale.name != version:
+                        shutil.rmtree(stale, ignore_errors=True)
+        if generation is not None:
+            self._generation = max(generation, self._generation or 0)
+        return True
+
+    def _disk_path(self, key: tuple) -> Path:
+        name = hashlib.sha1(repr(key[:2]).encode()).hexdigest()
+        return self.disk_dir / key[2] / f"{name}.bin"
+
+    def get(self, key: tuple, generation: int | None = None) -> tuple[str, bytes] | None:
+        with self._lock:
+            if not self._check_version(key[2], generation):
+                self.misses += 1
+                return None
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        if self.disk_dir is not None:
+            path = self._disk_path(key)
+            try:
+                raw = path.read_bytes()
+            except FileNotFoundError:
+                raw = None
+            if raw is not None:
+                # first line is the media type, the rest the body
+                media_type, body = raw.split(b"\n", 1)
+                entry = (media_type.decode(), body)
+                with self._lock:
+                    self.disk_hits += 1
+                self._put_memory(key, entry)
+                return entry
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: tuple, entry: tuple[str, bytes]):
+        with self._lock:
+            # computed under a version the cache has since moved past; writing it
+            # would recreate a directory _check_version just pruned
+            if key[2] != self._version:
+                return
+        self._put_memory(key, entry)
+        if self.disk_dir is not None:
+            path = self._disk_path(key)
+            tmp  = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp.write_bytes(entry[0].encode() + b"\n" + entry[1])
+                os.replace(tmp, path)
+            except FileNotFoundError:
+                # the version moved on and pruned the directory under us; the memory
+                # tier already dropped the entry too
+                pass
+
+    def _put_memory(self, key: tuple, entry: tuple[str, bytes]):
+        if len(entry[1]) > self.budget_bytes:
+            return
+        with self._lock:
+            if key[2] != self._version:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= len(old[1])
+            self._entries[key] = entry
+            self.nbytes += len(entry[1])
+            while self.nbytes > self.budget_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes    -= len(evicted[1])
+                self.evictions += 1
+
+    def record_not_modified(self):
+        with self._lock:
+            self.not_modified += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "data_version":  self._version,
+                "generation":    self._generation,
+                "entries":       len(self._entries),
+                "mb":            round(self.nbytes / 1e6, 2),
+                "budget_mb":     round(self.budget_bytes / 1e6, 2),
+                "disk_dir":      str(self.disk_dir) if self.disk_dir else None,
+                "hits":          self.hits,
+                "disk_hits":     self.disk_hits,
+                "misses":        self.misses,
+                "evictions":     self.evictions,
+                "invalidations": self.invalidations,
+                "not_modified":  self.not_modified,
+            }
+
+
+response_cache = ResponseCache(int(RESPONSE_CACHE_MB * 1e6), RESPONSE_CACHE_DIR)
+
+
+def _compute(key: tuple, fn, kwargs: dict) -> tuple[str, bytes]:
+    entry = _render(fn(**kwargs))
+    response_cache.put(key, entry)
+    return entry
+
+
+def cached_response(endpoint: str):
+    # for GET routes over immutable history. only successful results are cached;
+    # HTTPExceptions propagate untouched. responses carry a strong ETag and
+    # Last-Modified, and a matching conditional request gets a bodiless 304;
+    # when the response is cached, without DuckDB being touched
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        if "request" in signature.parameters:
+            raise TypeError(f"{fn.__name__}: cached_response reserves the 'request' parameter")
+
+        @functools.wraps(fn)
+        def wrapper(request: Request, **kwargs):
+            # the version of the data this request's cursor reads, which only moves on
+            # a reload; mid-run Parquet writes stay invisible until the pipeline publishes
+            generation = request_generation(request)
+            params  = tuple(sorted((k, str(v)) for k, v in kwargs.items() if k not in SKIP_PARAMS))
+            key     = (endpoint, params, generation.version)
+            etag    = _etag(key)
+            updated = generation.updated
+            headers = {
+                "ETag":          etag,
+                "Last-Modified": formatdate(updated, usegmt=True),
+                # always revalidate: the data version moves when the pipeline publishes
+                "Cache-Control": "no-cache",
+                "Vary":          "Accept",
+            }
+            entry = response_cache.get(key, generation.number)
+            if entry is None:
+                # a burst of identical misses (the desk opening the dashboard at the
+                # close) runs the query once; the rest share the rendered body
+                entry = single_flight.do(key, lambda: _compute(key, fn, kwargs))
+            # only once this request is known to render: `If-None-Match: *`, a bare
+            # If-Modified-Since or a replayed tag say nothing about whether the route
+            # would accept its params
+            if _not_modified(request, etag, updated):
+                response_cache.record_not_modified()
+                return Response(status_code=304, headers=headers)
+            media_type, body = entry
+            return Response(content=body, media_type=media_type, headers=headers)
+
+        wrapper.__signature__ = signature.replace(parameters=[
+            inspect.Parameter("request", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Request),
+            *signature.parameters.values(),
+        ])
+        return wrapper
+    return decorator
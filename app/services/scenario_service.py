@@ -8,68 +8,7 @@ from src.quant.scenario_engine import (
     MarketSnapshot, Shock, OptionContract, FuturesContract,
     scenario_option, scenario_futures,
 )
-
-
-def _query_option_row(
-    db: duckdb.DuckDBPyConnection,
-    symbol: str,
-    trade_date: date,
-    expiry_date: date,
-    strike: float,
-    option_type: str,
-) -> pd.Series | None:
-    query = """
-        SELECT
-            CAST(trade_date AS DATE)  AS trade_date,
-            symbol,
-            CAST(expiry_date AS DATE) AS expiry_date,
-            strike,
-            option_type,
-            dte,
-            spot,
-            div_yield,
-            rate,
-            iv,
-            delta, gamma, vega, theta, rho
-        FROM v_curated_option_chain
-        WHERE symbol      = ?
-          AND CAST(trade_date AS DATE)  = ?
-          AND CAST(expiry_date AS DATE) = ?
-          AND strike      = ?
-          AND option_type = ?
-        LIMIT 1
-    """
-    df = db.execute(query, [symbol, trade_date, expiry_date, strike, option_type]).df()
-    if df.empty:
-        return None
-    return df.iloc[0]
-
-
-def _query_futures_row(
-    db: duckdb.DuckDBPyConnection,
-    symbol: str,
-    trade_date: date,
-    expiry_date: date,
-) -> pd.Series | None:
-    query = """
-        SELECT
-            CAST(trade_date AS DATE)  AS trade_date,
-            symbol,
-            CAST(expiry_date AS DATE) AS expiry_date,
-            dte,
-            spot,
-            div_yield,
-            rate
-        FROM v_curated_futures
-        WHERE symbol      = ?
-          AND CAST(trade_date AS DATE)  = ?
-          AND CAST(expiry_date AS DATE) = ?
-        LIMIT 1
-    """
-    df = db.execute(query, [symbol, trade_date, expiry_date]).df()
-    if df.empty:
-        return None
-    return df.iloc[0]
+from app.services.market_snapshot import get_market_day, get_lot_size_index
 
 
 def _query_lot_size(
@@ -77,25 +16,7 @@ def _query_lot_size(
     symbol: str,
     trade_date: date,
 ) -> int:
-    query = """
-        SELECT lot_size, start_date, end_date
-        FROM v_processed_lot_size
-        WHERE symbol = ?
-    """
-    df = db.execute(query, [symbol]).df()
-    if df.empty:
-        return 1
-
-    df["start_date"] = pd.to_datetime(df["start_date"], errors="coerce").dt.date
-    df["end_date"]   = pd.to_datetime(df["end_date"],   errors="coerce").dt.date
-
-    trade_date_as_date = pd.Timestamp(trade_date).date()
-
-    lot_rows = df[
-        (df["start_date"] <= trade_date_as_date) &
-        (df["end_date"].isna() | (df["end_date"] >= trade_date_as_date))
-    ]
-    return int(lot_rows.iloc[0]["lot_size"]) if not lot_rows.empty else 1
+    return get_lot_size_index(db).get(symbol, trade_date)
 
 
 def _build_snapshot_from_option(row: pd.Series) -> MarketSnapshot:
@@ -135,10 +56,15 @@ def run_scenario(
         spot_shock_pct=req.spot_shock_pct,
         vol_shock_abs=req.vol_shock_abs,
         rate_shock_bps=req.rate_shock_bps,
+        tenor_shocks_bps={
+            "3m": req.rate_shock_3m_bps,
+            "6m": req.rate_shock_6m_bps,
+            "1y": req.rate_shock_1y_bps,
+        },
     )
 
     if req.option_type == "XX":
-        row = _query_futures_row(db, symbol, req.trade_date, req.expiry_date)
+        row = get_market_day(db, req.trade_date).futures_row(symbol, req.expiry_date)
         if row is None:
             raise HTTPException(
                 status_code=404,
@@ -168,9 +94,8 @@ def run_scenario(
         )
 
     else:
-        row = _query_option_row(
-            db, symbol, req.trade_date, req.expiry_date,
-            req.strike, req.option_type,
+        row = get_market_day(db, req.trade_date).option_row(
+            symbol, req.expiry_date, req.strike, req.option_type,
         )
         if row is None:
             raise HTTPException(
@@ -0,0 +1,96 @@
+import hashlib
+import logging
+import threading
+from collections import defaultdict
+from typing import Callable, Hashable, TypeVar
+
+from src.db.generation import data_version_of
+
+logger = logging.getLogger("app.single_flight")
+
+T = TypeVar("T")
+
+
+class _Call:
+
+    def __init__(self):
+        self.done   = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    # identical concurrent requests run once: the first caller for a key computes,
+    # later callers block on its result (or exception) instead of re-running the
+    # query. nothing is kept once the call returns; caching is response_cache's job.
+    # routes are sync and run on the threadpool, so followers wait on an Event
+
+    def __init__(self):
+        self._lock  = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.leaders   = defaultdict(int)
+        self.coalesced = defaultdict(int)
+        self.errors    = 0
+
+    def do(self, key: tuple, fn: Callable[[], T]) -> T:
+        # key[0] is the endpoint, for the per-endpoint counters
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders[key[0]] += 1
+            else:
+                self.coalesced[key[0]] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> dict:
+        with self._lock:
+            endpoints = {}
+            for endpoint in sorted(set(self.leaders) | set(self.coalesced)):
+                leaders, coalesced = self.leaders[endpoint], self.coalesced[endpoint]
+                endpoints[endpoint] = {
+                    "executed":        leaders,
+                    "coalesced":       coalesced,
+                    "coalescing_rate": round(coalesced / (leaders + coalesced), 4),
+                }
+            executed  = sum(self.leaders.values())
+            coalesced = sum(self.coalesced.values())
+            return {
+                "in_flight":       len(self._calls),
+                "executed":        executed,
+                "coalesced":       coalesced,
+                "coalescing_rate": round(coalesced / (executed + coalesced), 4) if executed else 0.0,
+                "errors":          self.errors,
+                "endpoints":       endpoints,
+            }
+
+
+def request_key(endpoint: str, db, file_bytes: bytes | None = None, **params) -> tuple:
+    # normalized identity of a request: params as sorted strings, an uploaded CSV by
+    # its content hash (not its filename), and the data version of the request's
+    # cursor so a request never joins a computation on another generation
+    digest = hashlib.sha256(file_bytes).hexdigest() if file_bytes is not None else None
+    params = tuple(sorted((k, str(v)) for k, v in params.items()))
+    return (endpoint, params, digest, data_version_of(db))
+
+
+single_flight = SingleFlight()
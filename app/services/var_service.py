@@ -3,66 +3,9 @@ import duckdb
 import pandas as pd
 from datetime import date
 
-from app.schemas.var import VaRResponse, VaRSummary, ScenarioPnLPoint
+from app.schemas.var import VaRResponse, VaRColumnarResponse, VaRSummary, ScenarioPnLPoint, ScenarioPnLColumns
 from src.quant.var import compute_var
-
-
-def _query_curated_options(db: duckdb.DuckDBPyConnection, trade_date: date) -> pd.DataFrame:
-    query = """
-        SELECT
-            CAST(trade_date AS DATE)  AS trade_date,
-            symbol,
-            CAST(expiry_date AS DATE) AS expiry_date,
-            strike,
-            option_type,
-            dte,
-            spot,
-            div_yield,
-            rate,
-            iv,
-            delta, gamma, vega, theta, rho
-        FROM v_curated_option_chain
-        WHERE CAST(trade_date AS DATE) = ?
-    """
-    df = db.execute(query, [trade_date]).df()
-    df["trade_date"]  = pd.to_datetime(df["trade_date"]).dt.date
-    df["expiry_date"] = pd.to_datetime(df["expiry_date"]).dt.date
-    return df
-
-
-def _query_curated_futures(db: duckdb.DuckDBPyConnection, trade_date: date) -> pd.DataFrame:
-    query = """
-        SELECT
-            CAST(trade_date AS DATE)  AS trade_date,
-            symbol,
-            CAST(expiry_date AS DATE) AS expiry_date,
-            dte,
-            spot,
-            div_yield,
-            rate,
-            settle
-        FROM v_curated_futures
-        WHERE CAST(trade_date AS DATE) = ?
-    """
-    df = db.execute(query, [trade_date]).df()
-    df["trade_date"]  = pd.to_datetime(df["trade_date"]).dt.date
-    df["expiry_date"] = pd.to_datetime(df["expiry_date"]).dt.date
-    return df
-
-
-def _query_lot_size(db: duckdb.DuckDBPyConnection) -> pd.DataFrame:
-    query = """
-        SELECT
-            symbol,
-            CAST(start_date AS DATE) AS start_date,
-            CAST(end_date   AS DATE) AS end_date,
-            lot_size
-        FROM v_processed_lot_size
-    """
-    df = db.execute(query).df()
-    df["start_date"] = pd.to_datetime(df["start_date"], errors="coerce").dt.date
-    df["end_date"]   = pd.to_datetime(df["end_date"],   errors="coerce").dt.date
-    return df
+from app.services.market_snapshot import get_market_day, get_lot_sizes, get_lot_size_index
 
 
 def _parse_csv(file_bytes: bytes) -> pd.DataFrame:
@@ -72,8 +15,11 @@ def _parse_csv(file_bytes: bytes) -> pd.DataFrame:
         raise ValueError(f"Failed to parse CSV: {e}")
 
 
-def _to_response(result) -> VaRResponse:
-    summary = VaRSummary(
+LAYOUTS = ("rows", "columnar")
+
+
+def _to_summary(result) -> VaRSummary:
+    return VaRSummary(
         symbol=result.symbol,
         trade_date=result.trade_date,
         lookback_days=result.lookback_days,
@@ -86,15 +32,18 @@ def _to_response(result) -> VaRResponse:
         min_pnl=result.min_pnl,
         max_pnl=result.max_pnl,
     )
-    distribution = [
-        ScenarioPnLPoint(
-            date=s.date,
-            spot_return_pct=s.spot_return_pct,
-            portfolio_pnl=s.portfolio_pnl,
-        )
-        for s in result.pnl_distribution
-    ]
-    return VaRResponse(summary=summary, pnl_distribution=distribution)
+
+
+def _to_response(result) -> VaRResponse:
+    distribution = [ScenarioPnLPoint(**record) for record in result.scenarios.to_records()]
+    return VaRResponse(summary=_to_summary(result), pnl_distribution=distribution)
+
+
+def _to_columnar_response(result) -> VaRColumnarResponse:
+    return VaRColumnarResponse(
+        summary=_to_summary(result),
+        pnl_distribution=ScenarioPnLColumns(**result.scenarios.to_columns()),
+    )
 
 
 def analyze_var(
@@ -103,13 +52,15 @@ def analyze_var(
     trade_date: date,
     lookback_days: int,
     db: duckdb.DuckDBPyConnection,
-) -> VaRResponse:
-    positions_df    = _parse_csv(file_bytes)
-    curated_options = _query_curated_options(db, trade_date)
-    curated_futures = _query_curated_futures(db, trade_date)
-    lot_size_df     = _query_lot_size(db)
+    layout: str = "rows",
+) -> VaRResponse | VaRColumnarResponse:
+    if layout not in LAYOUTS:
+        raise ValueError(f"Invalid layout: '{layout}'. Expected one of {LAYOUTS}.")
+
+    positions_df = _parse_csv(file_bytes)
+    market       = get_market_day(db, trade_date)
 
-    if curated_options.empty and curated_futures.empty:
+    if market.empty:
         raise ValueError(
             f"No curated data found for trade_date={trade_date}. "
             f"Check that the pipeline has run for this date."
@@ -117,13 +68,16 @@ def analyze_var(
 
     result = compute_var(
         positions_df=positions_df,
-        curated_options=curated_options,
-        curated_futures=curated_futures,
-        lot_size_df=lot_size_df,
+        curated_options=market.options,
+        curated_futures=market.futures,
+        lot_size_df=get_lot_sizes(db),
+        option_index=market.option_index,
+        futures_index=market.futures_index,
+        lot_size_index=get_lot_size_index(db),
         symbol=symbol,
         trade_date=str(trade_date),
         db=db,
         lookback_days=lookback_days,
     )
 
-    return _to_response(result)
+    return _to_columnar_response(result) if layout == "columnar" else _to_response(result)
@@ -8,10 +8,10 @@ from app.schemas.vix import VIXResponse
 def get_vix(trade_date: date, db: duckdb.DuckDBPyConnection) -> VIXResponse:
     query = """
         SELECT
-            CAST(trade_date AS DATE) AS trade_date,
+            trade_date,
             close
         FROM v_processed_vix
-        WHERE CAST(trade_date AS DATE) = ?
+        WHERE trade_date = ?
     """
     result = db.execute(query, [trade_date]).fetchone()
 
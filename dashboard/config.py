@@ -1,10 +1,14 @@
 import os
+import pyarrow as pa
 import requests
 import streamlit as st
+import threading
+from collections import OrderedDict
 from datetime import date, datetime
 import time
 
 API_BASE = os.environ.get("QRL_API_BASE", "http://127.0.0.1:8000")
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
 
 VALID_SYMBOLS = ["NIFTY", "BANKNIFTY", "FINNIFTY", "MIDCPNIFTY"]
 
@@ -14,6 +18,60 @@ SHOCK_DEFAULTS = {
     "rate_shock_bps": 0.0,
 }
 
+# (url, accept) -> (etag, parsed body). lives for the Streamlit process, so it survives
+# reruns and is shared across sessions; callers must treat returned payloads as read-only
+ETAG_CACHE_SIZE = int(os.environ.get("QRL_DASHBOARD_ETAG_CACHE", "64"))
+_etag_cache: OrderedDict[tuple, tuple] = OrderedDict()
+_etag_lock  = threading.Lock()
+
+
+def _parse(r: requests.Response):
+    if r.headers.get("Content-Type", "").startswith(ARROW_STREAM):
+        return pa.ipc.open_stream(r.content).read_all()
+    try:
+        return r.json()
+    except ValueError:
+        return {}
+
+
+def cached_get(url: str, timeout: float = 30, accept: str | None = None) -> tuple[int, object]:
+    """
+    GET a read endpoint with If-None-Match. A 304 reuses the body parsed on the
+    previous 200, so unchanged data is neither re-sent nor re-parsed.
+
+    Args:
+        accept: optional Accept header, e.g. ARROW_STREAM for the option chain.
+
+    Returns:
+        (status_code, body). 304 is reported as 200. The body is a pyarrow.Table for
+        Arrow responses, parsed JSON otherwise ({} if the body is not JSON).
+    Raises:
+        requests.exceptions.RequestException on connection failure, like requests.get.
+    """
+    key = (url, accept)
+    with _etag_lock:
+        cached = _etag_cache.get(key)
+    headers = {"Accept": accept} if accept else {}
+    if cached:
+        headers["If-None-Match"] = cached[0]
+
+    r = requests.get(url, headers=headers, timeout=timeout)
+    if r.status_code == 304 and cached:
+        with _etag_lock:
+            if key in _etag_cache:
+                _etag_cache.move_to_end(key)
+        return 200, cached[1]
+
+    payload = _parse(r)
+    etag    = r.headers.get("ETag")
+    if r.status_code == 200 and etag:
+        with _etag_lock:
+            _etag_cache[key] = (etag, payload)
+            _etag_cache.move_to_end(key)
+            while len(_etag_cache) > ETAG_CACHE_SIZE:
+                _etag_cache.popitem(last=False)
+    return r.status_code, payload
+
 
 def fetch_latest_trade_date() -> date:
     """
@@ -21,9 +79,9 @@ def fetch_latest_trade_date() -> date:
     Falls back to today's date on failure.
     """
     try:
-        r = requests.get(f"{API_BASE}/chain/latest-date", timeout=5)
-        if r.status_code == 200:
-            date_str = r.json().get("latest_date")
+        status, body = cached_get(f"{API_BASE}/chain/latest-date", timeout=5)
+        if status == 200:
+            date_str = body.get("latest_date")
             return datetime.strptime(date_str, "%Y-%m-%d").date()
     except Exception:
         pass
@@ -46,9 +104,10 @@ def fetch_market_summary(trade_date: str) -> dict:
 
     for attempt in range(3):
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            return response.json()
+            status, body = cached_get(url, timeout=30)
+            if status != 200:
+                raise requests.exceptions.HTTPError(f"{status}: {body.get('detail', 'Unknown error')}")
+            return body
         except requests.exceptions.RequestException as e:
             if attempt < 2:
                 time.sleep(3)
@@ -1,5 +1,4 @@
 import streamlit as st
-import requests
 import pandas as pd
 import plotly.express as px
 import sys
@@ -8,7 +7,7 @@ from pathlib import Path
 from datetime import date as dt
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-from config import API_BASE, VALID_SYMBOLS
+from config import API_BASE, ARROW_STREAM, VALID_SYMBOLS, cached_get
 
 @st.cache_data(ttl=3600)
 def get_latest_trade_date():
@@ -41,12 +40,12 @@ CHAIN_COLUMN_LABELS = {
 def fetch_expiries(symbol: str, trade_date: str) -> list[str]:
     for attempt in range(3):
         try:
-            r = requests.get(
+            status, body = cached_get(
                 f"{API_BASE}/chain/expiries/{symbol}/{trade_date}",
                 timeout=30,
             )
-            if r.status_code == 200:
-                return r.json().get("expiries", [])
+            if status == 200:
+                return body.get("expiries", [])
             return []
         except Exception:
             if attempt < 2:
@@ -54,16 +53,26 @@ def fetch_expiries(symbol: str, trade_date: str) -> list[str]:
                 continue
             return []
 
-def fetch_chain(symbol: str, trade_date: str, expiry_date: str) -> dict | None:
+def fetch_chain(symbol: str, trade_date: str, expiry_date: str, atm_window: int | None = None) -> dict | None:
+    # Arrow IPC: the chain arrives columnar and decodes straight into a DataFrame;
+    # the summary fields ride along as schema metadata
+    query = f"?atm_window={atm_window}" if atm_window is not None else ""
     for attempt in range(3):
         try:
-            r = requests.get(
-                f"{API_BASE}/chain/{symbol}/{trade_date}/{expiry_date}",
+            status, body = cached_get(
+                f"{API_BASE}/chain/{symbol}/{trade_date}/{expiry_date}{query}",
                 timeout=60,
+                accept=ARROW_STREAM,
             )
-            if r.status_code == 200:
-                return r.json()
-            st.error(f"API error {r.status_code}: {r.json().get('detail', 'Unknown error')}")
+            if status == 200:
+                meta = {k.decode(): v.decode() for k, v in (body.schema.metadata or {}).items()}
+                return {
+                    "row_count":         int(meta.get("row_count", body.num_rows)),
+                    "iv_computed_count": int(meta.get("iv_computed_count", 0)),
+                    "iv_avg":            float(meta["iv_avg"]) if meta.get("iv_avg") else None,
+                    "rows":              body.to_pandas(),
+                }
+            st.error(f"API error {status}: {body.get('detail', 'Unknown error')}")
             return None
         except Exception as e:
             if attempt < 2:
@@ -75,9 +84,9 @@ def fetch_chain(symbol: str, trade_date: str, expiry_date: str) -> dict | None:
 def fetch_vix(trade_date: str) -> float | None:
     for attempt in range(3):
         try:
-            r = requests.get(f"{API_BASE}/vix/{trade_date}", timeout=30)
-            if r.status_code == 200:
-                return r.json().get("close")
+            status, body = cached_get(f"{API_BASE}/vix/{trade_date}", timeout=30)
+            if status == 200:
+                return body.get("close")
             return None
         except Exception:
             if attempt < 2:
@@ -104,7 +113,8 @@ def render_results(symbol: str, trade_date_str: str, expiry_date_str: str):
 
     st.divider()
 
-    df = pd.DataFrame(data["rows"])
+    # render runs on every rerun; leave the session-state frame untouched
+    df = data["rows"].copy()
     df["trade_date"]  = pd.to_datetime(df["trade_date"]).dt.date
     df["expiry_date"] = pd.to_datetime(df["expiry_date"]).dt.date
 
@@ -222,6 +232,17 @@ with st.sidebar:
     )
     expiry_date_str = str(expiry_date)
 
+    full_chain = st.checkbox(
+        "Full chain",
+        value=False,
+        help="Load every listed strike instead of a window around ATM.",
+    )
+    atm_window = None if full_chain else st.slider(
+        "Strikes either side of ATM",
+        min_value=5, max_value=60, value=20, step=5,
+        help="ATM is the listed strike closest to spot. The window is applied by the API.",
+    )
+
     load = st.button("Load Chain", type="primary", use_container_width=True)
 
     st.divider()
@@ -234,7 +255,7 @@ with st.sidebar:
 # ── Load on button click ──
 if load:
     with st.spinner("Loading option chain..."):
-        data = fetch_chain(symbol, trade_date_str, expiry_date_str)
+        data = fetch_chain(symbol, trade_date_str, expiry_date_str, atm_window)
         vix  = fetch_vix(trade_date_str)
     st.session_state["me_chain_data"]  = data
     st.session_state["me_vix"]         = vix
@@ -8,7 +8,7 @@ import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents))
-from config import API_BASE, VALID_SYMBOLS, SHOCK_DEFAULTS
+from config import API_BASE, VALID_SYMBOLS, SHOCK_DEFAULTS, cached_get
 
 @st.cache_data(ttl=3600)
 def get_latest_trade_date():
@@ -27,12 +27,12 @@ st.divider()
 def fetch_expiries(symbol: str, trade_date: str) -> list[str]:
     for attempt in range(3):
         try:
-            r = requests.get(
+            status, body = cached_get(
                 f"{API_BASE}/chain/expiries/{symbol}/{trade_date}",
                 timeout=30,
             )
-            if r.status_code == 200:
-                return r.json().get("expiries", [])
+            if status == 200:
+                return body.get("expiries", [])
             return []
         except Exception:
             if attempt < 2:
@@ -44,13 +44,12 @@ def fetch_expiries(symbol: str, trade_date: str) -> list[str]:
 def fetch_strikes(symbol: str, trade_date: str, expiry_date: str) -> list[float]:
     for attempt in range(3):
         try:
-            r = requests.get(
-                f"{API_BASE}/chain/{symbol}/{trade_date}/{expiry_date}",
-                timeout=60,
+            status, body = cached_get(
+                f"{API_BASE}/chain/strikes/{symbol}/{trade_date}/{expiry_date}",
+                timeout=30,
             )
-            if r.status_code == 200:
-                rows = r.json().get("rows", [])
-                return sorted(set(row["strike"] for row in rows))
+            if status == 200:
+                return body.get("strikes", [])
             return []
         except Exception:
             if attempt < 2:
@@ -0,0 +1,99 @@
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.chain_service import ARROW_STREAM
+from app.services.response_cache import response_cache
+
+FORMATS = {
+    "rows":     ({"layout": "rows"},     {}),
+    "columnar": ({"layout": "columnar"}, {}),
+    "arrow":    ({},                     {"Accept": ARROW_STREAM}),
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark option chain response formats: latency and payload size")
+    parser.add_argument("--symbol",      default="NIFTY")
+    parser.add_argument("--trade-date",  default=None, help="YYYY-MM-DD; defaults to the latest curated date")
+    parser.add_argument("--expiry-date", default=None, help="YYYY-MM-DD; defaults to the nearest expiry")
+    parser.add_argument("--requests",    type=int, default=200, help="Timed requests per format and mode")
+    return parser.parse_args()
+
+
+def decode(fmt: str, content: bytes):
+    if fmt == "arrow":
+        return pa.ipc.open_stream(content).read_all().to_pandas()
+    return json.loads(content)
+
+
+def measure(client: TestClient, url: str, fmt: str, n: int, cached: bool) -> dict:
+    params, headers = FORMATS[fmt]
+    client.get(url, params=params, headers=headers)  # warm DuckDB / the cache
+
+    server, decoded, size = [], [], 0
+    for _ in range(n):
+        if not cached:
+            response_cache.clear()
+        start = time.perf_counter()
+        r     = client.get(url, params=params, headers=headers)
+        mid   = time.perf_counter()
+        decode(fmt, r.content)
+        end   = time.perf_counter()
+        r.raise_for_status()
+        server.append(mid - start)
+        decoded.append(end - mid)
+        size = len(r.content)
+
+    server  = np.array(server) * 1000
+    decoded = np.array(decoded) * 1000
+    return {
+        "bytes":     size,
+        "p50_ms":    np.percentile(server, 50),
+        "p99_ms":    np.percentile(server, 99),
+        "decode_ms": np.percentile(decoded, 50),
+    }
+
+
+def main():
+    args   = parse_args()
+    client = TestClient(app)
+
+    trade_date = args.trade_date or client.get("/chain/latest-date").json()["latest_date"]
+    expiry     = args.expiry_date
+    if expiry is None:
+        expiries = client.get(f"/chain/expiries/{args.symbol}/{trade_date}").json()["expiries"]
+        if not expiries:
+            sys.exit(f"No expiries for {args.symbol} on {trade_date}.")
+        expiry = expiries[0]
+
+    url  = f"/chain/{args.symbol}/{trade_date}/{expiry}"
+    rows = client.get(url).json()["row_count"]
+    print(f"{url}  rows={rows}  requests={args.requests}")
+    print(f"{'format':<10} {'mode':<8} {'bytes':>9} {'p50 ms':>8} {'p99 ms':>8} {'decode ms':>10}")
+    for cached in (False, True):
+        for fmt in FORMATS:
+            m = measure(client, url, fmt, args.requests, cached)
+            print(
+                f"{fmt:<10} {'cached' if cached else 'render':<8} {m['bytes']:>9,} "
+                f"{m['p50_ms']:>8.2f} {m['p99_ms']:>8.2f} {m['decode_ms']:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
+
+#run
+"""
+python scripts/bench_chain_formats.py --symbol NIFTY --requests 200
+"""
@@ -0,0 +1,62 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.quant.bs_vectorized import _greeks_vec
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark first- vs higher-order vectorized Greeks")
+    parser.add_argument("--rows",    type=int, default=1_000_000, help="Rows per batch")
+    parser.add_argument("--repeats", type=int, default=3,         help="Timed repeats; best is reported")
+    return parser.parse_args()
+
+
+def make_inputs(n: int, seed: int = 0):
+    rng     = np.random.default_rng(seed)
+    S       = np.full(n, 22000.0)
+    K       = S * rng.uniform(0.8, 1.2, n)
+    T       = rng.integers(1, 365, n) / 365.0
+    r       = np.full(n, 0.065)
+    q       = np.full(n, 0.012)
+    sigma   = rng.uniform(0.08, 0.6, n)
+    is_call = rng.random(n) < 0.5
+    return S, K, T, r, q, sigma, is_call
+
+
+def best_of(repeats: int, fn) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    args   = parse_args()
+    inputs = make_inputs(args.rows)
+    scale  = 1_000_000 / args.rows
+
+    base   = best_of(args.repeats, lambda: _greeks_vec(*inputs))
+    higher = best_of(args.repeats, lambda: _greeks_vec(*inputs, higher_order=True))
+
+    print(f"rows={args.rows:,} repeats={args.repeats}")
+    print(f"first-order   : {base * scale:8.3f} s / 1M rows")
+    print(f"+ higher-order: {higher * scale:8.3f} s / 1M rows")
+    print(f"incremental   : {(higher - base) * scale:8.3f} s / 1M rows ({(higher / base - 1) * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
+
+# run
+"""
+python scripts/bench_greeks.py
+python scripts/bench_greeks.py --rows 200000 --repeats 5
+"""
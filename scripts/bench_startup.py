@@ -0,0 +1,144 @@
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app import dependencies
+from src.core.fetch_config import FetchConfig
+from src.data.curated_option_chain_builder import partition_path
+from src.db.connection import DuckDBConnection
+from src.db.curated_registry import CuratedRegistry
+from src.db.data_version import DataVersion
+from src.db.manifest import write_manifest
+from src.db.processed_registry import ProcessedRegistry
+from src.db.snapshot import build_snapshot, current_snapshot
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark API startup: view registration (glob vs manifest) and a full generation open, as the file count grows")
+    parser.add_argument("--files",    type=int, nargs="+", default=[10, 100, 1000], help="Synthetic option chain partition counts")
+    parser.add_argument("--repeats",  type=int, default=5, help="Timed registrations per mode; the median is reported")
+    parser.add_argument("--base-dir", type=Path, default=None, help="Benchmark an existing data tree instead of synthetic files")
+    return parser.parse_args()
+
+
+def make_tree(base_dir: Path, n_files: int) -> FetchConfig:
+    config = FetchConfig(base_dir=base_dir)
+    rng    = np.random.default_rng(0)
+    days   = [date(2020, 1, 1) + timedelta(days=i) for i in range(n_files)]
+    # the API registers ingest views too, and refuses to start without any
+    (config.ingest_dir / "vix").mkdir(parents=True, exist_ok=True)
+    pd.DataFrame({"trade_date": days[:1], "close": [14.2]}).to_parquet(config.ingest_dir / "vix" / "vix.parquet", index=False)
+    (config.processed_dir / "vix").mkdir(parents=True, exist_ok=True)
+    pd.DataFrame({"trade_date": days, "close": rng.uniform(10, 30, n_files)}).to_parquet(
+        config.processed_dir / "vix" / "vix.parquet", index=False
+    )
+    # one file per (symbol, month) partition, 200 rows each
+    for i in range(n_files):
+        symbol = ("NIFTY", "BANKNIFTY", "FINNIFTY", "MIDCPNIFTY")[i % 4]
+        year, month = 2000 + i // 48, (i // 4) % 12 + 1
+        path = partition_path(config.curated_dir / "option_chain", symbol, year, month)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame({
+            "trade_date":  [date(year, month, 1)] * 200,
+            "symbol":      [symbol] * 200,
+            "expiry_date": [date(year, month, 28)] * 200,
+            "strike":      np.arange(200, dtype=np.float64) * 50,
+            "option_type": ["CE", "PE"] * 100,
+            "settle":      rng.uniform(1, 500, 200),
+        }).to_parquet(path, index=False)
+    return config
+
+
+def register(config: FetchConfig, use_manifest: bool, db_path: Path) -> float:
+    db_path.unlink(missing_ok=True)
+    start   = time.perf_counter()
+    db_conn = DuckDBConnection(db_path)
+    ProcessedRegistry(db_conn, config, use_manifest=use_manifest).register_all()
+    CuratedRegistry(db_conn, config, use_manifest=use_manifest).register_all()
+    elapsed = time.perf_counter() - start
+    db_conn.close()
+    return elapsed * 1000
+
+
+def walk(config: FetchConfig) -> float:
+    # the data version fingerprint: a stat of every processed and curated file
+    start = time.perf_counter()
+    DataVersion([config.processed_dir, config.curated_dir]).compute()
+    return (time.perf_counter() - start) * 1000
+
+
+def open_generation(snapshot: str) -> float:
+    # what the API does on a cold start or a reload, end to end
+    dependencies.SNAPSHOT = snapshot
+    start      = time.perf_counter()
+    generation = dependencies._open_generation()
+    elapsed    = time.perf_counter() - start
+    generation.close()
+    return elapsed * 1000
+
+
+def measure(config: FetchConfig, repeats: int, db_path: Path, build: bool) -> dict:
+    start = time.perf_counter()
+    write_manifest(config.processed_dir)
+    manifest = write_manifest(config.curated_dir)
+    written  = (time.perf_counter() - start) * 1000
+    files    = sum(len(d["files"]) for d in manifest["datasets"].values())
+    # built after the manifests, as the pipeline publishes; an existing tree keeps its
+    # own snapshot, which the manifests just rewritten now postdate
+    if build:
+        build_snapshot(config)
+    os.environ["QRL_BASE_DIR"] = str(config.base_dir)
+    dependencies._config.cache_clear()
+    has_snapshot = current_snapshot(config.snapshot_dir) is not None
+    return {
+        "files":    files,
+        "glob":     statistics.median(register(config, False, db_path) for _ in range(repeats)),
+        "manifest": statistics.median(register(config, True, db_path) for _ in range(repeats)),
+        "write":    written,
+        "walk":     statistics.median(walk(config) for _ in range(repeats)),
+        "views":    statistics.median(open_generation("off") for _ in range(repeats)),
+        "snapshot": statistics.median(open_generation("auto") for _ in range(repeats)) if has_snapshot else None,
+    }
+
+
+def main():
+    args = parse_args()
+    logging.disable(logging.INFO)
+    print(
+        f"{'curated files':>13} {'glob ms':>9} {'manifest ms':>12} {'manifest write ms':>18}"
+        f" {'walk ms':>8} {'open views ms':>14} {'open snapshot ms':>17}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        if args.base_dir is not None:
+            runs = [FetchConfig(base_dir=args.base_dir)]
+        else:
+            runs = [make_tree(Path(tmp) / str(n), n) for n in args.files]
+        for config in runs:
+            m = measure(config, args.repeats, db_path, build=args.base_dir is None)
+            snapshot = "-" if m["snapshot"] is None else f"{m['snapshot']:.1f}"
+            print(
+                f"{m['files']:>13,} {m['glob']:>9.1f} {m['manifest']:>12.1f} {m['write']:>18.1f}"
+                f" {m['walk']:>8.1f} {m['views']:>14.1f} {snapshot:>17}"
+            )
+
+
+if __name__ == "__main__":
+    main()
+
+#run
+"""
+python scripts/bench_startup.py --files 10 100 1000 --repeats 5
+python scripts/bench_startup.py --base-dir /tmp/qrl
+"""
@@ -0,0 +1,38 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.core.fetch_config import FetchConfig
+from src.db.snapshot import build_snapshot
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Load the processed and curated layers into a versioned, read-only DuckDB snapshot for the API"
+    )
+    parser.add_argument("--base-dir",     type=Path, default=Path(__file__).resolve().parents[1])
+    parser.add_argument("--snapshot-dir", type=Path, default=None, help="Defaults to data/snapshot under the base dir")
+    parser.add_argument("--keep",         type=int,  default=2,    help="Snapshot files to keep, including the new one")
+    return parser.parse_args()
+
+
+def main():
+    args   = parse_args()
+    config = FetchConfig(base_dir=args.base_dir)
+    start  = time.perf_counter()
+    path   = build_snapshot(config, snapshot_dir=args.snapshot_dir, keep=args.keep)
+    print(f"{path}  {path.stat().st_size / 1e6:.1f} MB  built in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
+
+# run
+"""
+python scripts/build_snapshot.py
+python scripts/build_snapshot.py --snapshot-dir /tmp/qrl/snapshot --keep 1
+QRL_SNAPSHOT=off uvicorn app.main:app   # serve from Parquet views instead
+"""
@@ -1,7 +1,14 @@
 import boto3
 import os
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.core.fetch_config import FetchConfig
+from src.db.manifest import write_manifests
+from src.db.snapshot import build_snapshot
+
 R2_ACCOUNT_ID = os.environ["R2_ACCOUNT_ID"]
 R2_ACCESS_KEY = os.environ["R2_ACCESS_KEY"]
 R2_SECRET_KEY = os.environ["R2_SECRET_KEY"]
@@ -51,5 +58,11 @@ def download_all():
     print(f"Verified curated: {curated_dir}")
     print(f"Data dir contents: {[p.name for p in (BASE_DIR / 'data').iterdir()]}")
 
+    # the API registers views from the manifests, or opens the snapshot read-only
+    config = FetchConfig(base_dir=BASE_DIR)
+    write_manifests(config)
+    snapshot = build_snapshot(config)
+    print(f"Snapshot: {snapshot}")
+
 if __name__ == "__main__":
     download_all()
@@ -0,0 +1,108 @@
+import argparse
+import json
+import re
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.dependencies import get_pool
+from app.services.chain_service import ChainFilter
+from app.services.market_snapshot import OPTIONS_QUERY, FUTURES_QUERY
+
+# a date column compared in a WHERE clause, as the services wrote it before the typed views
+DATE_PREDICATE = re.compile(r"\b(trade_date|expiry_date)(?=\s*(=|<=|>=|<|>|BETWEEN|IN)\s)")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="EXPLAIN ANALYZE the chain and portfolio queries with CAST(... AS DATE) filters vs direct DATE comparisons: files and rows scanned, timing")
+    parser.add_argument("--symbol",      default="NIFTY")
+    parser.add_argument("--trade-date",  default=None, help="YYYY-MM-DD; defaults to the latest curated date")
+    parser.add_argument("--expiry-date", default=None, help="YYYY-MM-DD; defaults to the nearest expiry")
+    parser.add_argument("--runs",        type=int, default=20, help="Timed executions per query and form")
+    parser.add_argument("--verbose",     action="store_true", help="Print the full EXPLAIN ANALYZE plans")
+    return parser.parse_args()
+
+
+def with_casts(sql: str) -> str:
+    return DATE_PREDICATE.sub(r"CAST(\1 AS DATE)", sql)
+
+
+def profile(cur, sql: str, params: list, path: Path) -> dict:
+    cur.execute("SET enable_profiling = 'json'")
+    cur.execute(f"SET profiling_output = '{path}'")
+    cur.execute(sql, params).fetchall()
+    cur.execute("SET enable_profiling = 'no_output'")
+
+    scans = []
+    def walk(node):
+        if node.get("operator_type") == "TABLE_SCAN":
+            info    = node.get("extra_info", {})
+            filters = info.get("Filters", [])
+            scans.append({
+                "filters": [filters] if isinstance(filters, str) else filters,
+                "files":   info.get("Scanning Files", info.get("Total Files Read", "?")),
+                "scanned": node.get("operator_rows_scanned", 0),
+                "emitted": node.get("operator_cardinality", 0),
+            })
+        for child in node.get("children", []):
+            walk(child)
+    walk(json.loads(path.read_text()))
+    return {"scans": scans}
+
+
+def timed(cur, sql: str, params: list, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        cur.execute(sql, params).fetchall()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    args = parse_args()
+    pool = get_pool()
+
+    with pool.cursor() as cur, tempfile.TemporaryDirectory() as tmp:
+        trade_date = date.fromisoformat(args.trade_date) if args.trade_date else \
+            cur.execute("SELECT MAX(trade_date) FROM v_curated_option_chain").fetchone()[0]
+        expiry = date.fromisoformat(args.expiry_date) if args.expiry_date else cur.execute("""
+            SELECT MIN(expiry_date) FROM v_curated_option_chain WHERE symbol = ? AND trade_date = ?
+        """, [args.symbol, trade_date]).fetchone()[0]
+        if trade_date is None or expiry is None:
+            sys.exit(f"No curated chain for {args.symbol} on {trade_date}.")
+
+        chain_sql, chain_params = ChainFilter().query(args.symbol, trade_date, expiry)
+        atm_sql, atm_params     = ChainFilter(atm_window=10).query(args.symbol, trade_date, expiry)
+        queries = {
+            "chain":              (chain_sql,     chain_params),
+            "chain atm_window":   (atm_sql,       atm_params),
+            "portfolio options":  (OPTIONS_QUERY, [trade_date.year, trade_date.month, trade_date]),
+            "portfolio futures":  (FUTURES_QUERY, [trade_date]),
+        }
+
+        print(f"{args.symbol} trade_date={trade_date} expiry={expiry} runs={args.runs}")
+        for name, (sql, params) in queries.items():
+            print(f"\n== {name}")
+            for form, text in (("cast", with_casts(sql)), ("direct", sql)):
+                result = profile(cur, text, params, Path(tmp) / "profile.json")
+                ms     = timed(cur, text, params, args.runs)
+                for scan in result["scans"]:
+                    print(f"  {form:<7} files={scan['files']:>7} scanned={scan['scanned']:>9,} emitted={scan['emitted']:>7,}  p50={ms:6.2f}ms  filters={scan['filters']}")
+                if args.verbose:
+                    print(cur.execute(f"EXPLAIN ANALYZE {text}", params).fetchall()[0][1])
+
+
+if __name__ == "__main__":
+    main()
+
+#run
+"""
+python scripts/explain_date_filters.py --symbol NIFTY --runs 20
+python scripts/explain_date_filters.py --trade-date 2025-03-10 --expiry-date 2025-03-31 --verbose
+"""
@@ -0,0 +1,96 @@
+import argparse
+import shutil
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.core.fetch_config import FetchConfig
+from src.data.curated_option_chain_builder import KEY, legacy_files, partition_path, write_partition
+from src.db.manifest import write_manifest
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Rewrite curated option chain year files into the symbol=/year=/month= hive layout"
+    )
+    parser.add_argument("--base-dir",   type=Path, default=Path(__file__).resolve().parents[1])
+    parser.add_argument("--backup-dir", type=Path, default=None,
+                        help="Move the old year files here instead of deleting them (must be outside option_chain/)")
+    parser.add_argument("--dry-run",    action="store_true", help="Report what would be written; change nothing")
+    return parser.parse_args()
+
+
+def migrate_file(root: Path, path: Path, dry_run: bool) -> tuple[int, int]:
+    # one symbol at a time keeps memory to a symbol-year, not the whole file
+    table   = pq.read_table(path, columns=["symbol"])
+    symbols = sorted(pc.unique(table["symbol"]).to_pylist())
+    rows_in, rows_out = 0, 0
+    for symbol in symbols:
+        df = pq.read_table(path, filters=[("symbol", "=", symbol)]).to_pandas()
+        df["trade_date"]  = pd.to_datetime(df["trade_date"]).dt.date
+        df["expiry_date"] = pd.to_datetime(df["expiry_date"]).dt.date
+        rows_in += len(df.drop_duplicates(subset=KEY))
+        dates    = pd.to_datetime(df["trade_date"])
+        for (year, month), part in df.groupby([dates.dt.year, dates.dt.month], sort=True):
+            out_path = partition_path(root, symbol, year, month)
+            if out_path.exists():
+                # the builder already wrote this month in the new layout; merge
+                part = pd.concat([pd.read_parquet(out_path), part], ignore_index=True)
+                part["trade_date"]  = pd.to_datetime(part["trade_date"]).dt.date
+                part["expiry_date"] = pd.to_datetime(part["expiry_date"]).dt.date
+                part = part.drop_duplicates(subset=KEY)
+            rows_out += len(part)
+            print(f"  {out_path.relative_to(root)}  rows={len(part):,}")
+            if not dry_run:
+                write_partition(part, out_path)
+    return rows_in, rows_out
+
+
+def main():
+    args   = parse_args()
+    config = FetchConfig(base_dir=args.base_dir)
+    root   = config.curated_dir / "option_chain"
+    files  = legacy_files(root)
+    if not files:
+        print(f"No pre-hive year files under {root}; nothing to migrate.")
+        return
+    if args.backup_dir is not None and args.backup_dir.resolve().is_relative_to(root.resolve()):
+        sys.exit("--backup-dir must be outside option_chain/, or the views would read both layouts.")
+
+    for path in files:
+        print(f"{path.relative_to(root)}")
+        rows_in, rows_out = migrate_file(root, path, args.dry_run)
+        # merged months can only add rows, so fewer out than distinct in means data was lost
+        if rows_out < rows_in:
+            sys.exit(f"Row count check failed for {path}: read {rows_in:,}, wrote {rows_out:,}. Old file kept.")
+        if args.dry_run:
+            continue
+        if args.backup_dir is not None:
+            target = args.backup_dir / path.relative_to(root)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(path, target)
+        else:
+            path.unlink()
+        if not any(path.parent.iterdir()):
+            path.parent.rmdir()
+    if args.dry_run:
+        print("Dry run; nothing written.")
+        return
+    write_manifest(config.curated_dir)
+    print(f"Migrated {len(files)} year files.")
+
+
+if __name__ == "__main__":
+    main()
+
+# run
+"""
+python scripts/migrate_option_chain_layout.py --dry-run
+python scripts/migrate_option_chain_layout.py --backup-dir /tmp/option_chain_legacy
+python scripts/migrate_option_chain_layout.py
+"""
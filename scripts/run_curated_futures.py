@@ -6,6 +6,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from src.core.fetch_config import FetchConfig
 from src.data.curated_futures_builder import CuratedFuturesBuilder
+from src.db.manifest import write_manifest
 
 
 def parse_args():
@@ -23,6 +24,7 @@ def main():
     args = parse_args()
     config = FetchConfig(base_dir=Path(__file__).resolve().parents[1])
     CuratedFuturesBuilder(config).run(args.mode)
+    write_manifest(config.curated_dir)
 
 
 if __name__ == "__main__":
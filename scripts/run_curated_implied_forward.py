@@ -0,0 +1,38 @@
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.core.fetch_config import FetchConfig
+from src.data.curated_implied_forward_builder import CuratedImpliedForwardBuilder
+from src.db.manifest import write_manifest
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Curated Implied Forward (put-call parity) Builder")
+    parser.add_argument(
+        "--mode",
+        choices=["full", "incremental"],
+        required=True,
+        help="Run mode: full rebuild or incremental append",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    config = FetchConfig(base_dir=Path(__file__).resolve().parents[1])
+    CuratedImpliedForwardBuilder(config).run(args.mode)
+    write_manifest(config.curated_dir)
+
+
+if __name__ == "__main__":
+    main()
+
+
+# run
+"""
+python scripts/run_curated_implied_forward.py --mode full
+python scripts/run_curated_implied_forward.py --mode incremental
+"""
@@ -7,6 +7,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from src.core.fetch_config import FetchConfig
 from src.data.curated_option_chain_builder import CuratedOptionChainBuilder
+from src.db.manifest import write_manifest
 
 
 def parse_args():
@@ -17,13 +18,29 @@ def parse_args():
         required=True,
         help="Run mode: full rebuild or incremental append"
     )
+    parser.add_argument(
+        "--higher-order-greeks",
+        action="store_true",
+        help="Also write vanna, volga, charm and speed columns"
+    )
+    parser.add_argument(
+        "--q-source",
+        choices=["index_yield", "implied"],
+        default="index_yield",
+        help="Dividend yield source: NSE index yield or put-call parity implied"
+    )
     return parser.parse_args()
 
 
 def main():
     args = parse_args()
     config = FetchConfig(base_dir=Path(__file__).resolve().parents[1])
-    CuratedOptionChainBuilder(config).run(args.mode)
+    CuratedOptionChainBuilder(
+        config,
+        higher_order_greeks=args.higher_order_greeks,
+        q_source=args.q_source,
+    ).run(args.mode)
+    write_manifest(config.curated_dir)
 
 
 if __name__ == "__main__":
@@ -33,4 +50,6 @@ if __name__ == "__main__":
 """
 python scripts/run_curated_option_chain.py --mode full
 python scripts/run_curated_option_chain.py --mode incremental
+python scripts/run_curated_option_chain.py --mode full --higher-order-greeks
+python scripts/run_curated_option_chain.py --mode full --q-source implied
 """
@@ -0,0 +1,44 @@
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.core.fetch_config import FetchConfig
+from src.data.curated_vol_surface_builder import CuratedVolSurfaceBuilder
+from src.db.manifest import write_manifest
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Curated Vol Surface (SVI) Builder")
+    parser.add_argument(
+        "--mode",
+        choices=["full", "incremental"],
+        required=True,
+        help="Run mode: full rebuild or incremental append",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for per-date fitting (default: cpu_count - 1)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    config = FetchConfig(base_dir=Path(__file__).resolve().parents[1])
+    CuratedVolSurfaceBuilder(config, workers=args.workers).run(args.mode)
+    write_manifest(config.curated_dir)
+
+
+if __name__ == "__main__":
+    main()
+
+
+# run
+"""
+python scripts/run_curated_vol_surface.py --mode full
+python scripts/run_curated_vol_surface.py --mode incremental --workers 4
+"""
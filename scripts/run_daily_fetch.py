@@ -23,6 +23,10 @@ from src.data.processed_gbond_builder import ProcessedGBondBuilder
 from src.data.curated_option_chain_builder import CuratedOptionChainBuilder
 from src.data.sync_checker import SyncChecker
 from src.data.curated_futures_builder import CuratedFuturesBuilder
+from src.data.curated_vol_surface_builder import CuratedVolSurfaceBuilder
+from src.data.curated_implied_forward_builder import CuratedImpliedForwardBuilder
+from src.db.manifest import write_manifests
+from src.db.snapshot import build_snapshot
 
 
 def main():
@@ -51,6 +55,12 @@ def main():
     # Curated Layer
     CuratedOptionChainBuilder(config).run("incremental")
     CuratedFuturesBuilder(config).run("incremental")
+    CuratedVolSurfaceBuilder(config).run("incremental")
+    CuratedImpliedForwardBuilder(config).run("incremental")
+
+    # API startup: view manifests, then native tables in one read-only .duckdb file
+    write_manifests(config)
+    build_snapshot(config)
 
     #Sync Checker
     SyncChecker(config).run(mode="daily")
@@ -12,6 +12,7 @@ from src.data.processed_index_spot_builder import ProcessedIndexSpotBuilder
 from src.data.processed_vix_builder import ProcessedVIXBuilder
 from src.data.processed_index_yield_builder import ProcessedIndexYieldBuilder
 from src.data.processed_gbond_builder import ProcessedGBondBuilder
+from src.db.manifest import write_manifest
 
 
 def parse_args():
@@ -67,6 +68,7 @@ def main():
         if not run_all and name not in selected:
             continue
         BuilderClass(config).run(args.mode)
+    write_manifest(config.processed_dir)
 
 
 if __name__ == "__main__":
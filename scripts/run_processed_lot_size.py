@@ -7,6 +7,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from src.core.fetch_config import FetchConfig
 from src.data.processed_lot_size_builder import ProcessedLotSizeBuilder
+from src.db.manifest import write_manifest
 
 
 def parse_args():
@@ -28,6 +29,7 @@ def main():
     logger.info("Starting ProcessedLotSizeBuilder | mode=%s", args.mode)
     builder.run(args.mode)
     logger.info("Done.")
+    write_manifest(config.processed_dir)
 
 
 if __name__ == "__main__":
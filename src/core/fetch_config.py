@@ -110,6 +110,7 @@ class FetchConfig:
         self.curated_dir = self.data_dir / "curated"
         self.logs_dir = self.base_dir / "logs"
         self.duckdb_path = self.data_dir/"quant_risk.db"
+        self.snapshot_dir = self.data_dir / "snapshot"
         self._create_base_dirs()
 
     def _create_base_dirs(self):
@@ -5,6 +5,8 @@ from pathlib import Path
 from src.core.fetch_config import FetchConfig
 from src.db.connection import DuckDBConnection
 from src.db.processed_registry import ProcessedRegistry
+from src.quant.yield_curve import YieldCurveCache, TENOR_COLUMNS
+from src.quant.futures_pricing import compute_futures_batch, FUTURES_QUANT_COLS
 
 
 QUERY = """
@@ -83,44 +85,16 @@ class CuratedFuturesBuilder:
         return df
 
     def _interpolate_rates(self, df: pd.DataFrame) -> pd.DataFrame:
-        dte  = df["dte"].to_numpy(dtype=np.float64)
-        r3m  = df["rate_3m"].to_numpy(dtype=np.float64) / 100
-        r6m  = df["rate_6m"].to_numpy(dtype=np.float64) / 100
-        r1y  = df["rate_1y"].to_numpy(dtype=np.float64) / 100
-
-        d3m = 91.0
-        d6m = 182.0
-        d1y = 365.0
-
-        rate = np.where(
-            dte < d3m,
-            r3m,
-            np.where(
-                dte < d6m,
-                r3m + (dte - d3m) / (d6m - d3m) * (r6m - r3m),
-                np.where(
-                    dte < d1y,
-                    r6m + (dte - d6m) / (d1y - d6m) * (r1y - r6m),
-                    r1y,
-                ),
-            ),
-        )
-
+        curves = YieldCurveCache.from_columns(df, TENOR_COLUMNS)
         df = df.copy()
-        df["rate"] = rate
+        df["rate"] = curves.rate(df["trade_date"], df["dte"].to_numpy(dtype=np.float64))
         return df
 
     def _compute_quant(self, df: pd.DataFrame) -> pd.DataFrame:
-        T         = df["dte"].to_numpy(dtype=np.float64) / 365.0
-        spot      = df["spot"].to_numpy(dtype=np.float64)
-        rate      = df["rate"].to_numpy(dtype=np.float64)
-        div_yield = df["div_yield"].to_numpy(dtype=np.float64) / 100.0
-        settle    = df["settle"].to_numpy(dtype=np.float64)
-
+        results = compute_futures_batch(df)
         df = df.copy()
-        df["theoretical_price"] = spot * np.exp((rate - div_yield) * T)
-        df["basis"]             = settle - df["theoretical_price"]
-        df["delta"]             = 1.0
+        for col in FUTURES_QUANT_COLS:
+            df[col] = results[col]
         return df
 
     def _drop_rate_tenor_cols(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -130,8 +104,8 @@ class CuratedFuturesBuilder:
         total       = len(df)
         null_theo   = df["theoretical_price"].isna().sum()
         self.logger.info(
-            "Year %d: total=%d | null_theoretical_price=%d",
-            year, total, null_theo,
+            "Year %d: total=%d | null_theoretical_price=%d | median_implied_repo=%.4f",
+            year, total, null_theo, df["implied_repo"].median(),
         )
 
     def _deduplicate(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -149,7 +123,7 @@ class CuratedFuturesBuilder:
             "open", "high", "low", "close", "settle",
             "contracts", "open_interest", "chg_in_oi",
             "spot", "div_yield", "rate",
-            "theoretical_price", "basis", "delta",
+            *FUTURES_QUANT_COLS,
         }
         missing = required - set(df.columns)
         if missing:
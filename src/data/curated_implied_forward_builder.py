@@ -0,0 +1,161 @@
+import logging
+import numpy as np
+import pandas as pd
+from src.core.fetch_config import FetchConfig
+from src.db.connection import DuckDBConnection
+from src.db.processed_registry import ProcessedRegistry
+from src.quant.implied_forward import implied_forwards, FORWARD_COLS, PARITY_KEY
+from src.quant.yield_curve import YieldCurveCache, TENOR_COLUMNS
+
+QUERY = """
+    SELECT
+        o.trade_date,
+        o.symbol,
+        o.expiry_date,
+        o.strike,
+        o.option_type,
+        o.settle,
+        o.dte,
+        s.close      AS spot,
+        g3.yield_pct AS rate_3m,
+        g6.yield_pct AS rate_6m,
+        g1.yield_pct AS rate_1y
+    FROM v_processed_options o
+    JOIN v_processed_index_spot s
+        ON o.trade_date = s.trade_date AND o.symbol = s.symbol
+    JOIN v_processed_gbond g3
+        ON o.trade_date = g3.trade_date AND g3.tenor = '3m'
+    JOIN v_processed_gbond g6
+        ON o.trade_date = g6.trade_date AND g6.tenor = '6m'
+    JOIN v_processed_gbond g1
+        ON o.trade_date = g1.trade_date AND g1.tenor = '1y'
+"""
+
+
+class CuratedImpliedForwardBuilder:
+
+    def __init__(self, config: FetchConfig):
+        self.config = config
+        self.output_root = config.curated_dir / "implied_forward"
+
+        conn = DuckDBConnection(config.duckdb_path)
+        reg = ProcessedRegistry(conn, config)
+        reg.register_all()
+        self.con = conn.get()
+
+        logging.basicConfig(
+            filename=config.logs_dir / "data_pipeline_fetch.log",
+            level=logging.INFO,
+            format="%(asctime)s | %(name)s | %(levelname)s | %(message)s"
+        )
+        self.logger = logging.getLogger("Curated_ImpliedForward")
+
+    def _get_available_years(self) -> list[int]:
+        result = self.con.execute("""
+            SELECT DISTINCT YEAR(trade_date) AS yr
+            FROM v_processed_options
+            ORDER BY yr
+        """).df()
+        return result["yr"].tolist()
+
+    def _get_latest_trade_date(self, year: int):
+        path = self.output_root / str(year) / f"curated_implied_forward_{year}.parquet"
+        if not path.exists():
+            return None
+        df = pd.read_parquet(path, columns=["trade_date"])
+        df["trade_date"] = pd.to_datetime(df["trade_date"]).dt.date
+        return df["trade_date"].max()
+
+    def _query_year(self, year: int, since_date=None) -> pd.DataFrame:
+        where = f"WHERE YEAR(o.trade_date) = {year}"
+        if since_date is not None:
+            where += f" AND o.trade_date > '{since_date}'"
+        df = self.con.execute(QUERY + " " + where).df()
+        self.logger.info("Year %d: queried %d rows", year, len(df))
+        return df
+
+    def _interpolate_rates(self, df: pd.DataFrame) -> pd.DataFrame:
+        curves = YieldCurveCache.from_columns(df, TENOR_COLUMNS)
+        df = df.copy()
+        df["rate"] = curves.rate(df["trade_date"], df["dte"].to_numpy(dtype=np.float64))
+        return df
+
+    def _log_summary(self, df: pd.DataFrame, year: int):
+        self.logger.info(
+            "Year %d: expiries=%d | null_forward=%d | median_implied_div_yield=%.3f%%",
+            year, len(df), df["forward"].isna().sum(), df["implied_div_yield"].median()
+        )
+
+    def _deduplicate(self, df: pd.DataFrame) -> pd.DataFrame:
+        before = len(df)
+        df = df.drop_duplicates(subset=PARITY_KEY)
+        dropped = before - len(df)
+        if dropped:
+            self.logger.warning("Deduplicated %d rows", dropped)
+        return df
+
+    def _validate_schema(self, df: pd.DataFrame):
+        missing = set(FORWARD_COLS) - set(df.columns)
+        if missing:
+            raise ValueError(f"Schema validation failed. Missing columns: {missing}")
+        for col in PARITY_KEY:
+            if df[col].isnull().any():
+                raise ValueError(f"Null values found in required column: {col}")
+
+    def _write_partitioned(self, df: pd.DataFrame, year: int, mode: str):
+        out_path = self.output_root / str(year) / f"curated_implied_forward_{year}.parquet"
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+
+        df = df.copy()
+        df["trade_date"]  = pd.to_datetime(df["trade_date"]).dt.date
+        df["expiry_date"] = pd.to_datetime(df["expiry_date"]).dt.date
+
+        if mode == "incremental" and out_path.exists():
+            existing = pd.read_parquet(out_path)
+            existing["trade_date"]  = pd.to_datetime(existing["trade_date"]).dt.date
+            existing["expiry_date"] = pd.to_datetime(existing["expiry_date"]).dt.date
+            df = self._deduplicate(pd.concat([existing, df], ignore_index=True))
+
+        df = df.sort_values(PARITY_KEY).reset_index(drop=True)
+        df.to_parquet(out_path, index=False)
+        self.logger.info("Year %d: written %d rows to %s", year, len(df), out_path)
+
+    def _process_year(self, year: int, mode: str):
+        self.logger.info("Processing year %d | mode=%s", year, mode)
+        since = self._get_latest_trade_date(year) if mode == "incremental" else None
+        df    = self._query_year(year, since_date=since)
+
+        if df.empty:
+            self.logger.info("Year %d: no new rows. Skipping.", year)
+            return
+
+        df = self._interpolate_rates(df)
+        forwards = implied_forwards(df)
+        if forwards.empty:
+            self.logger.info("Year %d: no matched CE/PE pairs. Skipping.", year)
+            return
+
+        self._log_summary(forwards, year)
+        forwards = self._deduplicate(forwards)
+        self._validate_schema(forwards)
+        self._write_partitioned(forwards, year, mode)
+
+    def build_all(self):
+        years = self._get_available_years()
+        for year in years:
+            self._process_year(year, "full")
+        self.logger.info("Full build complete.")
+
+    def build_incremental(self):
+        years = self._get_available_years()
+        for year in years:
+            self._process_year(year, "incremental")
+        self.logger.info("Incremental build complete.")
+
+    def run(self, mode: str):
+        if mode == "full":
+            self.build_all()
+        elif mode == "incremental":
+            self.build_incremental()
+        else:
+            raise ValueError(f"Invalid mode: '{mode}'. Expected 'full' or 'incremental'.")
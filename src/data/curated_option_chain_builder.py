@@ -1,10 +1,18 @@
 import logging
+import os
+from pathlib import Path
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from src.core.fetch_config import FetchConfig
 from src.db.connection import DuckDBConnection
+from src.db.curated_registry import LEGACY_LAYOUTS
 from src.db.processed_registry import ProcessedRegistry
-from src.quant.bs_vectorized import compute_batch
+from src.quant.bs_vectorized import compute_batch, HIGHER_ORDER_GREEKS, Q_SOURCES
+from src.quant.implied_forward import implied_forwards, attach_implied_div_yield
+from src.quant.arbitrage import arbitrage_flags, arbitrage_summary
+from src.quant.yield_curve import YieldCurveCache, TENOR_COLUMNS
 
 QUERY = """
     SELECT
@@ -30,7 +38,7 @@ QUERY = """
     FROM v_processed_options o
     JOIN v_processed_index_spot s
         ON o.trade_date = s.trade_date AND o.symbol = s.symbol
-    JOIN v_processed_index_yield y
+    {yield_join} v_processed_index_yield y
         ON o.trade_date = y.trade_date AND o.symbol = y.symbol
     JOIN v_processed_gbond g3
         ON o.trade_date = g3.trade_date AND g3.tenor = '3m'
@@ -40,12 +48,52 @@ QUERY = """
         ON o.trade_date = g1.trade_date AND g1.tenor = '1y'
 """
 
+# hive layout: option_chain/symbol=NIFTY/year=2024/month=10/part-0.parquet. a chain
+# lookup opens one month of one symbol, and rows sorted by date / expiry / strike
+# give row groups tight min/max statistics within it
+KEY             = ["trade_date", "symbol", "expiry_date", "strike", "option_type"]
+SORT_KEY        = ["trade_date", "expiry_date", "strike", "option_type"]
+ROW_GROUP_ROWS  = 16_384
+DICTIONARY_COLS = ["symbol", "option_type"]
+PART_FILE       = "part-0.parquet"
+
+
+def partition_path(root: Path, symbol: str, year: int, month: int) -> Path:
+    return root / f"symbol={symbol}" / f"year={year}" / f"month={month}" / PART_FILE
+
+
+def legacy_files(root: Path) -> list[Path]:
+    # pre-hive layout: option_chain/2024/curated_options_2024.parquet
+    return sorted(root.glob(LEGACY_LAYOUTS["option_chain"]))
+
+
+def write_partition(df: pd.DataFrame, path: Path):
+    # partition values live in the path; the file keeps symbol so it stays self-describing
+    df    = df.drop(columns=["year", "month"], errors="ignore")
+    df    = df.sort_values(SORT_KEY).reset_index(drop=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    pq.write_table(
+        table, tmp,
+        compression="zstd",
+        row_group_size=ROW_GROUP_ROWS,
+        use_dictionary=[c for c in DICTIONARY_COLS if c in table.column_names],
+        write_statistics=True,
+        write_page_index=True,
+    )
+    os.replace(tmp, path)
+
 
 class CuratedOptionChainBuilder:
 
-    def __init__(self, config: FetchConfig):
+    def __init__(self, config: FetchConfig, higher_order_greeks: bool = False, q_source: str = "index_yield"):
+        if q_source not in Q_SOURCES:
+            raise ValueError(f"Invalid q_source: '{q_source}'. Expected one of {Q_SOURCES}.")
         self.config = config
         self.output_root = config.curated_dir / "option_chain"
+        self.higher_order_greeks = higher_order_greeks
+        self.q_source = q_source
 
         conn = DuckDBConnection(config.duckdb_path)
         reg = ProcessedRegistry(conn, config)
@@ -67,59 +115,57 @@ class CuratedOptionChainBuilder:
         """).df()
         return result["yr"].tolist()
 
+    def _year_files(self, year: int) -> list[Path]:
+        return sorted(self.output_root.glob(f"symbol=*/year={year}/month=*/{PART_FILE}"))
+
     def _get_latest_trade_date(self, year: int):
-        path = self.output_root / str(year) / f"curated_options_{year}.parquet"
-        if not path.exists():
+        files = self._year_files(year)
+        if not files:
             return None
-        df = pd.read_parquet(path, columns=["trade_date"])
-        df["trade_date"] = pd.to_datetime(df["trade_date"]).dt.date
-        return df["trade_date"].max()
+        latest = [pd.to_datetime(pd.read_parquet(f, columns=["trade_date"])["trade_date"]).max() for f in files]
+        return max(latest).date()
 
     def _query_year(self, year: int, since_date=None) -> pd.DataFrame:
         where = f"WHERE YEAR(o.trade_date) = {year}"
         if since_date is not None:
             where += f" AND o.trade_date > '{since_date}'"
-        df = self.con.execute(QUERY + " " + where).df()
+        # implied mode keeps days the index-yield fetch missed; parity supplies q
+        yield_join = "LEFT JOIN" if self.q_source == "implied" else "JOIN"
+        df = self.con.execute(QUERY.format(yield_join=yield_join) + " " + where).df()
         self.logger.info("Year %d: queried %d rows", year, len(df))
         return df
 
     def _interpolate_rates(self, df: pd.DataFrame) -> pd.DataFrame:
-        dte = df["dte"].to_numpy(dtype=np.float64)
-        r3m = df["rate_3m"].to_numpy(dtype=np.float64) / 100
-        r6m = df["rate_6m"].to_numpy(dtype=np.float64) / 100
-        r1y = df["rate_1y"].to_numpy(dtype=np.float64) / 100
-
-        d3m = 91.0
-        d6m = 182.0
-        d1y = 365.0
-
-        rate = np.where(
-            dte < d3m,
-            r3m,
-            np.where(
-                dte < d6m,
-                r3m + (dte - d3m) / (d6m - d3m) * (r6m - r3m),
-                np.where(
-                    dte < d1y,
-                    r6m + (dte - d6m) / (d1y - d6m) * (r1y - r6m),
-                    r1y
-                )
-            )
-        )
-
+        curves = YieldCurveCache.from_columns(df, TENOR_COLUMNS)
         df = df.copy()
-        df["rate"] = rate
+        df["rate"] = curves.rate(df["trade_date"], df["dte"].to_numpy(dtype=np.float64))
+        return df
+
+    def _attach_implied_yield(self, df: pd.DataFrame) -> pd.DataFrame:
+        forwards = implied_forwards(df)
+        df = attach_implied_div_yield(df, forwards)
+        missing = df["implied_div_yield"].isna().sum()
+        self.logger.info(
+            "Implied forwards: expiries=%d | rows without parity q=%d", len(forwards), missing
+        )
         return df
 
     def _compute_quant(self, df: pd.DataFrame) -> pd.DataFrame:
-        results = compute_batch(df)
+        results = compute_batch(df, higher_order=self.higher_order_greeks, q_source=self.q_source)
         df = df.copy()
+        if self.q_source == "implied":
+            # store the q the IV was solved with so downstream repricing stays consistent
+            df["div_yield"] = df["implied_div_yield"].fillna(df["div_yield"])
         df["iv"]    = results["iv"]
         df["delta"] = results["delta"]
         df["gamma"] = results["gamma"]
         df["vega"]  = results["vega"]
         df["theta"] = results["theta"]
         df["rho"]   = results["rho"]
+        if self.higher_order_greeks:
+            for col in HIGHER_ORDER_GREEKS:
+                df[col] = results[col]
+        df["arb_flag"] = arbitrage_flags(df)
         return df
 
     def _drop_rate_tenor_cols(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -133,11 +179,13 @@ class CuratedOptionChainBuilder:
             "Year %d: total=%d | null_iv=%d (%.1f%%) | computed=%d",
             year, total, null_iv, pct, total - null_iv
         )
+        self.logger.info(
+            "Year %d: arbitrage flags %s", year, arbitrage_summary(df["arb_flag"].to_numpy())
+        )
 
     def _deduplicate(self, df: pd.DataFrame) -> pd.DataFrame:
-        key    = ["trade_date", "symbol", "expiry_date", "strike", "option_type"]
         before = len(df)
-        df     = df.drop_duplicates(subset=key)
+        df     = df.drop_duplicates(subset=KEY)
         dropped = before - len(df)
         if dropped:
             self.logger.warning("Deduplicated %d rows", dropped)
@@ -149,8 +197,10 @@ class CuratedOptionChainBuilder:
             "open", "high", "low", "close", "settle",
             "contracts", "open_interest", "chg_in_oi", "dte",
             "spot", "div_yield", "rate",
-            "iv", "delta", "gamma", "vega", "theta", "rho"
+            "iv", "delta", "gamma", "vega", "theta", "rho", "arb_flag"
         }
+        if self.higher_order_greeks:
+            required |= set(HIGHER_ORDER_GREEKS)
         missing = required - set(df.columns)
         if missing:
             raise ValueError(f"Schema validation failed. Missing columns: {missing}")
@@ -159,32 +209,31 @@ class CuratedOptionChainBuilder:
                 raise ValueError(f"Null values found in required column: {col}")
 
     def _write_partitioned(self, df: pd.DataFrame, year: int, mode: str):
-        out_path = self.output_root / str(year) / f"curated_options_{year}.parquet"
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-
-        if mode == "incremental" and out_path.exists():
-            existing = pd.read_parquet(out_path)
-            existing = existing.copy()
-            existing["trade_date"] = pd.to_datetime(existing["trade_date"]).dt.date
-            existing["expiry_date"] = pd.to_datetime(existing["expiry_date"]).dt.date
-            df = df.copy()
-            df["trade_date"] = pd.to_datetime(df["trade_date"]).dt.date
-            df["expiry_date"] = pd.to_datetime(df["expiry_date"]).dt.date
-            combined = pd.concat([existing, df], ignore_index=True)
-            df = self._deduplicate(combined)
-
         df = df.copy()
-        df["trade_date"] = pd.to_datetime(df["trade_date"]).dt.date
+        df["trade_date"]  = pd.to_datetime(df["trade_date"]).dt.date
         df["expiry_date"] = pd.to_datetime(df["expiry_date"]).dt.date
+        months  = pd.to_datetime(df["trade_date"]).dt.month
+        written = set()
 
-        df = df.sort_values(
-            ["trade_date", "symbol", "expiry_date", "strike", "option_type"]
-        ).reset_index(drop=True)
+        for (symbol, month), part in df.groupby([df["symbol"], months], sort=True):
+            out_path = partition_path(self.output_root, symbol, year, month)
+            # incremental only rewrites the partitions the new days fall into
+            if mode == "incremental" and out_path.exists():
+                existing = pd.read_parquet(out_path)
+                existing["trade_date"]  = pd.to_datetime(existing["trade_date"]).dt.date
+                existing["expiry_date"] = pd.to_datetime(existing["expiry_date"]).dt.date
+                part = self._deduplicate(pd.concat([existing, part], ignore_index=True))
+            write_partition(part, out_path)
+            written.add(out_path)
+            self.logger.info(
+                "Year %d: written %d rows to %s", year, len(part), out_path
+            )
 
-        df.to_parquet(out_path, index=False)
-        self.logger.info(
-            "Year %d: written %d rows to %s", year, len(df), out_path
-        )
+        if mode == "full":
+            # a full build owns the year; drop partitions it no longer produces
+            for stale in set(self._year_files(year)) - written:
+                stale.unlink()
+                self.logger.info("Year %d: removed stale partition %s", year, stale)
 
     def _process_year(self, year: int, mode: str):
         self.logger.info("Processing year %d | mode=%s", year, mode)
@@ -196,6 +245,8 @@ class CuratedOptionChainBuilder:
             return
 
         df = self._interpolate_rates(df)
+        if self.q_source == "implied":
+            df = self._attach_implied_yield(df)
         df = self._compute_quant(df)
         df = self._drop_rate_tenor_cols(df)
         self._log_null_summary(df, year)
@@ -215,7 +266,18 @@ class CuratedOptionChainBuilder:
             self._process_year(year, "incremental")
         self.logger.info("Incremental build complete.")
 
+    def _check_layout(self):
+        # the views read year files the old way while any are left, so a partition
+        # written next to them would stay invisible until the migration merges it
+        legacy = legacy_files(self.output_root)
+        if legacy:
+            raise RuntimeError(
+                f"Found {len(legacy)} year files in the pre-hive layout under {self.output_root}. "
+                f"Run scripts/migrate_option_chain_layout.py before building."
+            )
+
     def run(self, mode: str):
+        self._check_layout()
         if mode == "full":
             self.build_all()
         elif mode == "incremental":
@@ -0,0 +1,159 @@
+import logging
+import os
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from src.core.fetch_config import FetchConfig
+from src.db.connection import DuckDBConnection
+from src.db.curated_registry import CuratedRegistry
+from src.quant.vol_surface import fit_svi_surface, SURFACE_COLS, SLICE_KEY
+
+QUERY = """
+    SELECT
+        trade_date,
+        symbol,
+        expiry_date,
+        strike,
+        option_type,
+        dte,
+        spot,
+        div_yield,
+        rate,
+        iv
+    FROM v_curated_option_chain
+    WHERE iv IS NOT NULL
+"""
+
+
+class CuratedVolSurfaceBuilder:
+
+    def __init__(self, config: FetchConfig, workers: int | None = None):
+        self.config = config
+        self.output_root = config.curated_dir / "vol_surface"
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+
+        conn = DuckDBConnection(config.duckdb_path)
+        reg = CuratedRegistry(conn, config)
+        reg.register_all()
+        self.con = conn.get()
+
+        logging.basicConfig(
+            filename=config.logs_dir / "data_pipeline_fetch.log",
+            level=logging.INFO,
+            format="%(asctime)s | %(name)s | %(levelname)s | %(message)s"
+        )
+        self.logger = logging.getLogger("Curated_VolSurface")
+
+    def _get_available_years(self) -> list[int]:
+        result = self.con.execute("""
+            SELECT DISTINCT YEAR(trade_date) AS yr
+            FROM v_curated_option_chain
+            ORDER BY yr
+        """).df()
+        return result["yr"].tolist()
+
+    def _get_latest_trade_date(self, year: int):
+        path = self.output_root / str(year) / f"curated_vol_surface_{year}.parquet"
+        if not path.exists():
+            return None
+        df = pd.read_parquet(path, columns=["trade_date"])
+        df["trade_date"] = pd.to_datetime(df["trade_date"]).dt.date
+        return df["trade_date"].max()
+
+    def _query_year(self, year: int, since_date=None) -> pd.DataFrame:
+        where = f" AND YEAR(trade_date) = {year}"
+        if since_date is not None:
+            where += f" AND trade_date > '{since_date}'"
+        df = self.con.execute(QUERY + where).df()
+        self.logger.info("Year %d: queried %d rows with IV", year, len(df))
+        return df
+
+    def _fit_parallel(self, df: pd.DataFrame) -> pd.DataFrame:
+        chunks = [grp for _, grp in df.groupby("trade_date", sort=True)]
+        if self.workers == 1 or len(chunks) == 1:
+            fitted = [fit_svi_surface(chunk) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                fitted = list(pool.map(fit_svi_surface, chunks))
+        fitted = [f for f in fitted if not f.empty]
+        if not fitted:
+            return pd.DataFrame(columns=SURFACE_COLS)
+        return pd.concat(fitted, ignore_index=True)
+
+    def _log_fit_summary(self, df: pd.DataFrame, year: int):
+        self.logger.info(
+            "Year %d: slices=%d | median_rmse=%.2e | max_rmse=%.2e",
+            year, len(df), df["rmse"].median(), df["rmse"].max()
+        )
+
+    def _deduplicate(self, df: pd.DataFrame) -> pd.DataFrame:
+        before = len(df)
+        df = df.drop_duplicates(subset=SLICE_KEY)
+        dropped = before - len(df)
+        if dropped:
+            self.logger.warning("Deduplicated %d rows", dropped)
+        return df
+
+    def _validate_schema(self, df: pd.DataFrame):
+        missing = set(SURFACE_COLS) - set(df.columns)
+        if missing:
+            raise ValueError(f"Schema validation failed. Missing columns: {missing}")
+        for col in SLICE_KEY:
+            if df[col].isnull().any():
+                raise ValueError(f"Null values found in required column: {col}")
+
+    def _write_partitioned(self, df: pd.DataFrame, year: int, mode: str):
+        out_path = self.output_root / str(year) / f"curated_vol_surface_{year}.parquet"
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+
+        df = df.copy()
+        df["trade_date"]  = pd.to_datetime(df["trade_date"]).dt.date
+        df["expiry_date"] = pd.to_datetime(df["expiry_date"]).dt.date
+
+        if mode == "incremental" and out_path.exists():
+            existing = pd.read_parquet(out_path)
+            existing["trade_date"]  = pd.to_datetime(existing["trade_date"]).dt.date
+            existing["expiry_date"] = pd.to_datetime(existing["expiry_date"]).dt.date
+            df = self._deduplicate(pd.concat([existing, df], ignore_index=True))
+
+        df = df.sort_values(SLICE_KEY).reset_index(drop=True)
+        df.to_parquet(out_path, index=False)
+        self.logger.info("Year %d: written %d slices to %s", year, len(df), out_path)
+
+    def _process_year(self, year: int, mode: str):
+        self.logger.info("Processing year %d | mode=%s", year, mode)
+        since = self._get_latest_trade_date(year) if mode == "incremental" else None
+        df    = self._query_year(year, since_date=since)
+
+        if df.empty:
+            self.logger.info("Year %d: no new rows. Skipping.", year)
+            return
+
+        surface = self._fit_parallel(df)
+        if surface.empty:
+            self.logger.info("Year %d: no slice had enough points to fit. Skipping.", year)
+            return
+
+        self._log_fit_summary(surface, year)
+        surface = self._deduplicate(surface)
+        self._validate_schema(surface)
+        self._write_partitioned(surface, year, mode)
+
+    def build_all(self):
+        years = self._get_available_years()
+        for year in years:
+            self._process_year(year, "full")
+        self.logger.info("Full build complete.")
+
+    def build_incremental(self):
+        years = self._get_available_years()
+        for year in years:
+            self._process_year(year, "incremental")
+        self.logger.info("Incremental build complete.")
+
+    def run(self, mode: str):
+        if mode == "full":
+            self.build_all()
+        elif mode == "incremental":
+            self.build_incremental()
+        else:
+            raise ValueError(f"Invalid mode: '{mode}'. Expected 'full' or 'incremental'.")
@@ -1,15 +1,113 @@
-import duckdb
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator, Optional
+
+import duckdb
+
+logger = logging.getLogger("DuckDBConnectionPool")
+
 
 class DuckDBConnection:
 
-    def __init__(self, db_path: Path):
-        self.db_path = db_path
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.con = duckdb.connect(str(self.db_path))
+    def __init__(
+        self,
+        db_path: Path,
+        threads: Optional[int] = None,
+        memory_limit: Optional[str] = None,
+        read_only: bool = False,
+    ):
+        self.db_path   = db_path
+        self.read_only = read_only
+        if not read_only:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        config = {}
+        if threads:
+            config["threads"] = int(threads)
+        if memory_limit:
+            config["memory_limit"] = str(memory_limit)
+        self.con = duckdb.connect(str(self.db_path), read_only=read_only, config=config)
 
     def get(self) -> duckdb.DuckDBPyConnection:
         return self.con
 
     def close(self):
         self.con.close()
+
+
+class DuckDBConnectionPool:
+    # bounded set of cursors over one database instance; every cursor sees the
+    # views registered on the parent connection and shares its threads/memory_limit
+
+    def __init__(self, db_conn: DuckDBConnection, size: int = 8, timeout_s: float = 30.0, slow_wait_s: float = 0.5):
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1. Got: {size}")
+        self.db_conn     = db_conn
+        self.size        = size
+        self.timeout_s   = timeout_s
+        self.slow_wait_s = slow_wait_s
+
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+        for _ in range(size):
+            self._idle.put(db_conn.get().cursor())
+
+        self._lock        = threading.Lock()
+        self.acquisitions = 0
+        self.timeouts     = 0
+        self.in_use       = 0
+        self.peak_in_use  = 0
+        self.total_wait_s = 0.0
+        self.max_wait_s   = 0.0
+
+    def acquire(self) -> duckdb.DuckDBPyConnection:
+        start = time.perf_counter()
+        try:
+            cur = self._idle.get(timeout=self.timeout_s)
+        except queue.Empty:
+            with self._lock:
+                self.timeouts += 1
+            raise TimeoutError(f"No DuckDB cursor free after {self.timeout_s:.1f}s (pool size {self.size}).")
+        waited = time.perf_counter() - start
+
+        with self._lock:
+            self.acquisitions += 1
+            self.in_use       += 1
+            self.peak_in_use   = max(self.peak_in_use, self.in_use)
+            self.total_wait_s += waited
+            self.max_wait_s    = max(self.max_wait_s, waited)
+        if waited > self.slow_wait_s:
+            logger.warning("Waited %.3fs for a DuckDB cursor (pool size %d)", waited, self.size)
+        return cur
+
+    def release(self, cur: duckdb.DuckDBPyConnection):
+        with self._lock:
+            self.in_use -= 1
+        self._idle.put(cur)
+
+    @contextmanager
+    def cursor(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        cur = self.acquire()
+        try:
+            yield cur
+        finally:
+            self.release(cur)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size":          self.size,
+                "in_use":        self.in_use,
+                "peak_in_use":   self.peak_in_use,
+                "acquisitions":  self.acquisitions,
+                "timeouts":      self.timeouts,
+                "mean_wait_ms":  round(1000 * self.total_wait_s / self.acquisitions, 3) if self.acquisitions else 0.0,
+                "max_wait_ms":   round(1000 * self.max_wait_s, 3),
+            }
+
+    def close(self):
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+        self.db_conn.close()
@@ -2,13 +2,21 @@ import logging
 import re
 from pathlib import Path
 from src.db.connection import DuckDBConnection
+from src.db.manifest import checked_datasets, column_types, file_list, load_manifest
+from src.db.typed_views import typed_select
+
+# datasets that used to be one file per year. while any such file is left, the folder
+# is read the old way: the year files only, without hive partitioning, which fails on
+# a mix of layouts. year / month are derived so the partition predicates still bind
+LEGACY_LAYOUTS = {"option_chain": "[0-9][0-9][0-9][0-9]/curated_options_*.parquet"}
 
 
 class CuratedRegistry:
 
-    def __init__(self, db_conn: DuckDBConnection, config):
+    def __init__(self, db_conn: DuckDBConnection, config, use_manifest: bool = False):
         self.con = db_conn.get()
         self.curated_root = config.curated_dir
+        self.use_manifest = use_manifest
         self._registered: list[str] = []
 
         logging.basicConfig(
@@ -27,25 +35,69 @@ class CuratedRegistry:
             if not has_parquet:
                 self.logger.warning("No parquet found, skipping: %s", folder.name)
                 continue
-            name = re.sub(r'(?<!^)(?=[A-Z])', '_', folder.name).lower()
-            view_name = f"v_curated_{name}"
-            view_map[view_name] = folder
+            view_map[self._view_name(folder.name)] = folder
         return view_map
 
+    def _view_name(self, folder_name: str) -> str:
+        name = re.sub(r'(?<!^)(?=[A-Z])', '_', folder_name).lower()
+        return f"v_curated_{name}"
+
+    def _sources(self) -> dict[str, tuple[Path, str, bool, dict | None]]:
+        # view -> (folder, read_parquet files, union_by_name, column types). the manifest's
+        # explicit lists skip the walk, and its schema hashes say whether files need
+        # unioning by name, which otherwise reads every footer when the view is bound.
+        # datasets the manifest no longer matches are discovered
+        manifest = load_manifest(self.curated_root) if self.use_manifest else None
+        if manifest is not None:
+            sources = {}
+            for name, dataset in checked_datasets(self.curated_root, manifest, self.logger).items():
+                folder = self.curated_root / name
+                if dataset is None:
+                    sources[self._view_name(name)] = (folder, f"'{folder / '**' / '*.parquet'}'", True, None)
+                else:
+                    sources[self._view_name(name)] = (
+                        folder, file_list(folder, dataset), len(dataset["schemas"]) > 1, column_types(dataset),
+                    )
+            return sources
+        return {
+            view_name: (folder, f"'{folder / '**' / '*.parquet'}'", True, None)
+            for view_name, folder in self._discover_views().items()
+        }
+
+    def _legacy_source(self, folder_path: Path) -> str | None:
+        pattern = LEGACY_LAYOUTS.get(folder_path.name)
+        if pattern is None or not any(folder_path.glob(pattern)):
+            return None
+        if any(folder_path.glob("*=*")):
+            self.logger.warning(
+                "%s mixes year files with hive partitions; serving the year files only. "
+                "Run scripts/migrate_option_chain_layout.py.", folder_path,
+            )
+        else:
+            self.logger.warning("%s is in the pre-hive layout; run scripts/migrate_option_chain_layout.py.", folder_path)
+        return f"""(
+                SELECT *, YEAR(trade_date) AS year, MONTH(trade_date) AS month
+                FROM read_parquet('{folder_path / pattern}', hive_partitioning=false, union_by_name=true)
+            )"""
+
     def register_all(self):
         if not self.curated_root.exists():
             raise FileNotFoundError(f"Curated root not found: {self.curated_root}")
 
-        view_map = self._discover_views()
+        view_map = self._sources()
 
         if not view_map:
             raise RuntimeError("No valid curated folders discovered. Cannot proceed.")
 
-        for view_name, folder_path in view_map.items():
-            glob_pattern = str(folder_path / "**" / "*.parquet")
+        for view_name, (folder_path, files, union_by_name, schema) in view_map.items():
+            union  = "true" if union_by_name else "false"
+            source = f"read_parquet({files}, hive_partitioning=true, union_by_name={union})"
+            legacy = self._legacy_source(folder_path)
+            if legacy is not None:
+                source, schema = legacy, None
             self.con.execute(f"""
                 CREATE OR REPLACE VIEW {view_name} AS
-                SELECT * FROM read_parquet('{glob_pattern}', hive_partitioning=false)
+                {typed_select(self.con, source, view_name, self.logger, schema)}
             """)
             self._registered.append(view_name)
             self.logger.info("Registered curated view: %s → %s", view_name, folder_path)
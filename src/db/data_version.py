@@ -0,0 +1,67 @@
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+
+
+def _walk_parquet(root: Path) -> Iterable[os.DirEntry]:
+    try:
+        entries = list(os.scandir(root))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_parquet(Path(entry.path))
+        elif entry.name.endswith(".parquet"):
+            yield entry
+
+
+class DataVersion:
+    # fingerprint of every parquet file the API views read from. any write the
+    # pipeline publishes (new day, rebuilt year, fresh download) changes it.
+    # the walk is throttled to once per ttl_s
+
+    def __init__(self, roots: list[Path], ttl_s: float = 5.0):
+        self.roots   = [Path(r) for r in roots]
+        self.ttl_s   = ttl_s
+        self._lock   = threading.Lock()
+        self._value: str | None = None
+        self._newest     = 0.0
+        self._checked_at = 0.0
+
+    def _scan(self) -> tuple[str, float]:
+        digest = hashlib.sha1()
+        files  = 0
+        newest = 0.0
+        for root in self.roots:
+            for entry in sorted(_walk_parquet(root), key=lambda e: e.path):
+                st = entry.stat()
+                digest.update(f"{os.path.relpath(entry.path, root)}|{st.st_size}|{st.st_mtime_ns}\n".encode())
+                files += 1
+                newest = max(newest, st.st_mtime)
+        return f"{files}-{digest.hexdigest()[:12]}", newest
+
+    def compute(self) -> str:
+        return self._scan()[0]
+
+    def current(self) -> str:
+        with self._lock:
+            now = time.monotonic()
+            if self._value is None or now - self._checked_at >= self.ttl_s:
+                self._value, self._newest = self._scan()
+                self._checked_at = now
+            return self._value
+
+    def last_modified(self) -> float:
+        # newest Parquet mtime (epoch seconds) as of the current version
+        self.current()
+        return self._newest
+
+    def refresh(self) -> str:
+        # skip the ttl, e.g. right after the pipeline has written
+        with self._lock:
+            self._checked_at = 0.0
+            self._value      = None
+        return self.current()
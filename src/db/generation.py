@@ -0,0 +1,162 @@
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+from src.db.connection import DuckDBConnectionPool
+
+logger = logging.getLogger("DataGeneration")
+
+
+class Generation:
+    # one opened database (snapshot or Parquet views) with its cursor pool and the
+    # data version it serves. requests hold a reference for as long as they run;
+    # once retired, the last request out closes it
+
+    def __init__(self, pool: DuckDBConnectionPool, version: str, updated: float, source: str):
+        self.pool      = pool
+        self.version   = version
+        self.updated   = updated
+        self.source    = source
+        self.number    = 0
+        self.loaded_at = time.time()
+        self.refs      = 0
+        self.retired   = False
+        self.closed    = False
+
+    def close(self):
+        self.pool.close()
+
+    def describe(self) -> dict:
+        return {
+            "generation":   self.number,
+            "data_version": self.version,
+            "source":       self.source,
+            "loaded_at":    datetime.fromtimestamp(self.loaded_at, timezone.utc).isoformat(timespec="seconds"),
+            "in_flight":    self.refs,
+        }
+
+
+class GenerationCursor:
+    # what a request gets as `db`: a cursor from one generation's pool, tagged with
+    # that generation so anything cached from its rows can be keyed on its data
+    # version rather than on whichever one is active by the time it is stored.
+    # the cursor is taken on first use, so a request that never queries (a cache
+    # hit, a coalesced follower) never holds one
+
+    def __init__(self, generation: Generation):
+        self.generation = generation
+        self._cur       = None
+
+    def cursor(self):
+        if self._cur is None:
+            self._cur = self.generation.pool.acquire()
+        return self._cur
+
+    def release(self):
+        if self._cur is not None:
+            cur, self._cur = self._cur, None
+            self.generation.pool.release(cur)
+
+    def __getattr__(self, name):
+        return getattr(self.cursor(), name)
+
+
+def data_version_of(db) -> str | None:
+    # None for a bare cursor (scripts, tests), which then shares one cache namespace
+    generation = getattr(db, "generation", None)
+    return generation.version if generation is not None else None
+
+
+class GenerationHolder:
+    # the active generation, swapped atomically. checkout/checkin count in-flight
+    # requests so a swap never closes a database a request is still reading
+
+    def __init__(self, opener: Callable[[], Generation], drain_timeout_s: float = 60.0):
+        self.opener          = opener
+        self.drain_timeout_s = drain_timeout_s
+        self.swaps           = 0
+        self._active: Generation | None = None
+        self._cond      = threading.Condition()
+        # one open at a time: concurrent first requests would each register views
+        self._open_lock = threading.Lock()
+
+    def current(self) -> Generation:
+        # no lock once open: a reload holds _open_lock while it builds the next one
+        generation = self._active
+        if generation is not None:
+            return generation
+        with self._open_lock:
+            if self._active is None:
+                generation = self.opener()
+                with self._cond:
+                    generation.number = 1
+                    self._active = generation
+            return self._active
+
+    def checkout(self) -> Generation:
+        self.current()
+        with self._cond:
+            generation = self._active
+            generation.refs += 1
+            return generation
+
+    def checkin(self, generation: Generation):
+        with self._cond:
+            generation.refs -= 1
+            close = self._take_close(generation)
+            self._cond.notify_all()
+        if close:
+            generation.close()
+
+    def _take_close(self, generation: Generation) -> bool:
+        # caller holds _cond; exactly one caller gets True
+        if generation.retired and generation.refs == 0 and not generation.closed:
+            generation.closed = True
+            return True
+        return False
+
+    def swap(self, generation: Generation) -> Generation | None:
+        # installs `generation`, then waits for requests on the old one to finish
+        # before closing it. after drain_timeout_s the old one is left to the last
+        # checkin instead. returns the retired generation
+        with self._cond:
+            old = self._active
+            generation.number = old.number + 1 if old is not None else 1
+            self._active = generation
+            self.swaps  += 1
+            if old is None:
+                return None
+            old.retired = True
+            if not self._cond.wait_for(lambda: old.refs == 0, timeout=self.drain_timeout_s):
+                logger.warning(
+                    "Generation %d still has %d requests after %.0fs; closing when they finish.",
+                    old.number, old.refs, self.drain_timeout_s,
+                )
+            close = self._take_close(old)
+        if close:
+            old.close()
+        return old
+
+    def reload(self) -> Generation:
+        # the new database is opened before the swap, so requests never wait on it
+        with self._open_lock:
+            generation = self.opener()
+        old = self.swap(generation)
+        logger.info(
+            "Swapped to generation %d (data version %s, %s)%s",
+            generation.number, generation.version, generation.source,
+            f"; generation {old.number} drained" if old is not None and old.closed else "",
+        )
+        return generation
+
+    def close(self):
+        with self._cond:
+            generation, self._active = self._active, None
+            if generation is None:
+                return
+            generation.retired = True
+            close = self._take_close(generation)
+        if close:
+            generation.close()
@@ -2,13 +2,15 @@ import logging
 import re
 from pathlib import Path
 from src.db.connection import DuckDBConnection
+from src.db.manifest import checked_datasets, file_list, load_manifest
 
 
 class IngestRegistry:
 
-    def __init__(self, db_conn: DuckDBConnection, config):
+    def __init__(self, db_conn: DuckDBConnection, config, use_manifest: bool = False):
         self.con = db_conn.get()
         self.ingest_root = config.ingest_dir
+        self.use_manifest = use_manifest
         self._registered: list[str] = []
 
         logging.basicConfig(
@@ -27,26 +29,43 @@ class IngestRegistry:
             if not has_parquet:
                 self.logger.warning("No parquet found, skipping: %s", folder.name)
                 continue
-            # convert CamelCase and mixed names to snake_case
-            name = re.sub(r'(?<!^)(?=[A-Z])', '_', folder.name).lower()
-            view_name = f"v_{name}"
-            view_map[view_name] = folder
+            view_map[self._view_name(folder.name)] = folder
         return view_map
 
+    def _view_name(self, folder_name: str) -> str:
+        # convert CamelCase and mixed names to snake_case
+        name = re.sub(r'(?<!^)(?=[A-Z])', '_', folder_name).lower()
+        return f"v_{name}"
+
+    def _sources(self) -> dict[str, tuple[Path, str]]:
+        # view -> (folder, read_parquet files); the manifest's explicit lists skip the
+        # walk, except for datasets it no longer matches
+        manifest = load_manifest(self.ingest_root) if self.use_manifest else None
+        if manifest is not None:
+            sources = {}
+            for name, dataset in checked_datasets(self.ingest_root, manifest, self.logger).items():
+                folder = self.ingest_root / name
+                files  = f"'{folder / '**' / '*.parquet'}'" if dataset is None else file_list(folder, dataset)
+                sources[self._view_name(name)] = (folder, files)
+            return sources
+        return {
+            view_name: (folder, f"'{folder / '**' / '*.parquet'}'")
+            for view_name, folder in self._discover_views().items()
+        }
+
     def register_all(self):
         if not self.ingest_root.exists():
             raise FileNotFoundError(f"Ingest root not found: {self.ingest_root}")
 
-        view_map = self._discover_views()
+        view_map = self._sources()
 
         if not view_map:
             raise RuntimeError("No valid ingest folders discovered. Cannot proceed.")
 
-        for view_name, folder_path in view_map.items():
-            glob_pattern = str(folder_path / "**" / "*.parquet")
+        for view_name, (folder_path, files) in view_map.items():
             self.con.execute(f"""
                 CREATE OR REPLACE VIEW {view_name} AS
-                SELECT * FROM read_parquet('{glob_pattern}', hive_partitioning=false)
+                SELECT * FROM read_parquet({files}, hive_partitioning=false)
             """)
             self._registered.append(view_name)
             self.logger.info("Registered ingest view: %s → %s", view_name, folder_path)
@@ -0,0 +1,176 @@
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+logger = logging.getLogger("Manifest")
+
+MANIFEST = "_manifest.json"
+MANIFEST_VERSION = 1
+DATE_COLUMN = "trade_date"
+
+
+def _schema_hash(pf: pq.ParquetFile) -> str:
+    # pandas / writer metadata differs between otherwise identical files
+    return hashlib.sha1(pf.schema_arrow.remove_metadata().to_string().encode()).hexdigest()[:12]
+
+
+def _date_range(pf: pq.ParquetFile) -> tuple[str | None, str | None]:
+    # from row-group statistics, so only the footer is read
+    names = pf.schema_arrow.names
+    if DATE_COLUMN not in names:
+        return None, None
+    meta   = pf.metadata
+    column = names.index(DATE_COLUMN)
+    lows, highs = [], []
+    for i in range(meta.num_row_groups):
+        stats = meta.row_group(i).column(column).statistics
+        if stats is None or not stats.has_min_max:
+            return None, None
+        lows.append(str(stats.min)[:10])
+        highs.append(str(stats.max)[:10])
+    if not lows:
+        return None, None
+    return min(lows), max(highs)
+
+
+def _duckdb_type(arrow_type) -> str:
+    # enough of the mapping for typed_select to decide on date columns
+    name = str(arrow_type)
+    if name.startswith("date32"):
+        return "DATE"
+    if name.startswith("timestamp"):
+        return "TIMESTAMP"
+    if name in ("string", "large_string"):
+        return "VARCHAR"
+    return name.upper()
+
+
+def _describe_file(pf: pq.ParquetFile, path: Path, dataset_dir: Path) -> dict:
+    min_date, max_date = _date_range(pf)
+    return {
+        "path":           path.relative_to(dataset_dir).as_posix(),
+        "rows":           pf.metadata.num_rows,
+        "min_trade_date": min_date,
+        "max_trade_date": max_date,
+        "schema":         _schema_hash(pf),
+    }
+
+
+def _describe_dataset(dataset_dir: Path) -> dict:
+    files, columns = [], {}
+    for path in sorted(dataset_dir.rglob("*.parquet")):
+        pf = pq.ParquetFile(path)
+        files.append(_describe_file(pf, path, dataset_dir))
+        if not columns:
+            columns = {field.name: _duckdb_type(field.type) for field in pf.schema_arrow}
+    lows  = [f["min_trade_date"] for f in files if f["min_trade_date"]]
+    highs = [f["max_trade_date"] for f in files if f["max_trade_date"]]
+    return {
+        "files":          files,
+        "rows":           sum(f["rows"] for f in files),
+        "min_trade_date": min(lows) if lows else None,
+        "max_trade_date": max(highs) if highs else None,
+        "schemas":        sorted({f["schema"] for f in files}),
+        "columns":        columns,
+    }
+
+
+def write_manifest(layer_root: Path) -> dict:
+    # dataset folder -> parquet files with row counts, trade_date range and schema
+    # hash. run after every build that writes to the layer; readers that opt in
+    # register views from it instead of walking the tree
+    layer_root = Path(layer_root)
+    datasets = {}
+    for folder in sorted(layer_root.iterdir()):
+        if folder.is_dir():
+            dataset = _describe_dataset(folder)
+            if dataset["files"]:
+                datasets[folder.name] = dataset
+    manifest = {
+        "version":    MANIFEST_VERSION,
+        "written_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "datasets":   datasets,
+    }
+    tmp = layer_root / f"{MANIFEST}.{os.getpid()}.tmp"
+    tmp.write_text(json.dumps(manifest, indent=1))
+    os.replace(tmp, layer_root / MANIFEST)
+    logger.info(
+        "Manifest written: %s (%d datasets, %d files)",
+        layer_root / MANIFEST, len(datasets), sum(len(d["files"]) for d in datasets.values()),
+    )
+    return manifest
+
+
+def write_manifests(config) -> None:
+    for layer_root in (config.ingest_dir, config.processed_dir, config.curated_dir):
+        if Path(layer_root).exists():
+            write_manifest(layer_root)
+
+
+def load_manifest(layer_root: Path) -> dict | None:
+    path = Path(layer_root) / MANIFEST
+    if not path.exists():
+        return None
+    manifest = json.loads(path.read_text())
+    if manifest.get("version") != MANIFEST_VERSION:
+        logger.warning("Ignoring %s: version %s, expected %d", path, manifest.get("version"), MANIFEST_VERSION)
+        return None
+    return manifest
+
+
+def _stale_reason(dataset_dir: Path, dataset: dict, written_ns: int) -> str | None:
+    # a listed file that is gone would fail every query on the view, and a directory
+    # changed since the manifest was written holds files it does not describe.
+    # plain os calls: this runs for every file at API startup
+    base = str(dataset_dir)
+    dirs = {""}
+    for f in dataset["files"]:
+        if not os.path.isfile(os.path.join(base, f["path"])):
+            return f"{f['path']} is missing"
+        parent = os.path.dirname(f["path"])
+        while parent and parent not in dirs:
+            dirs.add(parent)
+            parent = os.path.dirname(parent)
+    for folder in sorted(dirs):
+        if os.stat(os.path.join(base, folder)).st_mtime_ns > written_ns:
+            return f"{os.path.join(dataset_dir.name, folder)} changed after the manifest was written"
+    return None
+
+
+def checked_datasets(layer_root: Path, manifest: dict, logger: logging.Logger) -> dict[str, dict | None]:
+    # dataset folder -> its manifest entry, or None where the manifest no longer
+    # matches the files and the registry should discover them instead. folders the
+    # manifest does not know about are discovered too
+    layer_root = Path(layer_root)
+    written_ns = (layer_root / MANIFEST).stat().st_mtime_ns
+    checked    = {}
+    for name, dataset in manifest["datasets"].items():
+        dataset_dir = layer_root / name
+        if not dataset_dir.is_dir():
+            logger.warning("%s lists %s, which no longer exists; skipping it.", layer_root / MANIFEST, name)
+            continue
+        reason = _stale_reason(dataset_dir, dataset, written_ns)
+        if reason is not None:
+            logger.warning("%s is stale for %s (%s); discovering its files instead.", layer_root / MANIFEST, name, reason)
+        checked[name] = None if reason is not None else dataset
+    for folder in sorted(layer_root.iterdir()):
+        if folder.is_dir() and folder.name not in checked and folder.name not in manifest["datasets"] and any(folder.rglob("*.parquet")):
+            logger.warning("%s does not list %s; discovering its files instead.", layer_root / MANIFEST, folder.name)
+            checked[folder.name] = None
+    return checked
+
+
+def file_list(dataset_dir: Path, dataset: dict) -> str:
+    # DuckDB list literal of absolute paths, for read_parquet([...])
+    paths = ", ".join("'" + str(dataset_dir / f["path"]).replace("'", "''") + "'" for f in dataset["files"])
+    return f"[{paths}]"
+
+
+def column_types(dataset: dict) -> dict[str, str] | None:
+    # column -> DuckDB type, when every file shares one schema
+    return dataset["columns"] if len(dataset["schemas"]) == 1 else None
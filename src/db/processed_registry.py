@@ -1,13 +1,16 @@
 import logging
 from pathlib import Path
 from src.db.connection import DuckDBConnection
+from src.db.manifest import checked_datasets, column_types, file_list, load_manifest
+from src.db.typed_views import typed_select
 
 
 class ProcessedRegistry:
 
-    def __init__(self, db_conn: DuckDBConnection, config):
+    def __init__(self, db_conn: DuckDBConnection, config, use_manifest: bool = False):
         self.con = db_conn.get()
         self.processed_root = config.processed_dir
+        self.use_manifest = use_manifest
         self._registered: list[str] = []
 
         logging.basicConfig(
@@ -26,24 +29,45 @@ class ProcessedRegistry:
             if not has_parquet:
                 self.logger.warning("No parquet found, skipping: %s", folder.name)
                 continue
-            view_name = f"v_processed_{folder.name.lower()}"
-            view_map[view_name] = folder
+            view_map[self._view_name(folder.name)] = folder
         return view_map
 
+    def _view_name(self, folder_name: str) -> str:
+        return f"v_processed_{folder_name.lower()}"
+
+    def _sources(self) -> dict[str, tuple[Path, str, dict | None]]:
+        # view -> (folder, read_parquet files, column types); the manifest's explicit
+        # lists skip the walk and its column types skip describing each source.
+        # datasets the manifest no longer matches are discovered
+        manifest = load_manifest(self.processed_root) if self.use_manifest else None
+        if manifest is not None:
+            sources = {}
+            for name, dataset in checked_datasets(self.processed_root, manifest, self.logger).items():
+                folder = self.processed_root / name
+                if dataset is None:
+                    sources[self._view_name(name)] = (folder, f"'{folder / '**' / '*.parquet'}'", None)
+                else:
+                    sources[self._view_name(name)] = (folder, file_list(folder, dataset), column_types(dataset))
+            return sources
+        return {
+            view_name: (folder, f"'{folder / '**' / '*.parquet'}'", None)
+            for view_name, folder in self._discover_views().items()
+        }
+
     def register_all(self):
         if not self.processed_root.exists():
             raise FileNotFoundError(f"Processed root not found: {self.processed_root}")
 
-        view_map = self._discover_views()
+        view_map = self._sources()
 
         if not view_map:
             raise RuntimeError("No valid processed folders discovered. Cannot proceed.")
 
-        for view_name, folder_path in view_map.items():
-            glob_pattern = str(folder_path / "**" / "*.parquet")
+        for view_name, (folder_path, files, schema) in view_map.items():
+            source = f"read_parquet({files}, hive_partitioning=false)"
             self.con.execute(f"""
                 CREATE OR REPLACE VIEW {view_name} AS
-                SELECT * FROM read_parquet('{glob_pattern}', hive_partitioning=false)
+                {typed_select(self.con, source, view_name, self.logger, schema)}
             """)
             self._registered.append(view_name)
             self.logger.info("Registered processed view: %s → %s", view_name, folder_path)
@@ -0,0 +1,120 @@
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import duckdb
+
+from src.db.connection import DuckDBConnection
+from src.db.curated_registry import CuratedRegistry
+from src.db.data_version import DataVersion
+from src.db.processed_registry import ProcessedRegistry
+
+logger = logging.getLogger("Snapshot")
+
+CURRENT = "CURRENT"
+PREFIX  = "qrl_"
+# row order for every table that has these columns: DuckDB keeps min/max zone maps
+# per row group, so a day / symbol lookup skips everything outside its range
+SORT_COLUMNS  = ("trade_date", "symbol", "expiry_date", "strike", "option_type", "tenor")
+# ART indexes on the lookup keys; DuckDB uses them for selective equality filters
+INDEX_COLUMNS = ("trade_date", "symbol")
+
+
+def table_name(view_name: str) -> str:
+    # v_curated_option_chain -> t_curated_option_chain; the view keeps its name
+    # and is re-pointed at the table, so queries run unchanged
+    return "t_" + view_name.removeprefix("v_")
+
+
+def _materialize(con: duckdb.DuckDBPyConnection, view_name: str) -> int:
+    table   = table_name(view_name)
+    columns = {row[0] for row in con.execute(f"DESCRIBE {view_name}").fetchall()}
+    order   = [c for c in SORT_COLUMNS if c in columns]
+    order_by = f"ORDER BY {', '.join(order)}" if order else ""
+    con.execute(f"CREATE TABLE {table} AS SELECT * FROM {view_name} {order_by}")
+    for column in INDEX_COLUMNS:
+        if column in columns:
+            con.execute(f"CREATE INDEX {table}_{column}_idx ON {table} ({column})")
+    con.execute(f"CREATE OR REPLACE VIEW {view_name} AS SELECT * FROM {table}")
+    return con.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def _write_current(snapshot_dir: Path, target: Path):
+    tmp = snapshot_dir / f"{CURRENT}.{os.getpid()}.tmp"
+    tmp.write_text(target.name + "\n")
+    os.replace(tmp, snapshot_dir / CURRENT)
+
+
+def build_snapshot(config, snapshot_dir: Path | None = None, keep: int = 2) -> Path:
+    # loads every processed and curated view into native tables inside one
+    # qrl_<data_version>.duckdb file, then points CURRENT at it
+    snapshot_dir = Path(snapshot_dir or config.snapshot_dir)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    data_version = DataVersion([config.processed_dir, config.curated_dir], ttl_s=0)
+    version = data_version.compute()
+    target  = snapshot_dir / f"{PREFIX}{version}.duckdb"
+
+    if target.exists():
+        logger.info("Snapshot for data version %s already built: %s", version, target)
+    else:
+        tmp = target.with_suffix(".building")
+        tmp.unlink(missing_ok=True)
+        db_conn = DuckDBConnection(tmp)
+        try:
+            processed = ProcessedRegistry(db_conn=db_conn, config=config)
+            curated   = CuratedRegistry(db_conn=db_conn, config=config)
+            processed.register_all()
+            curated.register_all()
+
+            con  = db_conn.get()
+            rows = {}
+            for view_name in processed.list_registered() + curated.list_registered():
+                rows[view_name] = _materialize(con, view_name)
+                logger.info("Snapshot: %s -> %s (%d rows)", view_name, table_name(view_name), rows[view_name])
+
+            # the pipeline wrote while we were reading; the tables may mix versions
+            if data_version.compute() != version:
+                raise RuntimeError("Data changed during the snapshot build. Rerun once the pipeline has finished.")
+
+            meta = {
+                "data_version":   version,
+                "built_at":       datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "duckdb_version": duckdb.__version__,
+                "tables":         str(len(rows)),
+                "rows":           str(sum(rows.values())),
+            }
+            con.execute("CREATE TABLE snapshot_meta (key VARCHAR PRIMARY KEY, value VARCHAR)")
+            con.executemany("INSERT INTO snapshot_meta VALUES (?, ?)", list(meta.items()))
+            con.execute("CHECKPOINT")
+        except Exception:
+            db_conn.close()
+            tmp.unlink(missing_ok=True)
+            raise
+        db_conn.close()
+        os.replace(tmp, target)
+        logger.info("Snapshot built: %s (%d tables, %d rows)", target, len(rows), sum(rows.values()))
+
+    _write_current(snapshot_dir, target)
+
+    # readers still holding an older file keep their open handle
+    older = sorted(
+        (p for p in snapshot_dir.glob(f"{PREFIX}*.duckdb") if p != target),
+        key=lambda p: p.stat().st_mtime, reverse=True,
+    )
+    for stale in older[max(keep - 1, 0):]:
+        stale.unlink(missing_ok=True)
+        logger.info("Removed old snapshot: %s", stale)
+    return target
+
+
+def current_snapshot(snapshot_dir: Path) -> Path | None:
+    pointer = Path(snapshot_dir) / CURRENT
+    if not pointer.exists():
+        return None
+    path = pointer.parent / pointer.read_text().strip()
+    return path if path.exists() else None
+
+
+def snapshot_meta(con: duckdb.DuckDBPyConnection) -> dict[str, str]:
+    return dict(con.execute("SELECT key, value FROM snapshot_meta").fetchall())
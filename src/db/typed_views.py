@@ -0,0 +1,43 @@
+import logging
+
+import duckdb
+
+# columns every processed / curated view exposes as native DATE
+DATE_COLUMNS = ("trade_date", "expiry_date", "start_date", "end_date")
+CASTABLE     = ("TIMESTAMP", "VARCHAR")
+
+
+def typed_select(
+    con: duckdb.DuckDBPyConnection,
+    source: str,
+    view_name: str,
+    logger: logging.Logger,
+    schema: dict[str, str] | None = None,
+) -> str:
+    # SELECT over `source` with the date columns guaranteed DATE, so queries can compare
+    # `trade_date = ?` directly. Columns the builders already wrote as DATE pass through
+    # untouched and keep parquet min/max pruning; anything else is cast here, once.
+    # schema (column -> DuckDB type) comes from a manifest when known; otherwise the
+    # source is described, which binds it an extra time
+    if schema is None:
+        schema = {row[0]: row[1] for row in con.execute(f"DESCRIBE SELECT * FROM {source}").fetchall()}
+    replace = []
+    for column in DATE_COLUMNS:
+        dtype = schema.get(column)
+        if dtype is None or dtype == "DATE":
+            continue
+        if dtype.startswith(CASTABLE):
+            logger.warning(
+                "%s.%s is stored as %s; casting to DATE in the view. Rebuild the files to write DATE.",
+                view_name, column, dtype,
+            )
+            replace.append(f"CAST({column} AS DATE) AS {column}")
+        elif dtype == "NULL" or con.execute(f"SELECT COUNT({column}) FROM {source}").fetchone()[0] == 0:
+            # an all-null column is written with parquet's null type and read back as INTEGER
+            replace.append(f"CAST(NULL AS DATE) AS {column}")
+        else:
+            logger.warning("%s.%s is stored as %s and cannot be cast to DATE; left as-is.", view_name, column, dtype)
+
+    if not replace:
+        return f"SELECT * FROM {source}"
+    return f"SELECT * REPLACE ({', '.join(replace)}) FROM {source}"
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+
+from src.quant.bs_vectorized import _price_bracket, TOLERANCE
+
+ARB_VERTICAL   = 1
+ARB_BUTTERFLY  = 2
+ARB_CALENDAR   = 4
+ARB_BRACKET    = 8
+ARB_FLAGS      = {
+    "vertical":  ARB_VERTICAL,
+    "butterfly": ARB_BUTTERFLY,
+    "calendar":  ARB_CALENDAR,
+    "bracket":   ARB_BRACKET,
+}
+PRICE_TOL      = 0.05
+
+
+def _group_ids(*columns) -> np.ndarray:
+    return pd.MultiIndex.from_arrays([pd.Series(c).to_numpy() for c in columns]).factorize()[0]
+
+
+def _strike_flags(group: np.ndarray, K: np.ndarray, price: np.ndarray, is_call: np.ndarray, disc: np.ndarray) -> np.ndarray:
+    # rows must already be sorted by (group, strike)
+    flags = np.zeros(len(K), dtype=np.int16)
+    if len(K) < 2:
+        return flags
+
+    same  = group[1:] == group[:-1]
+    dK    = K[1:] - K[:-1]
+    dP    = price[1:] - price[:-1]
+    call  = is_call[1:]
+
+    # calls fall and puts rise with strike, by at most the discounted strike gap
+    wrong_sign = np.where(call, dP > PRICE_TOL, dP < -PRICE_TOL)
+    too_steep  = np.abs(dP) > disc[1:] * dK + PRICE_TOL
+    vertical   = same & (wrong_sign | too_steep)
+    # blame the more out-of-the-money row: higher strike for calls, lower for puts
+    flags[1:][vertical & call]   |= ARB_VERTICAL
+    flags[:-1][vertical & ~call] |= ARB_VERTICAL
+
+    if len(K) < 3:
+        return flags
+
+    same3 = same[1:] & same[:-1]
+    w     = dK[:-1] / np.where((dK[:-1] + dK[1:]) > 0, dK[:-1] + dK[1:], 1.0)
+    # price must be convex in strike: P(K_mid) <= w * P(K_hi) + (1 - w) * P(K_lo)
+    convex_bound = (1 - w) * price[:-2] + w * price[2:]
+    butterfly    = same3 & (price[1:-1] > convex_bound + PRICE_TOL)
+    flags[1:-1][butterfly] |= ARB_BUTTERFLY
+    return flags
+
+
+def _calendar_flags(group: np.ndarray, price: np.ndarray, is_call: np.ndarray) -> np.ndarray:
+    # rows sorted by (group, expiry); only calls — deep ITM European puts may
+    # legitimately lose value with tenor when rates are positive
+    flags = np.zeros(len(price), dtype=np.int16)
+    if len(price) < 2:
+        return flags
+    same     = group[1:] == group[:-1]
+    calendar = same & is_call[1:] & (price[1:] < price[:-1] - PRICE_TOL)
+    flags[1:][calendar] |= ARB_CALENDAR
+    return flags
+
+
+def arbitrage_flags(df: pd.DataFrame, q_col: str = "div_yield") -> np.ndarray:
+    n = len(df)
+    if n == 0:
+        return np.zeros(0, dtype=np.int16)
+
+    S       = df["spot"].to_numpy(dtype=np.float64)
+    K       = df["strike"].to_numpy(dtype=np.float64)
+    dte     = df["dte"].to_numpy(dtype=np.float64)
+    r       = df["rate"].to_numpy(dtype=np.float64)
+    q       = df[q_col].to_numpy(dtype=np.float64) / 100
+    settle  = df["settle"].to_numpy(dtype=np.float64)
+    is_call = df["option_type"].to_numpy() == "CE"
+    T       = dte / 365.0
+
+    priced = (dte > 0) & (settle > 0)
+    flags  = np.zeros(n, dtype=np.int16)
+
+    low, high = _price_bracket(S, K, T, r, q, is_call)
+    outside   = priced & ((settle < low - TOLERANCE) | (settle > high + TOLERANCE))
+    flags[outside] |= ARB_BRACKET
+
+    rows  = np.flatnonzero(priced)
+    if len(rows) == 0:
+        return flags
+
+    trade_date = df["trade_date"].to_numpy()[rows]
+    symbol     = df["symbol"].to_numpy()[rows]
+    expiry     = df["expiry_date"].to_numpy()[rows]
+    opt_type   = df["option_type"].to_numpy()[rows]
+
+    slice_id = _group_ids(trade_date, symbol, expiry, opt_type)
+    idx      = np.lexsort((K[rows], slice_id))
+    order    = rows[idx]
+    flags[order] |= _strike_flags(
+        slice_id[idx], K[order], settle[order], is_call[order], np.exp(-r[order] * T[order])
+    )
+
+    strike_id = _group_ids(trade_date, symbol, opt_type, K[rows])
+    idx       = np.lexsort((T[rows], strike_id))
+    order     = rows[idx]
+    flags[order] |= _calendar_flags(strike_id[idx], settle[order], is_call[order])
+    return flags
+
+
+def arbitrage_summary(flags: np.ndarray) -> dict:
+    return {name: int(((flags & bit) > 0).sum()) for name, bit in ARB_FLAGS.items()}
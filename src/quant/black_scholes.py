@@ -2,6 +2,11 @@ import math
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
+import pandas as pd
+
+from src.quant.bs_vectorized import compute_batch
+
 
 # IV search bounds
 IV_LOWER_BOUND = 0.01
@@ -91,6 +96,26 @@ def _bs_greeks(
         "rho":   rho,
     }
 
+def _bs_vega_raw(S: float, K: float, T: float, r: float, q: float, sigma: float) -> float:
+    # dPrice/dSigma, unscaled — the Newton step needs the true derivative
+    sqrt_T = math.sqrt(T)
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / (sigma * sqrt_T)
+    return S * math.exp(-q * T) * _norm_pdf(d1) * sqrt_T
+
+def _forward_intrinsic(S: float, K: float, T: float, r: float, q: float, option_type: str) -> float:
+    if option_type == "CE":
+        return max(S * math.exp(-q * T) - K * math.exp(-r * T), 0.0)
+    return max(K * math.exp(-r * T) - S * math.exp(-q * T), 0.0)
+
+def _initial_vol(market_price: float, S: float, K: float, T: float, r: float, q: float, option_type: str) -> float:
+    fwd_S = S * math.exp(-q * T)
+    fwd_K = K * math.exp(-r * T)
+    # price as a call via parity so one formula covers both legs
+    call  = market_price if option_type == "CE" else market_price + fwd_S - fwd_K
+    gap   = (fwd_S - fwd_K) / 2.0
+    inner = max((call - gap) ** 2 - 4.0 * gap ** 2 / math.pi, 0.0)
+    return math.sqrt(2.0 * math.pi / T) / (fwd_S + fwd_K) * (call - gap + math.sqrt(inner))
+
 def _invert_iv(
     market_price: float,
     S: float, K: float, T: float, r: float, q: float, option_type: str
@@ -108,19 +133,39 @@ def _invert_iv(
     if f_low * f_high > 0:
         return None
 
+    # Newton on log time value: time value is the OTM leg by parity and its log
+    # is near-linear in vol, so wing strikes converge as fast as ATM ones
+    intrinsic  = _forward_intrinsic(S, K, T, r, q, option_type)
+    time_value = market_price - intrinsic
+
+    # Corrado-Miller start; vol lives on a log scale, so fallbacks bisect geometrically
+    sigma = _initial_vol(market_price, S, K, T, r, q, option_type)
+    if not low < sigma < high:
+        sigma = math.sqrt(low * high)
+
     for _ in range(MAX_ITERATIONS):
-        mid    = (low + high) / 2.0
-        f_mid  = objective(mid)
+        f = objective(sigma)
 
-        if abs(f_mid) < TOLERANCE or (high - low) / 2.0 < TOLERANCE:
-            return mid
+        if abs(f) < TOLERANCE or (high - low) / 2.0 < TOLERANCE:
+            return sigma
 
-        if f_low * f_mid < 0:
-            high   = mid
-            f_high = f_mid
+        # price is increasing in vol, so every evaluation tightens the bracket
+        if f < 0:
+            low  = sigma
         else:
-            low   = mid
-            f_low = f_mid
+            high = sigma
+
+        vega     = _bs_vega_raw(S, K, T, r, q, sigma)
+        model_tv = f + time_value
+        if vega <= 0:
+            step = low
+        elif model_tv > 0 and time_value > 0:
+            step = sigma - math.log(model_tv / time_value) * model_tv / vega
+        else:
+            step = sigma - f / vega
+
+        # safeguard: any step that leaves the bracket is replaced by bisection
+        sigma = step if low < step < high else math.sqrt(low * high)
 
     return None
 
@@ -157,10 +202,7 @@ def compute(inputs: BSMInputs, market_price: float) -> BSMResult:
     q = inputs.div_yield
 
     # intrinsic value check — market price must exceed intrinsic or price violates no-arbitrage and IV inversion fails
-    if inputs.option_type == "CE":
-        intrinsic = max(S * math.exp(-q * T) - K * math.exp(-r * T), 0.0)
-    else:
-        intrinsic = max(K * math.exp(-r * T) - S * math.exp(-q * T), 0.0)
+    intrinsic = _forward_intrinsic(S, K, T, r, q, inputs.option_type)
 
     if market_price < intrinsic - TOLERANCE:
         return null_result
@@ -182,3 +224,31 @@ def compute(inputs: BSMInputs, market_price: float) -> BSMResult:
         theta=greeks["theta"],
         rho=greeks["rho"],
     )
+
+
+def compute_many(inputs: list[BSMInputs], market_prices) -> list[BSMResult]:
+    # same contract as compute(), solved in one vectorized pass
+    if len(inputs) != len(market_prices):
+        raise ValueError(f"Got {len(inputs)} inputs but {len(market_prices)} market prices.")
+    if not inputs:
+        return []
+
+    df = pd.DataFrame({
+        "spot":        [i.spot for i in inputs],
+        "strike":      [i.strike for i in inputs],
+        "dte":         [i.dte for i in inputs],
+        "rate":        [i.rate for i in inputs],
+        # BSMInputs carries a decimal yield; the batch engine expects percent
+        "div_yield":   [i.div_yield * 100 for i in inputs],
+        "settle":      np.asarray(market_prices, dtype=np.float64),
+        "option_type": [i.option_type for i in inputs],
+    })
+    out = compute_batch(df)
+
+    # the batch solver searches down to its own IV_LOWER; compute() gives up below
+    # IV_LOWER_BOUND, so those rows come back empty here too
+    iv      = out["iv"]
+    outside = (iv < IV_LOWER_BOUND - TOLERANCE) | (iv > IV_UPPER_BOUND + TOLERANCE)
+    fields  = ("iv", "delta", "gamma", "vega", "theta", "rho")
+    columns = [[None if np.isnan(v) else float(v) for v in np.where(outside, np.nan, out[f])] for f in fields]
+    return [BSMResult(*row) for row in zip(*columns)]
@@ -39,7 +39,7 @@ def _vega_vec(S: np.ndarray, K: np.ndarray, T: np.ndarray, r: np.ndarray, q: np.
     return S * np.exp(-q * safe_T) * _norm_pdf(d1) * sqrt_T
 
 
-def _greeks_vec(S: np.ndarray, K: np.ndarray, T: np.ndarray, r: np.ndarray, q: np.ndarray, sigma: np.ndarray, is_call: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+def _greeks_vec(S: np.ndarray, K: np.ndarray, T: np.ndarray, r: np.ndarray, q: np.ndarray, sigma: np.ndarray, is_call: np.ndarray, higher_order: bool = False) -> Tuple[np.ndarray, ...]:
     safe_T     = np.maximum(T,     1e-10)
     safe_sigma = np.maximum(sigma, 1e-10)
     sqrt_T = np.sqrt(safe_T)
@@ -74,7 +74,27 @@ def _greeks_vec(S: np.ndarray, K: np.ndarray, T: np.ndarray, r: np.ndarray, q: n
     put_rho  = -K * safe_T * np.exp(-r * safe_T) * _norm_cdf(-d2) / 100
     rho = np.where(is_call, call_rho, put_rho)
 
-    return delta, gamma, vega, theta, rho
+    if not higher_order:
+        return delta, gamma, vega, theta, rho
+
+    # same units as the first-order set: per 1 vol point, per calendar day
+    vol_sqrt_T = safe_sigma * sqrt_T
+    vanna = -np.exp(-q * safe_T) * pdf_d1 * d2 / safe_sigma / 100
+    volga = vega * d1 * d2 / safe_sigma / 100
+    speed = -gamma / S * (d1 / vol_sqrt_T + 1.0)
+
+    charm_common = np.exp(-q * safe_T) * pdf_d1 * (2 * (r - q) * safe_T - d2 * vol_sqrt_T) / (2 * safe_T * vol_sqrt_T)
+    call_charm   = (q * np.exp(-q * safe_T) * cdf_d1          - charm_common) / 365
+    put_charm    = (-q * np.exp(-q * safe_T) * (1.0 - cdf_d1)  - charm_common) / 365
+    charm = np.where(is_call, call_charm, put_charm)
+
+    return delta, gamma, vega, theta, rho, vanna, volga, charm, speed
+
+def _price_bracket(S: np.ndarray, K: np.ndarray, T: np.ndarray, r: np.ndarray, q: np.ndarray, is_call: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # BS price is monotone in vol, so any solvable price lies inside [P(IV_LOWER), P(IV_UPPER)]
+    low  = _bs_price_vec(S, K, T, r, q, np.full(len(S), IV_LOWER), is_call)
+    high = _bs_price_vec(S, K, T, r, q, np.full(len(S), IV_UPPER), is_call)
+    return low, high
 
 def _invert_iv_vec(market_price: np.ndarray, S: np.ndarray, K: np.ndarray, T: np.ndarray, r: np.ndarray, q: np.ndarray, is_call: np.ndarray, valid_mask: np.ndarray) -> np.ndarray:
     n = len(market_price)
@@ -137,14 +157,29 @@ def _invert_iv_vec(market_price: np.ndarray, S: np.ndarray, K: np.ndarray, T: np
     return iv
 
 
-def compute_batch(df) -> dict:
+HIGHER_ORDER_GREEKS = ["vanna", "volga", "charm", "speed"]
+Q_SOURCES           = ("index_yield", "implied")
+
+
+def _div_yield_pct(df, q_source: str) -> np.ndarray:
+    if q_source not in Q_SOURCES:
+        raise ValueError(f"Invalid q_source: '{q_source}'. Expected one of {Q_SOURCES}.")
+    if q_source == "index_yield":
+        return df["div_yield"].to_numpy(dtype=np.float64)
+    implied = df["implied_div_yield"].to_numpy(dtype=np.float64)
+    if "div_yield" in df:
+        implied = np.where(np.isnan(implied), df["div_yield"].to_numpy(dtype=np.float64), implied)
+    return implied
+
+
+def compute_batch(df, higher_order: bool = False, q_source: str = "index_yield") -> dict:
     n = len(df)
 
     S        = df["spot"].to_numpy(dtype=np.float64)
     K        = df["strike"].to_numpy(dtype=np.float64)
     dte      = df["dte"].to_numpy(dtype=np.float64)
     r        = df["rate"].to_numpy(dtype=np.float64)
-    q        = df["div_yield"].to_numpy(dtype=np.float64) / 100
+    q        = _div_yield_pct(df, q_source) / 100
     settle   = df["settle"].to_numpy(dtype=np.float64)
     opt_type = df["option_type"].to_numpy()
 
@@ -159,6 +194,13 @@ def compute_batch(df) -> dict:
 
     valid = ((dte > 0) & (settle > 0) & (S > 0) & (K > 0) & ((opt_type == "CE") | (opt_type == "PE")) & (settle >= intrinsic - TOLERANCE))
 
+    # rows outside the vol bracket can never converge; drop them before the
+    # solver so they don't hold every Newton/bisection iteration open
+    if valid.any():
+        rows = np.flatnonzero(valid)
+        low, high = _price_bracket(S[rows], K[rows], T[rows], r[rows], q[rows], is_call[rows])
+        valid[rows] = (settle[rows] >= low - TOLERANCE) & (settle[rows] <= high + TOLERANCE)
+
     iv = _invert_iv_vec(settle, S, K, T, r, q, is_call, valid)
 
     iv_valid = valid & ~np.isnan(iv)
@@ -168,15 +210,18 @@ def compute_batch(df) -> dict:
     vega  = np.full(n, np.nan)
     theta = np.full(n, np.nan)
     rho   = np.full(n, np.nan)
+    extra = {name: np.full(n, np.nan) for name in HIGHER_ORDER_GREEKS} if higher_order else {}
 
     if iv_valid.any():
         safe_sigma = np.where(iv_valid, iv, IV_LOWER)
-        d, g, ve, th, ro = _greeks_vec(S, K, T, r, q, safe_sigma, is_call)
+        d, g, ve, th, ro, *ho = _greeks_vec(S, K, T, r, q, safe_sigma, is_call, higher_order=higher_order)
         delta = np.where(iv_valid, d,  np.nan)
         gamma = np.where(iv_valid, g,  np.nan)
         vega  = np.where(iv_valid, ve, np.nan)
         theta = np.where(iv_valid, th, np.nan)
         rho   = np.where(iv_valid, ro, np.nan)
+        for name, values in zip(HIGHER_ORDER_GREEKS, ho):
+            extra[name] = np.where(iv_valid, values, np.nan)
 
     return {
         "iv":    iv,
@@ -185,4 +230,5 @@ def compute_batch(df) -> dict:
         "vega":  vega,
         "theta": theta,
         "rho":   rho,
+        **extra,
     }
@@ -0,0 +1,128 @@
+import math
+import numpy as np
+
+
+class RowView:
+    # read-only row over a ColumnarTable; attribute access mirrors the old row dataclasses
+    __slots__ = ("_table", "_i")
+
+    def __init__(self, table: "ColumnarTable", i: int):
+        self._table = table
+        self._i     = i
+
+    def __getattr__(self, name: str):
+        try:
+            column = self._table.columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return self._table._scalar(name, column[self._i])
+
+    def __setattr__(self, name: str, value):
+        if name in RowView.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            raise AttributeError(f"{type(self._table).__name__} rows are read-only")
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, RowView):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in self.to_dict().items())
+        return f"{type(self._table).__name__}.Row({fields})"
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self._table.FIELDS}
+
+
+class ColumnarTable:
+    # one NumPy array per field; subclasses declare FIELDS and which of them hold str / int
+    FIELDS:     tuple = ()
+    STR_FIELDS: frozenset = frozenset()
+    INT_FIELDS: frozenset = frozenset()
+
+    def __init__(self, columns: dict):
+        missing = set(self.FIELDS) - set(columns)
+        if missing:
+            raise ValueError(f"{type(self).__name__} missing columns: {missing}")
+        self.columns = {name: self._as_array(name, columns[name]) for name in self.FIELDS}
+        lengths = {len(c) for c in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"{type(self).__name__} columns have unequal lengths: {sorted(lengths)}")
+
+    @classmethod
+    def _as_array(cls, name: str, values) -> np.ndarray:
+        if name in cls.STR_FIELDS:
+            return np.asarray(values, dtype=object)
+        # None -> NaN; nullable int fields therefore live in float64
+        values = [np.nan if v is None else v for v in values] if isinstance(values, list) else values
+        if name in cls.INT_FIELDS:
+            arr = np.asarray(values, dtype=np.float64)
+            return arr.astype(np.int64) if not np.isnan(arr).any() else arr
+        return np.asarray(values, dtype=np.float64)
+
+    @classmethod
+    def _scalar(cls, name: str, value):
+        if name in cls.STR_FIELDS:
+            return value
+        value = float(value)
+        if math.isnan(value):
+            return None
+        return int(value) if name in cls.INT_FIELDS else value
+
+    @classmethod
+    def from_rows(cls, rows) -> "ColumnarTable":
+        rows = list(rows)
+        return cls({name: [getattr(r, name) for r in rows] for name in cls.FIELDS})
+
+    def __len__(self) -> int:
+        return len(self.columns[self.FIELDS[0]]) if self.FIELDS else 0
+
+    def __getitem__(self, i: int) -> RowView:
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return RowView(self, i)
+
+    def __iter__(self):
+        return (RowView(self, i) for i in range(len(self)))
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        # column access as an attribute, e.g. table.total_pnl
+        columns = self.__dict__.get("columns", {})
+        if name in columns:
+            return columns[name]
+        raise AttributeError(name)
+
+    def to_columns(self) -> dict[str, list]:
+        # JSON-ready: NaN -> None, NumPy scalars -> Python scalars
+        out = {}
+        for name, column in self.columns.items():
+            if name in self.STR_FIELDS:
+                out[name] = column.tolist()
+            elif column.dtype.kind == "f":
+                nan = np.isnan(column)
+                values = np.where(nan, 0, column).astype(np.int64) if name in self.INT_FIELDS else column
+                out[name] = [None if m else v for m, v in zip(nan.tolist(), values.tolist())]
+            else:
+                out[name] = column.tolist()
+        return out
+
+    def to_records(self) -> list[dict]:
+        columns = self.to_columns()
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+    def to_arrow(self):
+        import pyarrow as pa
+        arrays = {}
+        for name, column in self.columns.items():
+            if column.dtype.kind == "f":
+                mask  = np.isnan(column)
+                dtype = pa.int64() if name in self.INT_FIELDS else pa.float64()
+                arrays[name] = pa.array(np.where(mask, 0, column).astype(dtype.to_pandas_dtype()), type=dtype, mask=mask)
+            else:
+                arrays[name] = pa.array(column)
+        return pa.table(arrays)
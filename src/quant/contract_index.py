@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+# key layout, high to low bits: symbol code | option type (2) | expiry days since epoch (16) | strike in paise (32)
+OPTION_TYPE_CODES = {"CE": 0, "PE": 1, "XX": 2}
+STRIKE_BITS       = 32
+EXPIRY_BITS       = 16
+TYPE_BITS         = 2
+MAX_SYMBOLS       = 1 << (63 - STRIKE_BITS - EXPIRY_BITS - TYPE_BITS)
+
+
+def strike_paise(strike) -> np.ndarray:
+    return np.rint(np.asarray(strike, dtype=np.float64) * 100).astype(np.int64)
+
+
+def _expiry_days(expiry) -> tuple[np.ndarray, np.ndarray]:
+    ts    = pd.to_datetime(pd.Series(expiry, dtype=object), errors="coerce")
+    valid = ts.notna().to_numpy()
+    days  = np.zeros(len(ts), dtype=np.int64)
+    days[valid] = ts[valid].to_numpy().astype("datetime64[D]").astype(np.int64)
+    return days, valid
+
+
+def _type_codes(option_type) -> np.ndarray:
+    return pd.Series(option_type, dtype=object).map(OPTION_TYPE_CODES).fillna(-1).to_numpy(dtype=np.int64)
+
+
+class ContractIndex:
+    # (symbol, expiry, strike, option_type) -> row offset, one int64 key per contract
+
+    def __init__(self, symbol, expiry, strike, option_type):
+        self.symbols = pd.Index(pd.unique(pd.Series(symbol, dtype=object)))
+        if len(self.symbols) > MAX_SYMBOLS:
+            raise ValueError(f"ContractIndex supports at most {MAX_SYMBOLS} symbols, got {len(self.symbols)}.")
+
+        keys, valid = self.encode(symbol, expiry, strike, option_type)
+        rows  = np.flatnonzero(valid)
+        keys  = pd.Index(keys[rows])
+        # first occurrence wins, matching the old `.iloc[0]` / `LIMIT 1` lookups
+        first = ~keys.duplicated(keep="first")
+        self._keys = keys[first]
+        self._rows = rows[first]
+        # sorted copy for range scans: one symbol/type/expiry is a contiguous run of keys
+        self._sorted = np.sort(self._keys.to_numpy())
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "ContractIndex":
+        # futures frames carry no strike/option_type: key them as strike 0, "XX"
+        n = len(df)
+        return cls(
+            df["symbol"]      if "symbol"      in df else np.array([], dtype=object),
+            df["expiry_date"] if "expiry_date" in df else np.array([], dtype=object),
+            df["strike"]      if "strike"      in df else np.zeros(n),
+            df["option_type"] if "option_type" in df else np.full(n, "XX", dtype=object),
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def encode(self, symbol, expiry, strike, option_type) -> tuple[np.ndarray, np.ndarray]:
+        sym           = self.symbols.get_indexer(pd.Series(symbol, dtype=object))
+        days, dated   = _expiry_days(expiry)
+        paise         = strike_paise(strike)
+        otype         = _type_codes(option_type)
+
+        valid = (
+            (sym >= 0) & dated & (otype >= 0)
+            & (days >= 0) & (days < (1 << EXPIRY_BITS))
+            & (paise >= 0) & (paise < (1 << STRIKE_BITS))
+        )
+        keys = (
+            ((sym.astype(np.int64) << TYPE_BITS | otype) << (EXPIRY_BITS + STRIKE_BITS))
+            | (days << STRIKE_BITS)
+            | paise
+        )
+        return np.where(valid, keys, -1), valid
+
+    def lookup(self, symbol, expiry, strike, option_type) -> np.ndarray:
+        # vectorized: row offset per query, -1 where the contract is absent
+        keys, valid = self.encode(symbol, expiry, strike, option_type)
+        if len(self._keys) == 0 or len(keys) == 0:
+            return np.full(len(keys), -1, dtype=np.int64)
+        pos = self._keys.get_indexer(keys)
+        pos = np.where(valid & (pos >= 0), pos, -1)
+        return np.where(pos >= 0, self._rows[np.maximum(pos, 0)], -1).astype(np.int64)
+
+    def strikes(self, symbol: str, expiry, option_type: str) -> np.ndarray:
+        # ascending strikes listed for one symbol/expiry/type, without touching the rows
+        low, valid = self.encode([symbol], [expiry], [0.0], [option_type])
+        if not valid[0]:
+            return np.array([], dtype=np.float64)
+        start, stop = np.searchsorted(self._sorted, [low[0], low[0] + (1 << STRIKE_BITS)])
+        return (self._sorted[start:stop] & ((1 << STRIKE_BITS) - 1)) / 100.0
+
+    def get(self, symbol: str, expiry, strike: float, option_type: str) -> int | None:
+        row = int(self.lookup([symbol], [expiry], [strike], [option_type])[0])
+        return None if row < 0 else row
@@ -1,4 +1,6 @@
 import math
+import numpy as np
+import pandas as pd
 
 
 class FuturesPricer:
@@ -24,3 +26,75 @@ class FuturesPricer:
     @staticmethod
     def delta() -> float:
         return 1.0
+
+    @staticmethod
+    def batch(df) -> dict:
+        return compute_futures_batch(df)
+
+
+TERM_KEY           = ["trade_date", "symbol"]
+FUTURES_QUANT_COLS = [
+    "theoretical_price", "basis", "implied_carry", "implied_repo", "delta",
+    "expiry_rank", "calendar_spread", "calendar_spread_fair", "roll_yield",
+]
+
+
+def theoretical_price_vec(S: np.ndarray, r: np.ndarray, q: np.ndarray, T: np.ndarray) -> np.ndarray:
+    return S * np.exp((r - q) * T)
+
+
+def implied_carry_vec(F: np.ndarray, S: np.ndarray, T: np.ndarray) -> np.ndarray:
+    # annualized continuously-compounded carry the market is pricing in
+    with np.errstate(divide="ignore", invalid="ignore"):
+        carry = np.log(F / S) / T
+    return np.where((T > 0) & (F > 0) & (S > 0), carry, np.nan)
+
+
+def _term_structure(df, F: np.ndarray, theo: np.ndarray, T: np.ndarray) -> dict:
+    n = len(df)
+    rank     = np.ones(n, dtype=np.int64)
+    spread   = np.full(n, np.nan)
+    fair     = np.full(n, np.nan)
+    roll     = np.full(n, np.nan)
+    if n == 0:
+        return {"expiry_rank": rank, "calendar_spread": spread, "calendar_spread_fair": fair, "roll_yield": roll}
+
+    group = pd.MultiIndex.from_arrays([df[c].to_numpy() for c in TERM_KEY]).factorize()[0]
+    order = np.lexsort((T, group))
+    g     = group[order]
+
+    starts = np.r_[True, g[1:] != g[:-1]]
+    pos    = np.arange(n) - np.maximum.accumulate(np.where(starts, np.arange(n), 0))
+    rank[order] = pos + 1
+
+    # each expiry against the next one out on the same date
+    has_next = np.r_[g[1:] == g[:-1], False]
+    cur, nxt = order[has_next], order[np.r_[False, has_next[:-1]]]
+    spread[cur] = F[nxt] - F[cur]
+    fair[cur]   = theo[nxt] - theo[cur]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dT = T[nxt] - T[cur]
+        roll[cur] = np.where(dT > 0, np.log(F[nxt] / F[cur]) / dT, np.nan)
+
+    return {"expiry_rank": rank, "calendar_spread": spread, "calendar_spread_fair": fair, "roll_yield": roll}
+
+
+def compute_futures_batch(df) -> dict:
+    S      = df["spot"].to_numpy(dtype=np.float64)
+    F      = df["settle"].to_numpy(dtype=np.float64)
+    r      = df["rate"].to_numpy(dtype=np.float64)
+    q      = df["div_yield"].to_numpy(dtype=np.float64) / 100.0
+    T      = df["dte"].to_numpy(dtype=np.float64) / 365.0
+
+    theo   = theoretical_price_vec(S, r, q, T)
+    carry  = implied_carry_vec(F, S, T)
+
+    return {
+        "theoretical_price": theo,
+        "basis":             F - theo,
+        "implied_carry":     carry,
+        # financing rate implied by the future given the index yield: F = S * exp((repo - q) T)
+        "implied_repo":      carry + q,
+        "delta":             np.ones(len(df)),
+        **_term_structure(df, F, theo, T),
+    }
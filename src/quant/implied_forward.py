@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+PARITY_PAIRS     = 3
+PARITY_KEY       = ["trade_date", "symbol", "expiry_date"]
+FORWARD_COLS     = PARITY_KEY + [
+    "dte", "spot", "rate", "forward", "implied_carry", "implied_div_yield", "n_pairs",
+]
+
+
+def _matched_pairs(options_df: pd.DataFrame) -> pd.DataFrame:
+    cols  = PARITY_KEY + ["strike", "dte", "spot", "rate", "settle"]
+    valid = options_df[(options_df["settle"] > 0) & (options_df["dte"] > 0)]
+
+    calls = valid.loc[valid["option_type"] == "CE", cols]
+    puts  = valid.loc[valid["option_type"] == "PE", PARITY_KEY + ["strike", "settle"]]
+    return calls.merge(puts, on=PARITY_KEY + ["strike"], suffixes=("_ce", "_pe"))
+
+
+def implied_forwards(options_df: pd.DataFrame, n_pairs: int = PARITY_PAIRS) -> pd.DataFrame:
+    # put-call parity: C - P = exp(-rT) * (F - K)  →  F = K + exp(rT) * (C - P)
+    pairs = _matched_pairs(options_df)
+    if pairs.empty:
+        return pd.DataFrame(columns=FORWARD_COLS)
+
+    T      = pairs["dte"].to_numpy(dtype=np.float64) / 365.0
+    r      = pairs["rate"].to_numpy(dtype=np.float64)
+    K      = pairs["strike"].to_numpy(dtype=np.float64)
+    c_p    = pairs["settle_ce"].to_numpy(dtype=np.float64) - pairs["settle_pe"].to_numpy(dtype=np.float64)
+
+    pairs["forward"] = K + np.exp(r * T) * c_p
+    pairs["atm_gap"] = np.abs(c_p)
+
+    # smallest |C - P| is closest to the forward, where both legs are most liquid
+    nearest = pairs.groupby(PARITY_KEY, sort=False)["atm_gap"].rank(method="first") <= n_pairs
+    out = pairs[nearest].groupby(PARITY_KEY, sort=True).agg(
+        dte=("dte", "first"),
+        spot=("spot", "first"),
+        rate=("rate", "first"),
+        forward=("forward", "median"),
+        n_pairs=("forward", "size"),
+    ).reset_index()
+
+    T = out["dte"].to_numpy(dtype=np.float64) / 365.0
+    F = out["forward"].to_numpy(dtype=np.float64)
+    S = out["spot"].to_numpy(dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        carry = np.log(F / S) / T
+    carry = np.where(F > 0, carry, np.nan)
+
+    out["implied_carry"]     = carry
+    # percent, same convention as v_processed_index_yield.div_yield
+    out["implied_div_yield"] = (out["rate"].to_numpy(dtype=np.float64) - carry) * 100
+    return out[FORWARD_COLS]
+
+
+def attach_implied_div_yield(chain_df: pd.DataFrame, forwards_df: pd.DataFrame) -> pd.DataFrame:
+    if forwards_df.empty:
+        out = chain_df.copy()
+        out["implied_div_yield"] = np.nan
+        return out
+    return chain_df.merge(forwards_df[PARITY_KEY + ["implied_div_yield"]], on=PARITY_KEY, how="left")
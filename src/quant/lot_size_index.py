@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+DEFAULT_LOT_SIZE = 1
+# days are offset so pre-1970 dates stay positive inside the low 32 bits
+DAY_OFFSET       = 1 << 31
+OPEN_END_DAY     = np.iinfo(np.int32).max
+
+
+def _days(values) -> tuple[np.ndarray, np.ndarray]:
+    ts    = pd.to_datetime(pd.Series(values, dtype=object), errors="coerce")
+    valid = ts.notna().to_numpy()
+    days  = np.zeros(len(ts), dtype=np.int64)
+    days[valid] = ts[valid].to_numpy().astype("datetime64[D]").astype(np.int64)
+    return days, valid
+
+
+class LotSizeIndex:
+    # per-symbol [start_date, end_date] intervals; a null end_date is open-ended.
+    # intervals are expected not to overlap; where they do, the later start wins
+
+    def __init__(self, symbol, start_date, end_date, lot_size):
+        symbol        = pd.Series(symbol, dtype=object).to_numpy()
+        start, dated  = _days(start_date)
+        end, has_end  = _days(end_date)
+        end           = np.where(has_end, end, OPEN_END_DAY)
+        lot_size      = np.asarray(lot_size, dtype=np.int64)
+
+        self.symbols = pd.Index(pd.unique(symbol[dated]))
+        code  = self.symbols.get_indexer(symbol)
+        keep  = dated & (code >= 0)
+        keys  = self._pack(code[keep], start[keep])
+        order = np.argsort(keys, kind="stable")
+
+        self._keys  = keys[order]
+        self._code  = code[keep][order]
+        self._end   = end[keep][order]
+        self._sizes = lot_size[keep][order]
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "LotSizeIndex":
+        if df.empty:
+            return cls([], [], [], [])
+        return cls(df["symbol"], df["start_date"], df["end_date"], df["lot_size"])
+
+    @staticmethod
+    def _pack(code: np.ndarray, day: np.ndarray) -> np.ndarray:
+        return (code.astype(np.int64) << 32) | (day + DAY_OFFSET)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def lot_size(self, symbols, dates, default: int = DEFAULT_LOT_SIZE) -> np.ndarray:
+        symbols = pd.Series(symbols, dtype=object).to_numpy()
+        out     = np.full(len(symbols), default, dtype=np.int64)
+        if len(self._keys) == 0 or len(symbols) == 0:
+            return out
+
+        code        = self.symbols.get_indexer(symbols)
+        day, dated  = _days(dates)
+        ok          = (code >= 0) & dated
+
+        # last interval of the same symbol starting on or before the date
+        pos  = np.searchsorted(self._keys, self._pack(np.maximum(code, 0), day), side="right") - 1
+        safe = np.maximum(pos, 0)
+        hit  = ok & (pos >= 0) & (self._code[safe] == code) & (day <= self._end[safe])
+        out[hit] = self._sizes[safe[hit]]
+        return out
+
+    def get(self, symbol: str, trade_date, default: int = DEFAULT_LOT_SIZE) -> int:
+        return int(self.lot_size([symbol], [trade_date], default=default)[0])
@@ -1,6 +1,7 @@
 import math
+import numpy as np
 import pandas as pd
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 from src.quant.scenario_engine import (
@@ -8,6 +9,10 @@ from src.quant.scenario_engine import (
     ScenarioPnL, scenario_option, scenario_futures,
 )
 from src.quant.black_scholes import _bs_price, _time_to_expiry
+from src.quant.columnar import ColumnarTable
+from src.quant.contract_index import ContractIndex
+from src.quant.lot_size_index import LotSizeIndex
+from src.quant.yield_curve import TENOR_DAYS, key_rate_rho
 
 
 VALID_SYMBOLS   = {"NIFTY", "BANKNIFTY", "FINNIFTY", "MIDCPNIFTY"}
@@ -38,6 +43,13 @@ class PositionResult:
     vega:           Optional[float]
     theta:          Optional[float]
     rho:            Optional[float]
+    dte:            Optional[int] = None
+
+
+class PositionTable(ColumnarTable):
+    FIELDS     = tuple(PositionResult.__dataclass_fields__)
+    STR_FIELDS = frozenset({"symbol", "expiry_date", "option_type", "entry_date", "method"})
+    INT_FIELDS = frozenset({"quantity", "lot_size", "dte"})
 
 
 @dataclass
@@ -50,12 +62,13 @@ class PortfolioSummary:
     net_vega:           float
     net_theta:          float
     net_rho:            float
+    key_rate_rho:       dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
 class PortfolioResult:
     trade_date:  str
-    positions:   list[PositionResult]
+    positions:   PositionTable
     summary:     PortfolioSummary
 
 
@@ -140,6 +153,12 @@ def _build_snapshot(row: pd.Series) -> MarketSnapshot:
     )
 
 
+def _append_position(rows: dict, **values):
+    values.setdefault("dte", None)
+    for name, column in rows.items():
+        column.append(values[name])
+
+
 def run_portfolio(
     positions_df: pd.DataFrame,
     curated_options: pd.DataFrame,
@@ -147,11 +166,33 @@ def run_portfolio(
     lot_size_df: pd.DataFrame,
     shock: Shock,
     trade_date: str,
+    option_index: Optional[ContractIndex] = None,
+    futures_index: Optional[ContractIndex] = None,
+    lot_size_index: Optional[LotSizeIndex] = None,
 ) -> PortfolioResult:
     positions_df = _validate_csv(positions_df)
-    results: list[PositionResult] = []
+    rows = {name: [] for name in PositionTable.FIELDS}
+
+    # pass prebuilt indexes when pricing the same day repeatedly (VaR, cached snapshots)
+    if option_index is None:
+        option_index = ContractIndex.from_frame(curated_options)
+    if futures_index is None:
+        futures_index = ContractIndex.from_frame(curated_futures)
+    if lot_size_index is None:
+        lot_size_index = LotSizeIndex.from_frame(lot_size_df)
+
+    n_legs    = len(positions_df)
+    lot_sizes = lot_size_index.lot_size(positions_df["symbol"], np.full(n_legs, trade_date, dtype=object))
+    opt_rows = option_index.lookup(
+        positions_df["symbol"], positions_df["expiry_date"],
+        positions_df["strike"], positions_df["option_type"],
+    )
+    fut_rows = futures_index.lookup(
+        positions_df["symbol"], positions_df["expiry_date"],
+        np.zeros(n_legs), np.full(n_legs, "XX", dtype=object),
+    )
 
-    for _, pos in positions_df.iterrows():
+    for i, (_, pos) in enumerate(positions_df.iterrows()):
         symbol      = pos["symbol"]
         option_type = pos["option_type"]
         expiry_date = pos["expiry_date"]
@@ -160,26 +201,11 @@ def run_portfolio(
         entry_price = float(pos["entry_price"])
         entry_date  = str(pos["entry_date"])
 
-        trade_date_as_date = pd.Timestamp(trade_date).date()
-        lot_size_filtered = lot_size_df[lot_size_df["symbol"] == symbol].copy()
-        lot_size_filtered["start_date"] = pd.to_datetime(lot_size_filtered["start_date"], errors="coerce").dt.date
-        lot_size_filtered["end_date"]   = pd.to_datetime(lot_size_filtered["end_date"],   errors="coerce").dt.date
-        lot_rows = lot_size_filtered[
-            (lot_size_filtered["start_date"] <= trade_date_as_date) &
-            (
-                lot_size_filtered["end_date"].isna() |
-                (lot_size_filtered["end_date"] >= trade_date_as_date)
-            )
-        ]
-        lot_size = int(lot_rows.iloc[0]["lot_size"]) if not lot_rows.empty else 1
+        lot_size    = int(lot_sizes[i])
 
         if option_type == "XX":
-            fut_rows = curated_futures[
-                (curated_futures["symbol"]      == symbol) &
-                (curated_futures["expiry_date"] == expiry_date)
-            ]
-            if fut_rows.empty:
-                results.append(PositionResult(
+            if fut_rows[i] < 0:
+                _append_position(rows,
                     symbol=symbol, expiry_date=str(expiry_date),
                     strike=strike, option_type=option_type,
                     quantity=quantity, lot_size=lot_size,
@@ -188,10 +214,10 @@ def run_portfolio(
                     scenario_pnl=0.0, total_pnl=0.0,
                     method="no_data",
                     delta=None, gamma=None, vega=None, theta=None, rho=None,
-                ))
+                )
                 continue
 
-            fut_row  = fut_rows.iloc[0]
+            fut_row  = curated_futures.iloc[fut_rows[i]]
             snapshot = MarketSnapshot(
                 spot=float(fut_row["spot"]),
                 iv=None, rate=float(fut_row["rate"]),
@@ -204,7 +230,7 @@ def run_portfolio(
             scenario      = scenario_futures(snapshot, contract, shock)
             scenario_pnl  = scenario.pnl_total
 
-            results.append(PositionResult(
+            _append_position(rows,
                 symbol=symbol, expiry_date=str(expiry_date),
                 strike=strike, option_type=option_type,
                 quantity=quantity, lot_size=lot_size,
@@ -214,17 +240,12 @@ def run_portfolio(
                 total_pnl=mtm_pnl + scenario_pnl,
                 method="futures_linear",
                 delta=1.0, gamma=0.0, vega=0.0, theta=0.0, rho=0.0,
-            ))
+                dte=snapshot.dte,
+            )
 
         else:
-            opt_rows = curated_options[
-                (curated_options["symbol"]      == symbol) &
-                (curated_options["expiry_date"] == expiry_date) &
-                (curated_options["strike"]      == strike) &
-                (curated_options["option_type"] == option_type)
-            ]
-            if opt_rows.empty:
-                results.append(PositionResult(
+            if opt_rows[i] < 0:
+                _append_position(rows,
                     symbol=symbol, expiry_date=str(expiry_date),
                     strike=strike, option_type=option_type,
                     quantity=quantity, lot_size=lot_size,
@@ -233,10 +254,10 @@ def run_portfolio(
                     scenario_pnl=0.0, total_pnl=0.0,
                     method="no_data",
                     delta=None, gamma=None, vega=None, theta=None, rho=None,
-                ))
+                )
                 continue
 
-            opt_row  = opt_rows.iloc[0]
+            opt_row  = curated_options.iloc[opt_rows[i]]
             snapshot = _build_snapshot(opt_row)
             contract = OptionContract(
                 strike=strike, option_type=option_type,
@@ -246,7 +267,7 @@ def run_portfolio(
             scenario     = scenario_option(snapshot, contract, shock)
             scenario_pnl = scenario.pnl_total
 
-            results.append(PositionResult(
+            _append_position(rows,
                 symbol=symbol, expiry_date=str(expiry_date),
                 strike=strike, option_type=option_type,
                 quantity=quantity, lot_size=lot_size,
@@ -257,28 +278,39 @@ def run_portfolio(
                 method=scenario.method,
                 delta=snapshot.delta, gamma=snapshot.gamma,
                 vega=snapshot.vega,   theta=snapshot.theta,
-                rho=snapshot.rho,
-            ))
+                rho=snapshot.rho,     dte=snapshot.dte,
+            )
+
+    positions  = PositionTable(rows)
+    multiplier = positions.quantity * positions.lot_size
 
     def _safe_sum(attr: str) -> float:
-        return sum(
-            (getattr(r, attr) or 0.0) * r.quantity * r.lot_size
-            for r in results
-        )
+        return float(np.nansum(positions.columns[attr] * multiplier))
+
+    def _key_rate_rho() -> dict[str, float]:
+        priced = ~np.isnan(positions.rho) & ~np.isnan(positions.dte.astype(np.float64))
+        if not priced.any():
+            return {tenor: 0.0 for tenor in TENOR_DAYS}
+        buckets = key_rate_rho(
+            positions.rho[priced] * multiplier[priced],
+            positions.dte[priced],
+        ).sum(axis=0)
+        return {tenor: float(v) for tenor, v in zip(TENOR_DAYS, buckets)}
 
     summary = PortfolioSummary(
-        total_mtm_pnl=sum(r.mtm_pnl      for r in results),
-        total_scenario_pnl=sum(r.scenario_pnl for r in results),
-        total_pnl=sum(r.total_pnl        for r in results),
+        total_mtm_pnl=float(positions.mtm_pnl.sum()),
+        total_scenario_pnl=float(positions.scenario_pnl.sum()),
+        total_pnl=float(positions.total_pnl.sum()),
         net_delta=_safe_sum("delta"),
         net_gamma=_safe_sum("gamma"),
         net_vega=_safe_sum("vega"),
         net_theta=_safe_sum("theta"),
         net_rho=_safe_sum("rho"),
+        key_rate_rho=_key_rate_rho(),
     )
 
     return PortfolioResult(
         trade_date=trade_date,
-        positions=results,
+        positions=positions,
         summary=summary,
     )
@@ -0,0 +1,175 @@
+import numpy as np
+import pandas as pd
+
+from src.quant.bs_vectorized import _bs_price_vec
+from src.quant.portfolio import _validate_csv
+from src.quant.lot_size_index import LotSizeIndex
+
+
+GREEK_COLS  = ["delta", "gamma", "vega", "theta", "rho"]
+SERIES_COLS = [
+    "trade_date", "mtm_pnl", "realized_pnl", "total_pnl",
+    "net_delta", "net_gamma", "net_vega", "net_theta", "net_rho",
+    "open_legs", "expired_legs", "no_data_legs",
+]
+
+
+def _to_datetime64(values) -> np.ndarray:
+    return pd.to_datetime(pd.Series(values)).to_numpy(dtype="datetime64[ns]")
+
+
+def _lot_sizes(symbols: np.ndarray, dates: np.ndarray, lot_size_df: pd.DataFrame) -> np.ndarray:
+    return LotSizeIndex.from_frame(lot_size_df).lot_size(symbols, dates)
+
+
+def _spot_by_date(curated_options: pd.DataFrame, curated_futures: pd.DataFrame) -> pd.DataFrame:
+    frames = [
+        df[["trade_date", "symbol", "spot"]]
+        for df in (curated_options, curated_futures)
+        if not df.empty
+    ]
+    if not frames:
+        return pd.DataFrame(columns=["trade_date", "symbol", "spot"])
+    spots = pd.concat(frames, ignore_index=True)
+    spots["trade_date"] = _to_datetime64(spots["trade_date"])
+    return spots.drop_duplicates(subset=["trade_date", "symbol"])
+
+
+def _leg_grid(legs: pd.DataFrame, dates: np.ndarray, lot_size_df: pd.DataFrame) -> pd.DataFrame:
+    n_legs  = len(legs)
+    n_dates = len(dates)
+    grid = legs.iloc[np.repeat(np.arange(n_legs), n_dates)].reset_index(drop=True)
+    grid["trade_date"] = np.tile(dates, n_legs)
+    grid = grid[grid["trade_date"].to_numpy() >= grid["entry_date"].to_numpy()].reset_index(drop=True)
+    grid["lot_size"] = _lot_sizes(
+        grid["symbol"].to_numpy(), grid["trade_date"].to_numpy(), lot_size_df
+    )
+    return grid
+
+
+def _replay_options(grid: pd.DataFrame, curated_options: pd.DataFrame, spots: pd.DataFrame) -> pd.DataFrame:
+    key    = ["trade_date", "symbol", "expiry_date", "strike", "option_type"]
+    market = curated_options[key + ["dte", "spot", "div_yield", "rate", "iv", "settle"] + GREEK_COLS].copy()
+    market["trade_date"]  = _to_datetime64(market["trade_date"])
+    market["expiry_date"] = _to_datetime64(market["expiry_date"])
+    grid = grid.merge(market, on=key, how="left")
+
+    expiry_spot = spots.rename(columns={"trade_date": "expiry_date", "spot": "expiry_spot"})
+    grid = grid.merge(expiry_spot, on=["expiry_date", "symbol"], how="left")
+
+    multiplier = grid["quantity"].to_numpy(dtype=np.float64) * grid["lot_size"].to_numpy(dtype=np.float64)
+    entry      = grid["entry_price"].to_numpy(dtype=np.float64)
+    K          = grid["strike"].to_numpy(dtype=np.float64)
+    is_call    = grid["option_type"].to_numpy() == "CE"
+    expired    = grid["trade_date"].to_numpy() >= grid["expiry_date"].to_numpy()
+
+    iv       = grid["iv"].to_numpy(dtype=np.float64)
+    dte      = grid["dte"].to_numpy(dtype=np.float64)
+    repriced = ~expired & (dte > 0) & (iv > 0)
+    model_price = _bs_price_vec(
+        grid["spot"].to_numpy(dtype=np.float64), K, dte / 365.0,
+        grid["rate"].to_numpy(dtype=np.float64),
+        grid["div_yield"].to_numpy(dtype=np.float64) / 100,
+        np.where(repriced, iv, 0.2), is_call,
+    )
+    current_price = np.where(repriced, model_price, grid["settle"].to_numpy(dtype=np.float64))
+    current_price = np.where(expired, np.nan, current_price)
+
+    S_T       = grid["expiry_spot"].to_numpy(dtype=np.float64)
+    intrinsic = np.where(is_call, np.maximum(S_T - K, 0.0), np.maximum(K - S_T, 0.0))
+
+    grid["mtm_pnl"]      = np.nan_to_num((current_price - entry) * multiplier)
+    grid["realized_pnl"] = np.where(expired, np.nan_to_num((intrinsic - entry) * multiplier), 0.0)
+    grid["is_open"]      = ~expired & ~np.isnan(current_price)
+    grid["is_expired"]   = expired & ~np.isnan(S_T)
+    grid["is_no_data"]   = ~grid["is_open"] & ~grid["is_expired"]
+    for col in GREEK_COLS:
+        greek = grid[col].to_numpy(dtype=np.float64)
+        grid[f"net_{col}"] = np.where(grid["is_open"], np.nan_to_num(greek) * multiplier, 0.0)
+    return grid
+
+
+def _replay_futures(grid: pd.DataFrame, curated_futures: pd.DataFrame, spots: pd.DataFrame) -> pd.DataFrame:
+    key    = ["trade_date", "symbol", "expiry_date"]
+    market = curated_futures[key + ["spot"]].copy()
+    market["trade_date"]  = _to_datetime64(market["trade_date"])
+    market["expiry_date"] = _to_datetime64(market["expiry_date"])
+    grid = grid.merge(market, on=key, how="left")
+
+    expiry_spot = spots.rename(columns={"trade_date": "expiry_date", "spot": "expiry_spot"})
+    grid = grid.merge(expiry_spot, on=["expiry_date", "symbol"], how="left")
+
+    multiplier = grid["quantity"].to_numpy(dtype=np.float64) * grid["lot_size"].to_numpy(dtype=np.float64)
+    entry      = grid["entry_price"].to_numpy(dtype=np.float64)
+    expired    = grid["trade_date"].to_numpy() >= grid["expiry_date"].to_numpy()
+    spot       = np.where(expired, np.nan, grid["spot"].to_numpy(dtype=np.float64))
+    S_T        = grid["expiry_spot"].to_numpy(dtype=np.float64)
+
+    grid["mtm_pnl"]      = np.nan_to_num((spot - entry) * multiplier)
+    grid["realized_pnl"] = np.where(expired, np.nan_to_num((S_T - entry) * multiplier), 0.0)
+    grid["is_open"]      = ~expired & ~np.isnan(spot)
+    grid["is_expired"]   = expired & ~np.isnan(S_T)
+    grid["is_no_data"]   = ~grid["is_open"] & ~grid["is_expired"]
+    grid["net_delta"]    = np.where(grid["is_open"], multiplier, 0.0)
+    for col in GREEK_COLS[1:]:
+        grid[f"net_{col}"] = 0.0
+    return grid
+
+
+def run_replay(
+    positions_df: pd.DataFrame,
+    curated_options: pd.DataFrame,
+    curated_futures: pd.DataFrame,
+    lot_size_df: pd.DataFrame,
+    start_date: str,
+    end_date: str,
+) -> pd.DataFrame:
+    legs = _validate_csv(positions_df.copy())
+    legs["entry_date"]  = _to_datetime64(legs["entry_date"])
+    legs["expiry_date"] = _to_datetime64(legs["expiry_date"])
+
+    start = np.datetime64(pd.Timestamp(start_date), "ns")
+    end   = np.datetime64(pd.Timestamp(end_date),   "ns")
+
+    frames = [df["trade_date"] for df in (curated_options, curated_futures) if not df.empty]
+    all_dates = _to_datetime64(pd.concat(frames, ignore_index=True)) if frames else np.array([], dtype="datetime64[ns]")
+    dates = np.unique(all_dates[(all_dates >= start) & (all_dates <= end)])
+
+    if len(dates) == 0:
+        return pd.DataFrame(columns=SERIES_COLS)
+
+    spots    = _spot_by_date(curated_options, curated_futures)
+    is_fut   = (legs["option_type"] == "XX").to_numpy()
+    replayed = []
+
+    if (~is_fut).any() and not curated_options.empty:
+        grid = _leg_grid(legs[~is_fut], dates, lot_size_df)
+        replayed.append(_replay_options(grid, curated_options, spots))
+    if is_fut.any() and not curated_futures.empty:
+        grid = _leg_grid(legs[is_fut], dates, lot_size_df)
+        replayed.append(_replay_futures(grid, curated_futures, spots))
+
+    if not replayed:
+        return pd.DataFrame(columns=SERIES_COLS)
+
+    legs_by_date = pd.concat(replayed, ignore_index=True)
+    series = legs_by_date.groupby("trade_date").agg(
+        mtm_pnl=("mtm_pnl", "sum"),
+        realized_pnl=("realized_pnl", "sum"),
+        net_delta=("net_delta", "sum"),
+        net_gamma=("net_gamma", "sum"),
+        net_vega=("net_vega", "sum"),
+        net_theta=("net_theta", "sum"),
+        net_rho=("net_rho", "sum"),
+        open_legs=("is_open", "sum"),
+        expired_legs=("is_expired", "sum"),
+        no_data_legs=("is_no_data", "sum"),
+    ).reindex(dates, fill_value=0)
+
+    series.index.name = "trade_date"
+    series = series.reset_index()
+    series["total_pnl"]  = series["mtm_pnl"] + series["realized_pnl"]
+    series["trade_date"] = pd.to_datetime(series["trade_date"]).dt.date
+    for col in ["open_legs", "expired_legs", "no_data_legs"]:
+        series[col] = series[col].astype(int)
+    return series[SERIES_COLS]
@@ -1,9 +1,12 @@
 import math
+import numpy as np
+import pandas as pd
 from dataclasses import dataclass
 from typing import Optional
 
 from src.quant.black_scholes import _bs_price, _bs_greeks, _time_to_expiry
-from src.quant.yield_curve import TenorRates, interpolate_rate
+from src.quant.bs_vectorized import _bs_price_vec, _greeks_vec
+from src.quant.yield_curve import tenor_shift_bps
 
 
 @dataclass
@@ -22,9 +25,15 @@ class MarketSnapshot:
 
 @dataclass
 class Shock:
-    spot_shock_pct:  float
-    vol_shock_abs:   float
-    rate_shock_bps:  float
+    spot_shock_pct:    float
+    vol_shock_abs:     float
+    rate_shock_bps:    float
+    tenor_shocks_bps:  Optional[dict[str, float]] = None
+
+
+def shock_rate_bps(shock: Shock, dte) -> np.ndarray:
+    # parallel bump plus the tenor bumps re-interpolated at each leg's DTE
+    return shock.rate_shock_bps + tenor_shift_bps(shock.tenor_shocks_bps, dte)
 
 
 @dataclass
@@ -53,7 +62,7 @@ class ScenarioPnL:
 
 def _apply_shock_to_market(snapshot: MarketSnapshot, shock: Shock) -> tuple[float, float, float]:
     S_shocked = snapshot.spot * (1.0 + shock.spot_shock_pct / 100.0)
-    r_shocked = snapshot.rate + shock.rate_shock_bps / 10000.0
+    r_shocked = snapshot.rate + float(shock_rate_bps(shock, snapshot.dte)) / 10000.0
     σ_shocked = (snapshot.iv or 0.0) + shock.vol_shock_abs / 100.0
     return S_shocked, r_shocked, σ_shocked
 
@@ -123,7 +132,7 @@ def scenario_option(
     ]):
         ΔS          = S_shocked - snapshot.spot
         Δσ_pts      = shock.vol_shock_abs
-        Δr_pts      = shock.rate_shock_bps / 100.0
+        Δr_pts      = float(shock_rate_bps(shock, snapshot.dte)) / 100.0
 
         pnl_per_lot = (
             snapshot.delta * ΔS
@@ -172,3 +181,35 @@ def scenario_futures(
         pnl_total=pnl_total,
         method="futures_linear",
     )
+
+
+def scenario_chain(chain_df: pd.DataFrame, shock: Shock) -> dict:
+    S       = chain_df["spot"].to_numpy(dtype=np.float64)
+    K       = chain_df["strike"].to_numpy(dtype=np.float64)
+    dte     = chain_df["dte"].to_numpy(dtype=np.float64)
+    r       = chain_df["rate"].to_numpy(dtype=np.float64)
+    q       = chain_df["div_yield"].to_numpy(dtype=np.float64) / 100
+    iv      = chain_df["iv"].to_numpy(dtype=np.float64)
+    is_call = chain_df["option_type"].to_numpy() == "CE"
+    T       = dte / 365.0
+
+    priced = (dte > 0) & (iv > 0)
+    σ_base = np.where(priced, iv, 1e-4)
+
+    S_shocked = S * (1.0 + shock.spot_shock_pct / 100.0)
+    r_shocked = r + shock_rate_bps(shock, dte) / 10000.0
+    σ_shocked = np.maximum(σ_base + shock.vol_shock_abs / 100.0, 1e-4)
+
+    base_price    = _bs_price_vec(S,         K, T, r,         q, σ_base,    is_call)
+    shocked_price = _bs_price_vec(S_shocked, K, T, r_shocked, q, σ_shocked, is_call)
+    greeks        = _greeks_vec(S_shocked,   K, T, r_shocked, q, σ_shocked, is_call)
+
+    result = {
+        "base_price":    np.where(priced, base_price,    np.nan),
+        "shocked_price": np.where(priced, shocked_price, np.nan),
+        "pnl":           np.where(priced, shocked_price - base_price, np.nan),
+    }
+    for name, values in zip(["delta", "gamma", "vega", "theta", "rho"], greeks):
+        result[name] = np.where(priced, values, np.nan)
+
+    return result
@@ -2,10 +2,14 @@ import numpy as np
 import pandas as pd
 import duckdb
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 from src.quant.scenario_engine import Shock
 from src.quant.portfolio import run_portfolio
+from src.quant.columnar import ColumnarTable
+from src.quant.contract_index import ContractIndex
+from src.quant.lot_size_index import LotSizeIndex
 
 
 @dataclass
@@ -15,6 +19,11 @@ class ScenarioPnLPoint:
     portfolio_pnl:  float
 
 
+class ScenarioPnLTable(ColumnarTable):
+    FIELDS     = tuple(ScenarioPnLPoint.__dataclass_fields__)
+    STR_FIELDS = frozenset({"date"})
+
+
 @dataclass
 class VaRResult:
     symbol:             str
@@ -28,7 +37,13 @@ class VaRResult:
     mean_pnl:           float
     min_pnl:            float
     max_pnl:            float
-    pnl_distribution:   list[ScenarioPnLPoint]
+    scenarios:          ScenarioPnLTable
+
+    @cached_property
+    def pnl_distribution(self) -> list:
+        # row views over `scenarios`, built on first access for callers that iterate
+        # the distribution; the columnar layout never pays for them
+        return list(self.scenarios)
 
 
 def _fetch_historical_returns(
@@ -40,11 +55,11 @@ def _fetch_historical_returns(
     query = """
         WITH spot_series AS (
             SELECT
-                CAST(trade_date AS DATE) AS trade_date,
+                trade_date,
                 close AS spot
             FROM v_processed_index_spot
             WHERE symbol = ?
-              AND CAST(trade_date AS DATE) <= ?
+              AND trade_date <= ?
             ORDER BY trade_date DESC
             LIMIT ?
         ),
@@ -76,6 +91,9 @@ def _compute_portfolio_pnl(
     lot_size_df: pd.DataFrame,
     trade_date: str,
     spot_return: float,
+    option_index: Optional[ContractIndex] = None,
+    futures_index: Optional[ContractIndex] = None,
+    lot_size_index: Optional[LotSizeIndex] = None,
 ) -> float:
     shock = Shock(
         spot_shock_pct=spot_return * 100.0,
@@ -89,6 +107,9 @@ def _compute_portfolio_pnl(
         lot_size_df=lot_size_df,
         shock=shock,
         trade_date=trade_date,
+        option_index=option_index,
+        futures_index=futures_index,
+        lot_size_index=lot_size_index,
     )
     return result.summary.total_scenario_pnl
 
@@ -102,6 +123,9 @@ def compute_var(
     trade_date: str,
     db: duckdb.DuckDBPyConnection,
     lookback_days: int = 252,
+    option_index: Optional[ContractIndex] = None,
+    futures_index: Optional[ContractIndex] = None,
+    lot_size_index: Optional[LotSizeIndex] = None,
 ) -> VaRResult:
     returns_df = _fetch_historical_returns(
         db=db,
@@ -116,28 +140,36 @@ def compute_var(
             f"Check that processed index spot data exists."
         )
 
-    scenarios: list[ScenarioPnLPoint] = []
+    spot_returns = returns_df["daily_return"].to_numpy(dtype=np.float64)
+    pnl_array    = np.empty(len(spot_returns))
 
-    for _, row in returns_df.iterrows():
-        spot_return  = float(row["daily_return"])
-        scenario_date = str(row["trade_date"])
+    # every scenario reprices the same day's chain; index it once
+    if option_index is None:
+        option_index = ContractIndex.from_frame(curated_options)
+    if futures_index is None:
+        futures_index = ContractIndex.from_frame(curated_futures)
+    if lot_size_index is None:
+        lot_size_index = LotSizeIndex.from_frame(lot_size_df)
 
+    for i, spot_return in enumerate(spot_returns):
         pnl = _compute_portfolio_pnl(
             positions_df=positions_df,
             curated_options=curated_options,
             curated_futures=curated_futures,
             lot_size_df=lot_size_df,
             trade_date=trade_date,
-            spot_return=spot_return,
+            spot_return=float(spot_return),
+            option_index=option_index,
+            futures_index=futures_index,
+            lot_size_index=lot_size_index,
         )
+        pnl_array[i] = round(pnl, 2)
 
-        scenarios.append(ScenarioPnLPoint(
-            date=scenario_date,
-            spot_return_pct=round(spot_return * 100, 4),
-            portfolio_pnl=round(pnl, 2),
-        ))
-
-    pnl_array = np.array([s.portfolio_pnl for s in scenarios])
+    scenarios = ScenarioPnLTable({
+        "date":            returns_df["trade_date"].astype(str).tolist(),
+        "spot_return_pct": np.round(spot_returns * 100, 4),
+        "portfolio_pnl":   pnl_array,
+    })
 
     var_95  = float(-np.percentile(pnl_array, 5))
     var_99  = float(-np.percentile(pnl_array, 1))
@@ -156,5 +188,5 @@ def compute_var(
         mean_pnl=round(float(pnl_array.mean()), 2),
         min_pnl=round(float(pnl_array.min()), 2),
         max_pnl=round(float(pnl_array.max()), 2),
-        pnl_distribution=scenarios,
+        scenarios=scenarios,
     )
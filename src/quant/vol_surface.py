@@ -0,0 +1,197 @@
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+
+SVI_MIN_POINTS   = 5
+GRID_SIZE        = 21
+REFINE_PASSES    = 2
+SIGMA_MIN        = 1e-3
+SIGMA_MAX        = 1.0
+RIDGE            = 1e-12
+SLICE_KEY        = ["trade_date", "symbol", "expiry_date"]
+SURFACE_COLS     = SLICE_KEY + [
+    "dte", "T", "spot", "forward", "a", "b", "rho", "m", "sigma",
+    "atm_iv", "n_points", "rmse",
+]
+
+
+@dataclass
+class SVIParams:
+    a:      float
+    b:      float
+    rho:    float
+    m:      float
+    sigma:  float
+
+
+def svi_total_variance(k, a, b, rho, m, sigma) -> np.ndarray:
+    x = np.asarray(k, dtype=np.float64) - m
+    return a + b * (rho * x + np.sqrt(x * x + sigma * sigma))
+
+
+def _solve_linear(k: np.ndarray, w: np.ndarray, m: np.ndarray, sigma: np.ndarray):
+    # for fixed (m, sigma) raw SVI is linear in (a, b*rho*sigma, b*sigma):
+    # w = a + d*y + c*z with y = (k - m) / sigma, z = sqrt(y^2 + 1)
+    y = (k[None, :] - m[:, None]) / sigma[:, None]
+    z = np.sqrt(y * y + 1.0)
+    X = np.stack([np.ones_like(y), y, z], axis=2)
+
+    XtX  = np.einsum("gni,gnj->gij", X, X) + RIDGE * np.eye(3)
+    Xtw  = np.einsum("gni,n->gi", X, w)
+    beta = np.linalg.solve(XtX, Xtw[..., None])[..., 0]
+
+    a, d, c = beta[:, 0], beta[:, 1], beta[:, 2]
+    c = np.maximum(c, 0.0)
+    d = np.clip(d, -c, c)
+    a = np.maximum(a, -np.sqrt(np.maximum(c * c - d * d, 0.0)))
+
+    fitted = a[:, None] + d[:, None] * y + c[:, None] * z
+    sse    = ((fitted - w[None, :]) ** 2).sum(axis=1)
+    return a, d, c, sse
+
+
+def fit_svi_slice(k: np.ndarray, w: np.ndarray) -> tuple[SVIParams, float]:
+    k = np.asarray(k, dtype=np.float64)
+    w = np.asarray(w, dtype=np.float64)
+
+    m_lo, m_hi = float(k.min()), float(k.max())
+    s_lo, s_hi = np.log(SIGMA_MIN), np.log(SIGMA_MAX)
+
+    for _ in range(REFINE_PASSES + 1):
+        m_axis = np.linspace(m_lo, m_hi, GRID_SIZE)
+        s_axis = np.exp(np.linspace(s_lo, s_hi, GRID_SIZE))
+        m_grid, s_grid = (g.ravel() for g in np.meshgrid(m_axis, s_axis))
+
+        a, d, c, sse = _solve_linear(k, w, m_grid, s_grid)
+        best = int(np.argmin(sse))
+
+        m_step = (m_hi - m_lo) / (GRID_SIZE - 1)
+        s_step = (s_hi - s_lo) / (GRID_SIZE - 1)
+        m_lo, m_hi = m_grid[best] - m_step, m_grid[best] + m_step
+        s_lo, s_hi = np.log(s_grid[best]) - s_step, np.log(s_grid[best]) + s_step
+
+    sigma = float(s_grid[best])
+    c     = float(c[best])
+    b     = c / sigma
+    rho   = float(d[best]) / c if c > 0 else 0.0
+    rmse  = float(np.sqrt(sse[best] / len(k)))
+    return SVIParams(a=float(a[best]), b=b, rho=rho, m=float(m_grid[best]), sigma=sigma), rmse
+
+
+def _otm_slice_points(df: pd.DataFrame) -> pd.DataFrame:
+    T   = df["dte"].to_numpy(dtype=np.float64) / 365.0
+    S   = df["spot"].to_numpy(dtype=np.float64)
+    r   = df["rate"].to_numpy(dtype=np.float64)
+    q   = df["div_yield"].to_numpy(dtype=np.float64) / 100
+    K   = df["strike"].to_numpy(dtype=np.float64)
+    iv  = df["iv"].to_numpy(dtype=np.float64)
+    F   = S * np.exp((r - q) * T)
+    k   = np.log(K / F)
+    otm = np.where(df["option_type"].to_numpy() == "CE", k >= 0, k < 0)
+
+    out = df[SLICE_KEY + ["dte", "spot"]].copy()
+    out["T"]       = T
+    out["forward"] = F
+    out["k"]       = k
+    out["w"]       = iv * iv * T
+    return out[otm & (T > 0) & (iv > 0)]
+
+
+def fit_svi_surface(chain_df: pd.DataFrame) -> pd.DataFrame:
+    points = _otm_slice_points(chain_df)
+    rows = []
+
+    for key, grp in points.groupby(SLICE_KEY, sort=True):
+        if len(grp) < SVI_MIN_POINTS:
+            continue
+        params, rmse = fit_svi_slice(grp["k"].to_numpy(), grp["w"].to_numpy())
+        T        = float(grp["T"].iloc[0])
+        atm_w    = float(svi_total_variance(0.0, params.a, params.b, params.rho, params.m, params.sigma))
+        rows.append({
+            "trade_date":  key[0],
+            "symbol":      key[1],
+            "expiry_date": key[2],
+            "dte":         int(grp["dte"].iloc[0]),
+            "T":           T,
+            "spot":        float(grp["spot"].iloc[0]),
+            "forward":     float(grp["forward"].iloc[0]),
+            "a":           params.a,
+            "b":           params.b,
+            "rho":         params.rho,
+            "m":           params.m,
+            "sigma":       params.sigma,
+            "atm_iv":      float(np.sqrt(max(atm_w, 0.0) / T)),
+            "n_points":    len(grp),
+            "rmse":        rmse,
+        })
+
+    return pd.DataFrame(rows, columns=SURFACE_COLS)
+
+
+class VolSurface:
+
+    def __init__(self, params_df: pd.DataFrame, parallel: float = 0.0, skew: float = 0.0, term: float = 0.0):
+        params_df = params_df.sort_values("T")
+        if params_df.empty:
+            raise ValueError("Cannot build a vol surface from zero SVI slices.")
+        self.params_df = params_df
+        self.T         = params_df["T"].to_numpy(dtype=np.float64)
+        self.spot      = float(params_df["spot"].iloc[0])
+        self.log_fwd   = np.log(params_df["forward"].to_numpy(dtype=np.float64))
+        self._params   = params_df[["a", "b", "rho", "m", "sigma"]].to_numpy(dtype=np.float64)
+        self.parallel  = parallel
+        self.skew      = skew
+        self.term      = term
+
+    def shocked(self, parallel: float = 0.0, skew: float = 0.0, term: float = 0.0) -> "VolSurface":
+        # parallel: vol points, skew: vol points per unit log-moneyness, term: vol points per year
+        return VolSurface(
+            self.params_df,
+            parallel=self.parallel + parallel,
+            skew=self.skew + skew,
+            term=self.term + term,
+        )
+
+    def _forward(self, T: np.ndarray, spot: float) -> np.ndarray:
+        # log-forward is linear in T under constant carry; interpolate the carry between slices
+        carry = (self.log_fwd - np.log(self.spot)) / self.T
+        return spot * np.exp(np.interp(T, self.T, carry) * T)
+
+    def _slice_variance(self, k: np.ndarray, idx: np.ndarray) -> np.ndarray:
+        p = self._params[idx]
+        return svi_total_variance(k, p[:, 0], p[:, 1], p[:, 2], p[:, 3], p[:, 4])
+
+    def total_variance(self, k, T) -> np.ndarray:
+        k, T = np.broadcast_arrays(np.asarray(k, dtype=np.float64), np.asarray(T, dtype=np.float64))
+        k, T = k.ravel(), T.ravel()
+
+        hi = np.clip(np.searchsorted(self.T, T), 1, len(self.T) - 1) if len(self.T) > 1 else np.zeros(len(T), dtype=int)
+        lo = np.maximum(hi - 1, 0)
+
+        w_lo = self._slice_variance(k, lo)
+        w_hi = self._slice_variance(k, hi)
+        T_lo = self.T[lo]
+        T_hi = self.T[hi]
+
+        span   = np.where(T_hi > T_lo, T_hi - T_lo, 1.0)
+        weight = np.clip((T - T_lo) / span, 0.0, 1.0)
+        w      = w_lo + weight * (w_hi - w_lo)
+
+        # flat implied vol outside the fitted expiry range
+        w = np.where(T < self.T[0],  w_lo / self.T[0]  * T, w)
+        w = np.where(T > self.T[-1], w_hi / self.T[-1] * T, w)
+        return np.maximum(w, 0.0)
+
+    def iv(self, strike, dte, spot: float | None = None) -> np.ndarray:
+        # spot=None is sticky-strike; passing a shocked spot moves the forward
+        # with it, which keeps IV fixed in moneyness (sticky-delta)
+        K = np.asarray(strike, dtype=np.float64)
+        T = np.maximum(np.asarray(dte, dtype=np.float64), 1e-10) / 365.0
+        K, T = np.broadcast_arrays(K, T)
+
+        F = self._forward(T.ravel(), self.spot if spot is None else spot)
+        k = np.log(K.ravel() / F)
+        w = self.total_variance(k, T.ravel())
+
+        vol = np.sqrt(w / T.ravel()) + (self.parallel + self.skew * k + self.term * T.ravel()) / 100.0
+        return np.maximum(vol, 1e-4).reshape(K.shape)
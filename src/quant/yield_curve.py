@@ -1,6 +1,9 @@
+import numpy as np
+import pandas as pd
 from dataclasses import dataclass
 
-TENOR_DAYS = {"3m": 91,"6m": 182,"1y": 365,}
+TENOR_DAYS    = {"3m": 91,"6m": 182,"1y": 365,}
+TENOR_COLUMNS = {"rate_3m": "3m", "rate_6m": "6m", "rate_1y": "1y"}
 
 @dataclass
 class TenorRates:
@@ -9,22 +12,139 @@ class TenorRates:
     rate_1y: float
 
 
+class YieldCurve:
+
+    def __init__(self, tenor_days, rates):
+        # rates are decimal; one curve per row of a (n_curves, n_tenors) array
+        tenor_days = np.asarray(tenor_days, dtype=np.float64)
+        rates      = np.atleast_2d(np.asarray(rates, dtype=np.float64))
+        if rates.shape[1] != len(tenor_days):
+            raise ValueError(f"Expected {len(tenor_days)} tenor rates per curve, got {rates.shape[1]}.")
+        order = np.argsort(tenor_days)
+        self.tenor_days = tenor_days[order]
+        self.rates      = rates[:, order]
+
+    @classmethod
+    def from_tenor_rates(cls, tenor_rates: TenorRates) -> "YieldCurve":
+        return cls(
+            [TENOR_DAYS["3m"], TENOR_DAYS["6m"], TENOR_DAYS["1y"]],
+            np.array([tenor_rates.rate_3m, tenor_rates.rate_6m, tenor_rates.rate_1y]) / 100,
+        )
+
+    def __len__(self) -> int:
+        return len(self.rates)
+
+    def rate(self, dte, curve_idx=None) -> np.ndarray:
+        # linear between tenors, flat beyond the first and last
+        dte = np.asarray(dte, dtype=np.float64)
+        idx = np.zeros(dte.shape, dtype=np.int64) if curve_idx is None else np.asarray(curve_idx, dtype=np.int64)
+        t   = self.tenor_days
+        if len(t) == 1:
+            return self.rates[idx, 0]
+
+        hi = np.clip(np.searchsorted(t, dte, side="right"), 1, len(t) - 1)
+        lo = hi - 1
+        w  = np.clip((dte - t[lo]) / (t[hi] - t[lo]), 0.0, 1.0)
+        r_lo = self.rates[idx, lo]
+        r_hi = self.rates[idx, hi]
+        return r_lo + w * (r_hi - r_lo)
+
+    def discount_factor(self, dte, curve_idx=None) -> np.ndarray:
+        T = np.asarray(dte, dtype=np.float64) / 365.0
+        return np.exp(-self.rate(dte, curve_idx) * T)
+
+    def shifted(self, bps) -> "YieldCurve":
+        # scalar bps is a parallel shift; one value per tenor is a key-rate shift
+        return YieldCurve(self.tenor_days, self.rates + np.asarray(bps, dtype=np.float64) / 10000.0)
+
+    def twisted(self, short_bps: float, long_bps: float) -> "YieldCurve":
+        t = self.tenor_days
+        span = t[-1] - t[0] if len(t) > 1 else 1.0
+        bps  = short_bps + (t - t[0]) / span * (long_bps - short_bps)
+        return self.shifted(bps)
+
+
+def tenor_weights(dte, tenor_days=None) -> np.ndarray:
+    # (n, n_tenors) linear-interpolation weights; a 1bp bump on tenor j moves
+    # the interpolated rate at dte by weights[:, j] bp
+    t   = np.sort(np.asarray(list(TENOR_DAYS.values()) if tenor_days is None else tenor_days, dtype=np.float64))
+    dte = np.atleast_1d(np.asarray(dte, dtype=np.float64))
+    weights = np.zeros((len(dte), len(t)))
+    if len(t) == 1:
+        weights[:, 0] = 1.0
+        return weights
+
+    hi = np.clip(np.searchsorted(t, dte, side="right"), 1, len(t) - 1)
+    lo = hi - 1
+    w  = np.clip((dte - t[lo]) / (t[hi] - t[lo]), 0.0, 1.0)
+    rows = np.arange(len(dte))
+    weights[rows, lo] += 1.0 - w
+    weights[rows, hi] += w
+    return weights
+
+
+def tenor_shift_bps(tenor_shocks_bps: dict, dte) -> np.ndarray:
+    if not tenor_shocks_bps:
+        return np.zeros(np.shape(dte))
+    bumps = np.array([tenor_shocks_bps.get(t, 0.0) for t in TENOR_DAYS], dtype=np.float64)
+    return YieldCurve(list(TENOR_DAYS.values()), bumps).rate(dte)
+
+
+def twist_shocks(short_bps: float, long_bps: float) -> dict[str, float]:
+    # steepener: short_bps < long_bps; flattener: the reverse
+    days  = np.array(list(TENOR_DAYS.values()), dtype=np.float64)
+    share = (days - days.min()) / (days.max() - days.min())
+    return {t: float(short_bps + s * (long_bps - short_bps)) for t, s in zip(TENOR_DAYS, share)}
+
+
+def key_rate_rho(rho, dte) -> np.ndarray:
+    # bucket per-leg rho (per 1% parallel) onto the tenor grid
+    rho = np.nan_to_num(np.atleast_1d(np.asarray(rho, dtype=np.float64)))
+    return rho[:, None] * tenor_weights(dte)
+
+
+class YieldCurveCache:
+
+    def __init__(self, tenor_days, trade_dates, rates):
+        self.curve  = YieldCurve(tenor_days, rates)
+        self._index = {d: i for i, d in enumerate(trade_dates)}
+
+    @classmethod
+    def from_columns(cls, df: pd.DataFrame, tenor_columns: dict = TENOR_COLUMNS, date_col: str = "trade_date") -> "YieldCurveCache":
+        # one curve per trade_date, taken from per-row tenor yield columns in percent
+        first = df.drop_duplicates(subset=[date_col])
+        cols  = list(tenor_columns)
+        return cls(
+            [TENOR_DAYS[tenor_columns[c]] for c in cols],
+            first[date_col].tolist(),
+            first[cols].to_numpy(dtype=np.float64) / 100,
+        )
+
+    @classmethod
+    def from_gbond(cls, gbond_df: pd.DataFrame) -> "YieldCurveCache":
+        # long format (trade_date, tenor, yield_pct), as in v_processed_gbond
+        wide = gbond_df.pivot_table(index="trade_date", columns="tenor", values="yield_pct", aggfunc="last")
+        tenors = [t for t in wide.columns if t in TENOR_DAYS]
+        wide = wide[tenors].dropna()
+        return cls([TENOR_DAYS[t] for t in tenors], wide.index.tolist(), wide.to_numpy(dtype=np.float64) / 100)
+
+    def __contains__(self, trade_date) -> bool:
+        return trade_date in self._index
+
+    def curve_index(self, trade_dates) -> np.ndarray:
+        return np.array([self._index[d] for d in trade_dates], dtype=np.int64)
+
+    def curve_for(self, trade_date) -> YieldCurve:
+        i = self._index[trade_date]
+        return YieldCurve(self.curve.tenor_days, self.curve.rates[i])
+
+    def rate(self, trade_dates, dte) -> np.ndarray:
+        codes, uniques = pd.factorize(pd.Series(trade_dates))
+        idx = self.curve_index(uniques)[codes]
+        return self.curve.rate(dte, idx)
+
+
 def interpolate_rate(tenor_rates: TenorRates, dte: int) -> float:
     if dte < 0:
         raise ValueError(f"DTE cannot be negative. Got: {dte}")
-
-    d3m = TENOR_DAYS["3m"]
-    d6m = TENOR_DAYS["6m"]
-    d1y = TENOR_DAYS["1y"]
-
-    r3m = tenor_rates.rate_3m / 100
-    r6m = tenor_rates.rate_6m / 100
-    r1y = tenor_rates.rate_1y / 100
-
-    if dte < d3m:
-        return r3m
-    if dte < d6m:
-        return r3m + (dte - d3m) / (d6m - d3m) * (r6m - r3m)
-    if dte < d1y:
-        return r6m + (dte - d6m) / (d1y - d6m) * (r1y - r6m)
-    return r1y
+    return float(YieldCurve.from_tenor_rates(tenor_rates).rate(dte))
@@ -0,0 +1,220 @@
+import logging
+from datetime import date
+from types import SimpleNamespace
+
+import duckdb
+import pyarrow as pa
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.dependencies import get_db
+from app.routers import chain as chain_router
+from app.services import response_cache as rc
+from app.services.chain_service import ARROW_STREAM, CHAIN_FIELDS, ChainFilter, get_option_chain, get_option_chain_arrow
+from app.services.response_cache import ResponseCache
+
+TRADE  = date(2025, 3, 10)
+EXPIRY = date(2025, 3, 27)
+
+
+@pytest.fixture
+def con():
+    # 21900 is listed as PE only and 22100 CE has no open interest, so type / OI
+    # filters and the ATM ladder disagree on which strikes exist. spot 22010 -> ATM 22000
+    con = duckdb.connect()
+    con.execute("""
+        CREATE TABLE v_curated_option_chain AS
+        SELECT
+            DATE '2025-03-10' AS trade_date, 'NIFTY' AS symbol, DATE '2025-03-27' AS expiry_date,
+            s::DOUBLE AS strike, t AS option_type,
+            100.0 AS open, 110.0 AS high, 90.0 AS low, 105.0 AS close, 104.0 AS settle,
+            10 AS contracts,
+            CASE WHEN s = 22100 AND t = 'CE' THEN 0 ELSE 500 END AS open_interest,
+            5 AS chg_in_oi, 17 AS dte, 22010.0 AS spot, 1.23 AS div_yield, 0.065 AS rate,
+            CASE WHEN s = 22200 AND t = 'CE' THEN 'NaN'::DOUBLE ELSE 0.15 END AS iv,
+            0.5 AS delta, 0.001 AS gamma, 10.0 AS vega, -5.0 AS theta, 3.0 AS rho,
+            2025 AS year, 3 AS month
+        FROM (SELECT UNNEST(range(21800, 22300, 100)) AS s),
+             (SELECT UNNEST(['CE', 'PE']) AS t)
+        WHERE NOT (s = 21900 AND t = 'CE')
+    """)
+    yield con
+    con.close()
+
+
+def chain(con, **filters) -> list[tuple[float, str]]:
+    sql, params = ChainFilter(**filters).query("NIFTY", TRADE, EXPIRY)
+    return [(row[0], row[1]) for row in con.execute(f"SELECT strike, option_type FROM ({sql})", params).fetchall()]
+
+
+class TestChainFilter:
+
+    def test_default_selects_full_chain(self, con):
+        rows = chain(con)
+        assert len(rows) == 9
+        assert rows == sorted(rows)
+
+    def test_atm_window(self, con):
+        assert {s for s, _ in chain(con, atm_window=0)} == {22000.0}
+        assert {s for s, _ in chain(con, atm_window=1)} == {21900.0, 22000.0, 22100.0}
+
+    def test_atm_window_counts_listed_strikes_before_type_filter(self, con):
+        # 21900 has no CE but is still one strike below ATM, so 21800 stays out
+        assert chain(con, atm_window=1, option_type="CE") == [(22000.0, "CE"), (22100.0, "CE")]
+
+    def test_atm_window_counts_listed_strikes_before_oi_filter(self, con):
+        assert chain(con, atm_window=1, option_type="CE", min_oi=1) == [(22000.0, "CE")]
+
+    def test_atm_tie_takes_lower_strike(self, con):
+        con.execute("UPDATE v_curated_option_chain SET spot = 22050.0")
+        assert {s for s, _ in chain(con, atm_window=0)} == {22000.0}
+
+    def test_atm_window_without_spot_is_empty(self, con, caplog):
+        con.execute("UPDATE v_curated_option_chain SET spot = NULL")
+        assert chain(con, atm_window=1) == []
+        with caplog.at_level(logging.WARNING):
+            result = get_option_chain("NIFTY", TRADE, EXPIRY, con, chain_filter=ChainFilter(atm_window=1))
+        assert result.row_count == 0
+        assert "has no spot" in caplog.text
+
+    def test_unlisted_expiry_not_warned(self, con, caplog):
+        with caplog.at_level(logging.WARNING):
+            result = get_option_chain("NIFTY", TRADE, date(2025, 4, 24), con, chain_filter=ChainFilter(atm_window=1))
+        assert result.row_count == 0
+        assert caplog.text == ""
+
+    def test_moneyness(self, con):
+        # |strike / 22010 - 1| <= 0.5% keeps 21900..22100
+        assert {s for s, _ in chain(con, moneyness=0.005)} == {21900.0, 22000.0, 22100.0}
+
+    def test_option_type_and_min_oi(self, con):
+        assert {t for _, t in chain(con, option_type="PE")} == {"PE"}
+        assert len(chain(con, option_type="PE")) == 5
+        assert (22100.0, "CE") not in chain(con, min_oi=1)
+        assert len(chain(con, min_oi=0)) == 9
+
+    @pytest.mark.parametrize("kwargs", [
+        {"fields": ("bogus",)},
+        {"fields": ()},
+        {"option_type": "FUT"},
+        {"atm_window": -1},
+        {"moneyness": 0.0},
+        {"min_oi": -1},
+    ])
+    def test_invalid_filters_rejected(self, kwargs):
+        with pytest.raises(ValueError):
+            ChainFilter(**kwargs)
+
+    def test_fields_canonical_order(self):
+        a = ChainFilter(fields=("iv", "strike", "option_type"))
+        b = ChainFilter(fields=("option_type", "iv", "strike"))
+        assert a == b
+        assert a.fields == ("strike", "option_type", "iv")
+
+    def test_columns_always_read_iv(self):
+        assert ChainFilter(fields=("strike",)).columns == ("strike", "iv")
+        assert ChainFilter().columns == CHAIN_FIELDS
+
+
+class TestProjection:
+
+    def test_rows_carry_only_requested_fields(self, con):
+        result = get_option_chain("NIFTY", TRADE, EXPIRY, con, chain_filter=ChainFilter(fields=("strike", "option_type"), atm_window=0))
+        assert result["rows"] == [
+            {"strike": 22000.0, "option_type": "CE"},
+            {"strike": 22000.0, "option_type": "PE"},
+        ]
+        # the summary still comes from iv, which was read but not returned
+        assert (result["row_count"], result["iv_computed_count"], result["iv_avg"]) == (2, 2, 0.15)
+
+    def test_columnar_projection(self, con):
+        result = get_option_chain(
+            "NIFTY", TRADE, EXPIRY, con, layout="columnar",
+            chain_filter=ChainFilter(fields=("iv", "strike"), option_type="CE"),
+        )
+        assert list(result["rows"]) == ["strike", "iv"]
+        assert result["rows"]["strike"] == [21800.0, 22000.0, 22100.0, 22200.0]
+        assert result["rows"]["iv"] == [0.15, 0.15, 0.15, None]
+        assert result["iv_computed_count"] == 3
+
+    def test_full_rows_use_chain_schema(self, con):
+        result = get_option_chain("NIFTY", TRADE, EXPIRY, con, chain_filter=ChainFilter(atm_window=0, option_type="PE"))
+        assert result.row_count == 1
+        assert tuple(result.rows[0].model_dump()) == CHAIN_FIELDS
+
+
+def read_stream(body: bytes) -> pa.Table:
+    with pa.ipc.open_stream(body) as reader:
+        return reader.read_all()
+
+
+class TestChainArrow:
+
+    def test_round_trip(self, con):
+        table = read_stream(get_option_chain_arrow("NIFTY", TRADE, EXPIRY, con))
+        assert tuple(table.column_names) == CHAIN_FIELDS
+        assert table.num_rows == 9
+        meta = {k.decode(): v.decode() for k, v in table.schema.metadata.items()}
+        assert (meta["symbol"], meta["trade_date"], meta["expiry_date"]) == ("NIFTY", "2025-03-10", "2025-03-27")
+        assert (meta["row_count"], meta["iv_computed_count"]) == ("9", "8")
+        assert float(meta["iv_avg"]) == pytest.approx(0.15)
+
+    def test_nan_sent_as_null(self, con):
+        table = read_stream(get_option_chain_arrow("NIFTY", TRADE, EXPIRY, con, ChainFilter(option_type="CE")))
+        assert table.column("iv").to_pylist() == [0.15, 0.15, 0.15, None]
+        assert table.column("iv").null_count == 1
+        # NaN is only replaced in the IV / Greek columns
+        assert table.column("settle").null_count == 0
+
+    def test_projection_and_empty_day(self, con):
+        table = read_stream(get_option_chain_arrow("NIFTY", TRADE, EXPIRY, con, ChainFilter(fields=("strike",), atm_window=0)))
+        assert table.column_names == ["strike"]
+        assert table.column("strike").to_pylist() == [22000.0, 22000.0]
+        empty = read_stream(get_option_chain_arrow("NIFTY", date(2025, 3, 11), EXPIRY, con))
+        assert empty.num_rows == 0
+        assert (empty.schema.metadata[b"row_count"], empty.schema.metadata[b"iv_avg"]) == (b"0", b"0.0")
+
+
+@pytest.fixture
+def client(con, monkeypatch):
+    monkeypatch.setattr(rc, "response_cache", ResponseCache(10**6))
+    monkeypatch.setattr(rc, "request_generation", lambda request: SimpleNamespace(version="v1", updated=0.0, number=1))
+    app = FastAPI()
+    app.include_router(chain_router.router)
+    app.dependency_overrides[get_db] = lambda: con
+    return TestClient(app)
+
+
+URL = "/chain/NIFTY/2025-03-10/2025-03-27"
+
+
+class TestChainFormats:
+
+    def test_rows_columnar_and_arrow_agree(self, client):
+        rows     = client.get(URL).json()
+        columnar = client.get(URL, params={"layout": "columnar"}).json()
+        arrow    = client.get(URL, headers={"Accept": ARROW_STREAM})
+        assert arrow.headers["content-type"] == ARROW_STREAM
+        table = read_stream(arrow.content)
+
+        assert rows["row_count"] == columnar["row_count"] == table.num_rows == 9
+        assert rows["iv_computed_count"] == columnar["iv_computed_count"] == 8
+        for name in CHAIN_FIELDS:
+            assert [row[name] for row in rows["rows"]] == columnar["rows"][name], name
+        for name in ("strike", "option_type", "open_interest", "iv", "delta", "settle"):
+            assert table.column(name).to_pylist() == columnar["rows"][name], name
+        assert [str(d) for d in table.column("trade_date").to_pylist()] == columnar["rows"]["trade_date"]
+
+    def test_arrow_accept_wins_over_layout(self, client):
+        response = client.get(URL, params={"layout": "bogus"}, headers={"Accept": f"application/json, {ARROW_STREAM}"})
+        assert response.headers["content-type"] == ARROW_STREAM
+
+    def test_invalid_layout_rejected(self, client):
+        assert client.get(URL, params={"layout": "bogus"}).status_code == 400
+
+    def test_formats_cached_apart(self, client):
+        client.get(URL, params={"layout": "columnar"})
+        arrow = client.get(URL, headers={"Accept": ARROW_STREAM})
+        assert arrow.headers["content-type"] == ARROW_STREAM
+        assert client.get(URL).json()["rows"][0]["strike"] == 21800.0
@@ -0,0 +1,84 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.db.connection import DuckDBConnection, DuckDBConnectionPool
+
+
+@pytest.fixture
+def db_conn():
+    db_conn = DuckDBConnection(Path(":memory:"))
+    db_conn.get().execute("CREATE VIEW v_one AS SELECT 1 AS x")
+    return db_conn
+
+
+class TestDuckDBConnectionPool:
+
+    def test_size_below_one_rejected(self, db_conn):
+        with pytest.raises(ValueError, match="at least 1"):
+            DuckDBConnectionPool(db_conn, size=0)
+
+    def test_acquire_release_counts(self, db_conn):
+        pool = DuckDBConnectionPool(db_conn, size=3)
+        a, b = pool.acquire(), pool.acquire()
+        assert a is not b
+        assert pool.stats()["in_use"] == 2
+        pool.release(a)
+        pool.release(b)
+        stats = pool.stats()
+        assert (stats["in_use"], stats["peak_in_use"], stats["acquisitions"]) == (0, 2, 2)
+
+    def test_cursors_see_parent_views(self, db_conn):
+        pool = DuckDBConnectionPool(db_conn, size=2)
+        with pool.cursor() as cur:
+            assert cur.execute("SELECT x FROM v_one").fetchone() == (1,)
+        assert pool.stats()["in_use"] == 0
+
+    def test_cursor_returned_on_error(self, db_conn):
+        pool = DuckDBConnectionPool(db_conn, size=1)
+        with pytest.raises(RuntimeError):
+            with pool.cursor():
+                raise RuntimeError
+        with pool.cursor() as cur:
+            assert cur.execute("SELECT 1").fetchone() == (1,)
+
+    def test_timeout_when_exhausted(self, db_conn):
+        pool = DuckDBConnectionPool(db_conn, size=1, timeout_s=0.05)
+        held = pool.acquire()
+        with pytest.raises(TimeoutError, match="pool size 1"):
+            pool.acquire()
+        stats = pool.stats()
+        assert (stats["timeouts"], stats["acquisitions"], stats["in_use"]) == (1, 1, 1)
+        pool.release(held)
+        pool.release(pool.acquire())
+
+    def test_wait_stats(self, db_conn):
+        pool = DuckDBConnectionPool(db_conn, size=1, timeout_s=5)
+        held = pool.acquire()
+        releaser = threading.Timer(0.1, pool.release, args=[held])
+        releaser.start()
+        pool.release(pool.acquire())
+        releaser.join()
+        stats = pool.stats()
+        assert stats["acquisitions"] == 2
+        assert stats["max_wait_ms"] >= 50
+        assert 0 < stats["mean_wait_ms"] <= stats["max_wait_ms"]
+
+    def test_peak_under_concurrency(self, db_conn):
+        pool    = DuckDBConnectionPool(db_conn, size=4, timeout_s=5)
+        barrier = threading.Barrier(4)
+
+        def work():
+            with pool.cursor():
+                barrier.wait(timeout=5)
+                time.sleep(0.01)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = pool.stats()
+        assert (stats["peak_in_use"], stats["in_use"], stats["acquisitions"]) == (4, 0, 4)
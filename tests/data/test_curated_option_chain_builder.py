@@ -3,7 +3,13 @@ import numpy as np
 import pandas as pd
 from pathlib import Path
 from unittest.mock import MagicMock, patch
-from src.data.curated_option_chain_builder import CuratedOptionChainBuilder
+import pyarrow.parquet as pq
+from src.core.fetch_config import FetchConfig
+from src.data.curated_option_chain_builder import (
+    CuratedOptionChainBuilder, partition_path, legacy_files, write_partition,
+)
+from src.db.connection import DuckDBConnection
+from src.db.curated_registry import CuratedRegistry
 
 @pytest.fixture
 def mock_config(tmp_path):
@@ -196,6 +202,21 @@ class TestComputeQuant:
         _ = builder._compute_quant(df)
         assert set(df.columns) == original_cols
 
+    def test_implied_q_source_overwrites_div_yield(self, builder, sample_df):
+        builder.q_source = "implied"
+        df = builder._interpolate_rates(sample_df)
+        df["implied_div_yield"] = 0.9
+        result = builder._compute_quant(df)
+        assert result["div_yield"].iloc[0] == pytest.approx(0.9)
+
+    def test_higher_order_cols_opt_in(self, builder, sample_df):
+        result = self._with_rate(builder, sample_df)
+        assert "vanna" not in result.columns
+        builder.higher_order_greeks = True
+        result = self._with_rate(builder, sample_df)
+        for col in ["vanna", "volga", "charm", "speed"]:
+            assert not np.isnan(result[col].iloc[0])
+
 
 # Drop Rate Tenor Columns
 
@@ -298,13 +319,13 @@ class TestWritePartitioned:
     def test_full_mode_writes_parquet(self, builder, sample_df):
         df = self._full_df(builder, sample_df)
         builder._write_partitioned(df, 2024, "full")
-        out_path = builder.output_root / "2024" / "curated_options_2024.parquet"
+        out_path = partition_path(builder.output_root, "NIFTY", 2024, 10)
         assert out_path.exists()
 
     def test_full_mode_correct_row_count(self, builder, sample_df):
         df = self._full_df(builder, sample_df)
         builder._write_partitioned(df, 2024, "full")
-        out_path = builder.output_root / "2024" / "curated_options_2024.parquet"
+        out_path = partition_path(builder.output_root, "NIFTY", 2024, 10)
         result = pd.read_parquet(out_path)
         assert len(result) == 1
 
@@ -318,7 +339,7 @@ class TestWritePartitioned:
         df2 = self._full_df(builder, df2)
         builder._write_partitioned(df2, 2024, "incremental")
 
-        out_path = builder.output_root / "2024" / "curated_options_2024.parquet"
+        out_path = partition_path(builder.output_root, "NIFTY", 2024, 10)
         result = pd.read_parquet(out_path)
         assert len(result) == 2
 
@@ -327,14 +348,14 @@ class TestWritePartitioned:
         builder._write_partitioned(df, 2024, "full")
         builder._write_partitioned(df, 2024, "incremental")
 
-        out_path = builder.output_root / "2024" / "curated_options_2024.parquet"
+        out_path = partition_path(builder.output_root, "NIFTY", 2024, 10)
         result = pd.read_parquet(out_path)
         assert len(result) == 1
 
     def test_output_sorted_by_trade_date(self, builder, sample_df):
         df = self._full_df(builder, sample_df)
         builder._write_partitioned(df, 2024, "full")
-        out_path = builder.output_root / "2024" / "curated_options_2024.parquet"
+        out_path = partition_path(builder.output_root, "NIFTY", 2024, 10)
         result = pd.read_parquet(out_path)
         dates = pd.to_datetime(result["trade_date"])
         assert dates.is_monotonic_increasing
@@ -348,3 +369,100 @@ class TestWritePartitioned:
         df2 = self._full_df(builder, df2)
         # should not raise TypeError from mixed Timestamp/date types
         builder._write_partitioned(df2, 2024, "incremental")
+
+    def test_partitions_by_symbol_and_month(self, builder, sample_df):
+        df2 = sample_df.copy()
+        df2["trade_date"] = pd.Timestamp("2024-11-04")
+        df2["symbol"]     = "BANKNIFTY"
+        df = self._full_df(builder, pd.concat([sample_df, df2], ignore_index=True))
+        builder._write_partitioned(df, 2024, "full")
+        assert partition_path(builder.output_root, "NIFTY", 2024, 10).exists()
+        assert partition_path(builder.output_root, "BANKNIFTY", 2024, 11).exists()
+        assert len(builder._year_files(2024)) == 2
+
+    def test_full_mode_removes_stale_partitions(self, builder, sample_df):
+        df2 = sample_df.copy()
+        df2["trade_date"] = pd.Timestamp("2024-11-04")
+        df = self._full_df(builder, pd.concat([sample_df, df2], ignore_index=True))
+        builder._write_partitioned(df, 2024, "full")
+        builder._write_partitioned(self._full_df(builder, sample_df), 2024, "full")
+        assert not partition_path(builder.output_root, "NIFTY", 2024, 11).exists()
+
+    def test_incremental_leaves_other_partitions(self, builder, sample_df):
+        builder._write_partitioned(self._full_df(builder, sample_df), 2024, "full")
+        df2 = sample_df.copy()
+        df2["trade_date"] = pd.Timestamp("2024-11-04")
+        builder._write_partitioned(self._full_df(builder, df2), 2024, "incremental")
+        assert partition_path(builder.output_root, "NIFTY", 2024, 10).exists()
+        assert builder._get_latest_trade_date(2024) == pd.Timestamp("2024-11-04").date()
+
+    def test_file_format(self, builder, sample_df):
+        builder._write_partitioned(self._full_df(builder, sample_df), 2024, "full")
+        meta   = pq.ParquetFile(partition_path(builder.output_root, "NIFTY", 2024, 10)).metadata
+        column = meta.row_group(0).column(meta.schema.names.index("trade_date"))
+        assert column.compression == "ZSTD"
+        assert column.statistics.has_min_max
+        assert "year" not in meta.schema.names
+
+    def test_latest_trade_date_none_without_files(self, builder):
+        assert builder._get_latest_trade_date(2024) is None
+
+    def test_legacy_files_detected(self, builder):
+        path = builder.output_root / "2024" / "curated_options_2024.parquet"
+        path.parent.mkdir(parents=True)
+        path.touch()
+        assert legacy_files(builder.output_root) == [path]
+
+    def test_run_refuses_with_legacy_files(self, builder):
+        path = builder.output_root / "2024" / "curated_options_2024.parquet"
+        path.parent.mkdir(parents=True)
+        path.touch()
+        with pytest.raises(RuntimeError, match="migrate_option_chain_layout"):
+            builder.run("incremental")
+        assert not any(builder.output_root.glob("symbol=*"))
+
+
+class TestLegacyLayoutRegistry:
+
+    def _chain(self, trade_date: str) -> pd.DataFrame:
+        return pd.DataFrame({
+            "trade_date":  [pd.Timestamp(trade_date).date()],
+            "symbol":      ["NIFTY"],
+            "expiry_date": [pd.Timestamp("2024-10-31").date()],
+            "strike":      [22000.0],
+            "option_type": ["CE"],
+        })
+
+    def _register(self, tmp_path: Path):
+        config  = FetchConfig(base_dir=tmp_path)
+        db_conn = DuckDBConnection(tmp_path / "test.db")
+        CuratedRegistry(db_conn, config).register_all()
+        return db_conn.get()
+
+    def _write_legacy(self, tmp_path: Path) -> Path:
+        root = FetchConfig(base_dir=tmp_path).curated_dir / "option_chain"
+        legacy = root / "2024" / "curated_options_2024.parquet"
+        legacy.parent.mkdir(parents=True)
+        self._chain("2024-10-15").to_parquet(legacy, index=False)
+        return root
+
+    def test_legacy_only(self, tmp_path):
+        self._write_legacy(tmp_path)
+        con = self._register(tmp_path)
+        assert con.execute("""
+            SELECT COUNT(*) FROM v_curated_option_chain
+            WHERE symbol = 'NIFTY' AND year = 2024 AND month = 10 AND trade_date = DATE '2024-10-15'
+        """).fetchone()[0] == 1
+
+    def test_mixed_layout_serves_year_files(self, tmp_path):
+        root = self._write_legacy(tmp_path)
+        write_partition(self._chain("2024-11-04"), partition_path(root, "NIFTY", 2024, 11))
+        con  = self._register(tmp_path)
+        rows = con.execute("SELECT trade_date, year, month FROM v_curated_option_chain").fetchall()
+        assert [(str(d), y, m) for d, y, m in rows] == [("2024-10-15", 2024, 10)]
+
+    def test_hive_layout(self, tmp_path):
+        root = FetchConfig(base_dir=tmp_path).curated_dir / "option_chain"
+        write_partition(self._chain("2024-11-04"), partition_path(root, "NIFTY", 2024, 11))
+        con = self._register(tmp_path)
+        assert con.execute("SELECT year, month FROM v_curated_option_chain").fetchall() == [(2024, 11)]
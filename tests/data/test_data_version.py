@@ -0,0 +1,59 @@
+import os
+import pandas as pd
+from pathlib import Path
+from src.db.data_version import DataVersion
+
+
+def write_parquet(path: Path, n: int = 3):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame({"x": range(n)}).to_parquet(path, index=False)
+
+
+class TestDataVersion:
+
+    def test_stable_without_writes(self, tmp_path):
+        write_parquet(tmp_path / "curated" / "option_chain" / "2024" / "a.parquet")
+        dv = DataVersion([tmp_path / "curated"], ttl_s=0)
+        assert dv.current() == dv.current()
+
+    def test_new_file_changes_version(self, tmp_path):
+        write_parquet(tmp_path / "curated" / "option_chain" / "2024" / "a.parquet")
+        dv = DataVersion([tmp_path / "curated"], ttl_s=0)
+        before = dv.current()
+        write_parquet(tmp_path / "curated" / "option_chain" / "2025" / "b.parquet")
+        assert dv.current() != before
+
+    def test_rewrite_changes_version(self, tmp_path):
+        path = tmp_path / "processed" / "vix" / "vix.parquet"
+        write_parquet(path)
+        dv = DataVersion([tmp_path / "processed"], ttl_s=0)
+        before = dv.current()
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert dv.current() != before
+
+    def test_non_parquet_files_ignored(self, tmp_path):
+        write_parquet(tmp_path / "curated" / "futures" / "a.parquet")
+        dv = DataVersion([tmp_path / "curated"], ttl_s=0)
+        before = dv.current()
+        (tmp_path / "curated" / "futures" / "notes.txt").write_text("x")
+        assert dv.current() == before
+
+    def test_ttl_throttles_rescan(self, tmp_path):
+        write_parquet(tmp_path / "curated" / "futures" / "a.parquet")
+        dv = DataVersion([tmp_path / "curated"], ttl_s=3600)
+        before = dv.current()
+        write_parquet(tmp_path / "curated" / "futures" / "b.parquet")
+        assert dv.current() == before
+        assert dv.refresh() != before
+
+    def test_missing_root_is_empty(self, tmp_path):
+        dv = DataVersion([tmp_path / "does_not_exist"], ttl_s=0)
+        assert dv.current().startswith("0-")
+
+    def test_last_modified_tracks_newest_file(self, tmp_path):
+        path = tmp_path / "curated" / "futures" / "a.parquet"
+        write_parquet(path)
+        os.utime(path, (1_700_000_000, 1_700_000_000))
+        dv = DataVersion([tmp_path / "curated"], ttl_s=0)
+        assert dv.last_modified() == 1_700_000_000
@@ -0,0 +1,99 @@
+import threading
+from pathlib import Path
+
+from src.db.connection import DuckDBConnection, DuckDBConnectionPool
+from src.db.generation import Generation, GenerationCursor, GenerationHolder, data_version_of
+
+
+def open_generation(version: str) -> Generation:
+    db_conn = DuckDBConnection(Path(":memory:"))
+    db_conn.get().execute(f"CREATE VIEW v_version AS SELECT '{version}' AS version")
+    pool = DuckDBConnectionPool(db_conn, size=2, timeout_s=1)
+    return Generation(pool, version=version, updated=0.0, source="test")
+
+
+def read_version(generation: Generation) -> str:
+    with generation.pool.cursor() as cur:
+        return cur.execute("SELECT version FROM v_version").fetchone()[0]
+
+
+class TestGenerationHolder:
+
+    def _holder(self, drain_timeout_s: float = 5.0) -> GenerationHolder:
+        versions = iter(["v1", "v2", "v3"])
+        return GenerationHolder(lambda: open_generation(next(versions)), drain_timeout_s=drain_timeout_s)
+
+    def test_opens_once_lazily(self):
+        holder = self._holder()
+        assert holder.current() is holder.current()
+        assert holder.current().number == 1
+        assert read_version(holder.current()) == "v1"
+
+    def test_reload_swaps_and_closes_idle_generation(self):
+        holder = self._holder()
+        old = holder.current()
+        new = holder.reload()
+        assert holder.current() is new
+        assert (new.number, new.version) == (2, "v2")
+        assert old.retired and old.closed
+        assert read_version(new) == "v2"
+
+    def test_in_flight_request_keeps_old_generation_open(self):
+        holder = self._holder(drain_timeout_s=0.05)
+        held = holder.checkout()
+        holder.reload()
+        # drain timed out: the old database stays open for the request holding it
+        assert held.retired and not held.closed
+        assert read_version(held) == "v1"
+        assert holder.checkout().version == "v2"
+        holder.checkin(held)
+        assert held.closed
+
+    def test_swap_waits_for_drain(self):
+        holder = self._holder()
+        held = holder.checkout()
+        swapped = threading.Event()
+
+        def reload():
+            holder.reload()
+            swapped.set()
+
+        thread = threading.Thread(target=reload)
+        thread.start()
+        assert not swapped.wait(0.1)
+        # new requests already land on the new generation while the old one drains
+        while holder.current() is held:
+            pass
+        assert holder.current().version == "v2"
+        holder.checkin(held)
+        thread.join(timeout=5)
+        assert swapped.is_set() and held.closed
+
+    def test_close(self):
+        holder = self._holder()
+        generation = holder.current()
+        holder.close()
+        assert generation.closed
+
+
+class TestGenerationCursor:
+
+    def test_forwards_to_cursor_and_carries_version(self):
+        generation = open_generation("v1")
+        db = GenerationCursor(generation)
+        assert db.execute("SELECT version FROM v_version").fetchone()[0] == "v1"
+        assert data_version_of(db) == "v1"
+        assert data_version_of(db.cursor()) is None
+        db.release()
+        assert generation.pool.in_use == 0
+
+    def test_cursor_taken_on_first_use(self):
+        generation = open_generation("v1")
+        db = GenerationCursor(generation)
+        assert generation.pool.in_use == 0
+        db.execute("SELECT 1")
+        db.execute("SELECT 2")
+        assert (generation.pool.in_use, generation.pool.acquisitions) == (1, 1)
+        db.release()
+        db.release()
+        assert generation.pool.in_use == 0
@@ -0,0 +1,110 @@
+import json
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from datetime import date
+from pathlib import Path
+from src.core.fetch_config import FetchConfig
+from src.db.connection import DuckDBConnection
+from src.db.manifest import MANIFEST, column_types, load_manifest, write_manifest
+from src.db.processed_registry import ProcessedRegistry
+
+
+def write_vix(path: Path, days: list[date]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame({"trade_date": days, "close": [14.0] * len(days)}).to_parquet(path, index=False)
+
+
+def touch_after_manifest(layer_root: Path, folder: Path):
+    # coarse filesystem clocks can stamp a write in the same tick as the manifest
+    written = (layer_root / MANIFEST).stat().st_mtime_ns
+    os.utime(folder, ns=(written + 10**9, written + 10**9))
+
+
+class TestManifest:
+
+    def test_records_files_rows_and_dates(self, tmp_path):
+        write_vix(tmp_path / "vix" / "2024" / "a.parquet", [date(2024, 12, 30), date(2024, 12, 31)])
+        write_vix(tmp_path / "vix" / "2025" / "b.parquet", [date(2025, 1, 1)])
+        dataset = write_manifest(tmp_path)["datasets"]["vix"]
+        assert [f["path"] for f in dataset["files"]] == ["2024/a.parquet", "2025/b.parquet"]
+        assert dataset["rows"] == 3
+        assert (dataset["min_trade_date"], dataset["max_trade_date"]) == ("2024-12-30", "2025-01-01")
+        assert column_types(dataset) == {"trade_date": "DATE", "close": "DOUBLE"}
+
+    def test_mixed_schemas_have_no_column_types(self, tmp_path):
+        write_vix(tmp_path / "vix" / "a.parquet", [date(2025, 1, 1)])
+        pd.DataFrame({"trade_date": [date(2025, 1, 2)], "close": [1], "open": [2]}).to_parquet(
+            tmp_path / "vix" / "b.parquet", index=False
+        )
+        dataset = write_manifest(tmp_path)["datasets"]["vix"]
+        assert len(dataset["schemas"]) == 2
+        assert column_types(dataset) is None
+
+    def test_null_column_type(self, tmp_path):
+        (tmp_path / "lot_size").mkdir()
+        pq.write_table(pa.table({"end_date": pa.nulls(1)}), tmp_path / "lot_size" / "x.parquet")
+        assert write_manifest(tmp_path)["datasets"]["lot_size"]["columns"]["end_date"] == "NULL"
+
+    def test_folders_without_parquet_skipped(self, tmp_path):
+        (tmp_path / "empty").mkdir()
+        assert write_manifest(tmp_path)["datasets"] == {}
+
+    def test_load_missing_and_wrong_version(self, tmp_path):
+        assert load_manifest(tmp_path) is None
+        (tmp_path / MANIFEST).write_text(json.dumps({"version": 0, "datasets": {}}))
+        assert load_manifest(tmp_path) is None
+
+
+class TestManifestRegistration:
+
+    def _count(self, config: FetchConfig, use_manifest: bool) -> int:
+        db_conn = DuckDBConnection(config.data_dir / f"test_{use_manifest}.db")
+        ProcessedRegistry(db_conn, config, use_manifest=use_manifest).register_all()
+        return db_conn.get().execute("SELECT COUNT(*) FROM v_processed_vix").fetchone()[0]
+
+    def test_registers_manifest_files_only(self, tmp_path):
+        config = FetchConfig(base_dir=tmp_path)
+        write_vix(config.processed_dir / "vix" / "a.parquet", [date(2025, 1, 1)])
+        write_vix(config.processed_dir / "vix" / "b.parquet", [date(2025, 1, 2)])
+        manifest = write_manifest(config.processed_dir)
+        manifest["datasets"]["vix"]["files"].pop()
+        (config.processed_dir / MANIFEST).write_text(json.dumps(manifest))
+        assert self._count(config, use_manifest=True) == 1
+        assert self._count(config, use_manifest=False) == 2
+
+    def test_new_file_after_manifest_discovered(self, tmp_path):
+        config = FetchConfig(base_dir=tmp_path)
+        write_vix(config.processed_dir / "vix" / "a.parquet", [date(2025, 1, 1)])
+        write_manifest(config.processed_dir)
+        write_vix(config.processed_dir / "vix" / "2025" / "b.parquet", [date(2025, 1, 2)])
+        touch_after_manifest(config.processed_dir, config.processed_dir / "vix")
+        assert self._count(config, use_manifest=True) == 2
+
+    def test_missing_file_discovered(self, tmp_path):
+        config = FetchConfig(base_dir=tmp_path)
+        write_vix(config.processed_dir / "vix" / "a.parquet", [date(2025, 1, 1)])
+        write_vix(config.processed_dir / "vix" / "b.parquet", [date(2025, 1, 2)])
+        write_manifest(config.processed_dir)
+        # e.g. a full build dropped a stale partition and crashed before the rewrite
+        (config.processed_dir / "vix" / "b.parquet").unlink()
+        assert self._count(config, use_manifest=True) == 1
+
+    def test_unlisted_and_vanished_datasets(self, tmp_path):
+        config = FetchConfig(base_dir=tmp_path)
+        write_vix(config.processed_dir / "vix" / "a.parquet", [date(2025, 1, 1)])
+        write_vix(config.processed_dir / "old" / "a.parquet", [date(2025, 1, 1)])
+        write_manifest(config.processed_dir)
+        (config.processed_dir / "old" / "a.parquet").unlink()
+        (config.processed_dir / "old").rmdir()
+        write_vix(config.processed_dir / "new" / "a.parquet", [date(2025, 1, 1)])
+        db_conn = DuckDBConnection(config.data_dir / "test.db")
+        registry = ProcessedRegistry(db_conn, config, use_manifest=True)
+        registry.register_all()
+        assert sorted(registry.list_registered()) == ["v_processed_new", "v_processed_vix"]
+
+    def test_falls_back_to_discovery_without_manifest(self, tmp_path):
+        config = FetchConfig(base_dir=tmp_path)
+        write_vix(config.processed_dir / "vix" / "a.parquet", [date(2025, 1, 1)])
+        assert self._count(config, use_manifest=True) == 1
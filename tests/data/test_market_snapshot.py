@@ -0,0 +1,145 @@
+from datetime import date
+from types import SimpleNamespace
+
+import duckdb
+import pytest
+
+from app.services.market_snapshot import MarketSnapshotCache, _load_day
+from src.db.generation import GenerationCursor
+
+DAYS = [date(2025, 3, 3), date(2025, 3, 4), date(2025, 3, 5)]
+
+
+@pytest.fixture
+def con():
+    con = duckdb.connect()
+    con.execute("""
+        CREATE TABLE v_curated_option_chain AS
+        SELECT
+            d AS trade_date, 'NIFTY' AS symbol, DATE '2025-03-27' AS expiry_date,
+            s::DOUBLE AS strike, t AS option_type, 20 AS dte, 22000.0 AS spot,
+            0.012 AS div_yield, 0.065 AS rate, 0.15 AS iv,
+            0.5 AS delta, 0.001 AS gamma, 10.0 AS vega, -5.0 AS theta, 3.0 AS rho,
+            YEAR(d) AS year, MONTH(d) AS month
+        FROM (SELECT UNNEST([DATE '2025-03-03', DATE '2025-03-04', DATE '2025-03-05']) AS d),
+             (SELECT UNNEST(range(21000, 23000, 100)) AS s),
+             (SELECT UNNEST(['CE', 'PE']) AS t)
+    """)
+    con.execute("""
+        CREATE TABLE v_curated_futures AS
+        SELECT d AS trade_date, 'NIFTY' AS symbol, DATE '2025-03-27' AS expiry_date, 20 AS dte,
+               22000.0 AS spot, 0.012 AS div_yield, 0.065 AS rate, 22050.0 AS settle
+        FROM (SELECT UNNEST([DATE '2025-03-03', DATE '2025-03-04', DATE '2025-03-05']) AS d)
+    """)
+    con.execute("""
+        CREATE TABLE v_processed_lot_size AS
+        SELECT 'NIFTY' AS symbol, DATE '2024-01-01' AS start_date, NULL::DATE AS end_date, 75 AS lot_size
+    """)
+    yield con
+    con.close()
+
+
+def tagged(con, version: str) -> GenerationCursor:
+    pool = SimpleNamespace(acquire=lambda: con, release=lambda cur: None)
+    return GenerationCursor(SimpleNamespace(version=version, pool=pool))
+
+
+class TestMarketSnapshotCache:
+
+    def _budget(self, con, days: float) -> int:
+        return int(_load_day(con, DAYS[0]).nbytes * days)
+
+    def test_hit_and_miss(self, con):
+        cache = MarketSnapshotCache(10**9)
+        day = cache.get(con, DAYS[0])
+        assert len(day.options) == 40 and len(day.futures) == 1
+        assert cache.get(con, DAYS[0]) is day
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["days"]) == (1, 1, 1)
+        assert stats["mb"] == round(day.nbytes / 1e6, 2)
+
+    def test_lru_eviction_order(self, con):
+        cache = MarketSnapshotCache(self._budget(con, 2.5))
+        first  = cache.get(con, DAYS[0])
+        cache.get(con, DAYS[1])
+        # touching the first day makes the second the least recently used
+        assert cache.get(con, DAYS[0]) is first
+        cache.get(con, DAYS[2])
+        assert cache.stats()["evictions"] == 1
+        assert cache.get(con, DAYS[0]) is first
+        misses = cache.stats()["misses"]
+        cache.get(con, DAYS[1])
+        assert cache.stats()["misses"] == misses + 1
+
+    def test_stays_within_budget(self, con):
+        budget = self._budget(con, 1.5)
+        cache  = MarketSnapshotCache(budget)
+        for day in DAYS:
+            cache.get(con, day)
+        assert cache.nbytes <= budget
+        assert (cache.stats()["days"], cache.stats()["evictions"]) == (1, 2)
+
+    def test_day_over_budget_served_uncached(self, con):
+        cache = MarketSnapshotCache(self._budget(con, 0.5))
+        day = cache.get(con, DAYS[0])
+        assert not day.empty
+        assert (cache.stats()["days"], cache.nbytes) == (0, 0)
+
+    def test_empty_day_not_pinned(self, con):
+        cache = MarketSnapshotCache(10**9)
+        assert cache.get(con, date(2025, 3, 8)).empty
+        assert cache.stats()["days"] == 0
+
+    def test_lot_sizes_loaded_once(self, con):
+        cache = MarketSnapshotCache(10**9)
+        df = cache.lot_sizes(con)
+        assert cache.lot_sizes(con) is df
+        assert cache.lot_size_index(con).get("NIFTY", DAYS[0]) == 75
+
+    def test_clear(self, con):
+        cache = MarketSnapshotCache(10**9)
+        day = cache.get(con, DAYS[0])
+        df  = cache.lot_sizes(con)
+        cache.clear()
+        assert (cache.stats()["days"], cache.nbytes) == (0, 0)
+        assert cache.get(con, DAYS[0]) is not day
+        assert cache.lot_sizes(con) is not df
+
+
+class TestMarketSnapshotVersions:
+
+    def test_versions_cached_apart(self, con):
+        cache = MarketSnapshotCache(10**9)
+        old = cache.get(tagged(con, "v1"), DAYS[0])
+        new = cache.get(tagged(con, "v2"), DAYS[0])
+        assert old is not new
+        assert cache.get(tagged(con, "v1"), DAYS[0]) is old
+        assert cache.stats()["versions"] == 2
+
+    def test_retain_drops_other_versions(self, con):
+        cache = MarketSnapshotCache(10**9)
+        cache.get(tagged(con, "v1"), DAYS[0])
+        cache.lot_sizes(tagged(con, "v1"))
+        new = cache.get(tagged(con, "v2"), DAYS[0])
+        cache.retain("v2")
+        assert cache.stats()["days"] == 1
+        assert cache.get(tagged(con, "v2"), DAYS[0]) is new
+
+    def test_retired_version_served_not_stored(self, con):
+        cache = MarketSnapshotCache(10**9)
+        cache.get(tagged(con, "v1"), DAYS[0])
+        cache.retain("v2")
+        # a request still draining on the old generation
+        first = cache.get(tagged(con, "v1"), DAYS[1])
+        assert not first.empty
+        assert cache.get(tagged(con, "v1"), DAYS[1]) is not first
+        assert cache.lot_sizes(tagged(con, "v1")) is not cache.lot_sizes(tagged(con, "v1"))
+        assert cache.stats()["days"] == 0
+
+    def test_retain_reactivates_version(self, con):
+        cache = MarketSnapshotCache(10**9)
+        cache.get(tagged(con, "v1"), DAYS[0])
+        cache.retain("v2")
+        cache.retain("v1")
+        day = cache.get(tagged(con, "v1"), DAYS[0])
+        assert cache.get(tagged(con, "v1"), DAYS[0]) is day
@@ -0,0 +1,234 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.services import response_cache as rc
+from app.services.response_cache import ResponseCache, _not_modified, cached_response
+
+JSON = "application/json"
+
+
+def key(name: str, version: str = "v1") -> tuple:
+    return ("vix", (("trade_date", name),), version)
+
+
+def entry(nbytes: int) -> tuple[str, bytes]:
+    return JSON, b"x" * nbytes
+
+
+class TestResponseCacheMemory:
+
+    def test_hit_and_miss(self):
+        cache = ResponseCache(1000)
+        assert cache.get(key("a")) is None
+        cache.put(key("a"), entry(10))
+        assert cache.get(key("a")) == entry(10)
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    def test_byte_budget_evicts_least_recent(self):
+        cache = ResponseCache(250)
+        for name in "abc":
+            cache.get(key(name))
+            cache.put(key(name), entry(100))
+        # a and b fit at first; c pushes out a, the least recently used
+        assert cache.get(key("a")) is None
+        cache.get(key("b"))
+        cache.put(key("d"), entry(100))
+        assert cache.get(key("c")) is None
+        assert cache.get(key("b")) is not None
+        stats = cache.stats()
+        assert stats["evictions"] == 2
+        assert stats["mb"] <= 250 / 1e6
+
+    def test_oversized_entry_not_stored(self):
+        cache = ResponseCache(50)
+        cache.get(key("a"))
+        cache.put(key("a"), entry(100))
+        assert cache.stats()["entries"] == 0
+
+    def test_version_change_clears(self):
+        cache = ResponseCache(1000)
+        cache.get(key("a"))
+        cache.put(key("a"), entry(10))
+        assert cache.get(key("a", "v2")) is None
+        stats = cache.stats()
+        assert (stats["entries"], stats["invalidations"], stats["data_version"]) == (0, 1, "v2")
+
+    def test_put_for_old_version_skipped(self):
+        cache = ResponseCache(1000)
+        cache.get(key("a", "v1"))
+        cache.get(key("a", "v2"))
+        cache.put(key("a", "v1"), entry(10))
+        assert cache.stats()["entries"] == 0
+
+    def test_old_generation_does_not_step_back(self):
+        cache = ResponseCache(1000)
+        cache.get(key("a", "v1"), 1)
+        cache.put(key("a", "v1"), entry(10))
+        cache.get(key("a", "v2"), 2)
+        cache.put(key("a", "v2"), entry(20))
+        # a request still draining on generation 1 interleaves with generation 2
+        assert cache.get(key("a", "v1"), 1) is None
+        cache.put(key("a", "v1"), entry(10))
+        assert cache.get(key("b", "v2"), 2) is None
+        cache.put(key("b", "v2"), entry(30))
+        assert cache.get(key("a", "v1"), 1) is None
+        assert cache.get(key("a", "v2"), 2) == entry(20)
+        assert cache.get(key("b", "v2"), 2) == entry(30)
+        stats = cache.stats()
+        assert (stats["entries"], stats["invalidations"], stats["data_version"], stats["generation"]) == (2, 1, "v2", 2)
+
+    def test_same_version_on_newer_generation_keeps_entries(self):
+        cache = ResponseCache(1000)
+        cache.get(key("a"), 1)
+        cache.put(key("a"), entry(10))
+        # a reload that found nothing new
+        assert cache.get(key("a"), 2) == entry(10)
+        assert cache.get(key("a"), 1) == entry(10)
+
+    def test_clear(self):
+        cache = ResponseCache(1000)
+        cache.get(key("a"))
+        cache.put(key("a"), entry(10))
+        cache.clear()
+        assert (cache.stats()["entries"], cache.stats()["mb"]) == (0, 0.0)
+
+
+class TestResponseCacheDisk:
+
+    def test_round_trip(self, tmp_path):
+        first = ResponseCache(1000, tmp_path)
+        first.get(key("a"))
+        first.put(key("a"), (JSON, b'{"close": 14.2}\n'))
+        # a fresh process finds the body on disk and promotes it to memory
+        second = ResponseCache(1000, tmp_path)
+        assert second.get(key("a")) == (JSON, b'{"close": 14.2}\n')
+        assert second.get(key("a")) == (JSON, b'{"close": 14.2}\n')
+        stats = second.stats()
+        assert (stats["disk_hits"], stats["hits"]) == (1, 1)
+
+    def test_stale_version_directories_pruned(self, tmp_path):
+        cache = ResponseCache(1000, tmp_path)
+        cache.get(key("a", "v1"))
+        cache.put(key("a", "v1"), entry(10))
+        assert (tmp_path / "v1").is_dir()
+        cache.get(key("a", "v2"))
+        assert not (tmp_path / "v1").exists()
+
+    def test_old_version_put_does_not_recreate_directory(self, tmp_path):
+        cache = ResponseCache(1000, tmp_path)
+        cache.get(key("a", "v1"))
+        cache.get(key("a", "v2"))
+        # a request that started on v1 finishes after the cache moved to v2
+        cache.put(key("a", "v1"), entry(10))
+        assert not (tmp_path / "v1").exists()
+
+    def test_old_generation_leaves_new_directory(self, tmp_path):
+        cache = ResponseCache(1000, tmp_path)
+        cache.get(key("a", "v1"), 1)
+        cache.get(key("a", "v2"), 2)
+        cache.put(key("a", "v2"), entry(10))
+        assert cache.get(key("a", "v1"), 1) is None
+        cache.put(key("a", "v1"), entry(10))
+        assert (tmp_path / "v2").is_dir()
+        assert not (tmp_path / "v1").exists()
+        # a fresh process on v2 still finds the body on disk
+        assert ResponseCache(1000, tmp_path).get(key("a", "v2"), 1) == entry(10)
+
+
+def conditional(**headers) -> SimpleNamespace:
+    return SimpleNamespace(headers={k.replace("_", "-"): v for k, v in headers.items()})
+
+
+ETAG    = '"0123456789abcdef0123"'
+UPDATED = 1_741_600_000.0   # Mon, 10 Mar 2025 09:46:40 GMT
+
+
+class TestNotModified:
+
+    def test_no_conditional_headers(self):
+        assert not _not_modified(conditional(), ETAG, UPDATED)
+
+    def test_if_none_match(self):
+        assert _not_modified(conditional(if_none_match=ETAG), ETAG, UPDATED)
+        assert _not_modified(conditional(if_none_match=f'"other", {ETAG}'), ETAG, UPDATED)
+        assert not _not_modified(conditional(if_none_match='"other"'), ETAG, UPDATED)
+        assert _not_modified(conditional(if_none_match="*"), ETAG, UPDATED)
+
+    def test_if_none_match_uses_weak_comparison(self):
+        # RFC 9110 13.1.2: W/"x" matches "x" for If-None-Match
+        assert _not_modified(conditional(if_none_match=f"W/{ETAG}"), ETAG, UPDATED)
+        assert not _not_modified(conditional(if_none_match=ETAG.strip('"')), ETAG, UPDATED)
+
+    def test_if_modified_since(self):
+        assert _not_modified(conditional(if_modified_since="Mon, 10 Mar 2025 09:46:40 GMT"), ETAG, UPDATED)
+        assert _not_modified(conditional(if_modified_since="Tue, 11 Mar 2025 00:00:00 GMT"), ETAG, UPDATED)
+        assert not _not_modified(conditional(if_modified_since="Mon, 10 Mar 2025 09:46:39 GMT"), ETAG, UPDATED)
+        assert not _not_modified(conditional(if_modified_since="yesterday"), ETAG, UPDATED)
+
+    def test_if_none_match_wins(self):
+        request = conditional(if_none_match='"other"', if_modified_since="Tue, 11 Mar 2025 00:00:00 GMT")
+        assert not _not_modified(request, ETAG, UPDATED)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(rc, "response_cache", ResponseCache(10**6))
+    monkeypatch.setattr(rc, "request_generation", lambda request: SimpleNamespace(version="v1", updated=0.0, number=1))
+    calls = []
+    app   = FastAPI()
+
+    @app.get("/vix/{trade_date}")
+    @cached_response("vix")
+    def vix(trade_date: str):
+        calls.append(trade_date)
+        if trade_date == "bad":
+            raise HTTPException(status_code=400, detail="bad date")
+        return {"trade_date": trade_date, "close": 14.2}
+
+    client = TestClient(app)
+    client.calls = calls
+    return client
+
+
+class TestCachedResponse:
+
+    def test_second_request_served_from_cache(self, client):
+        first  = client.get("/vix/2025-03-10")
+        second = client.get("/vix/2025-03-10")
+        assert first.json() == second.json() == {"trade_date": "2025-03-10", "close": 14.2}
+        assert first.headers["etag"] == second.headers["etag"]
+        assert client.calls == ["2025-03-10"]
+
+    def test_http_exception_not_cached(self, client):
+        assert client.get("/vix/bad").status_code == 400
+        assert client.get("/vix/bad").status_code == 400
+        assert client.calls == ["bad", "bad"]
+
+    def test_request_parameter_reserved(self):
+        with pytest.raises(TypeError, match="reserves"):
+            @cached_response("x")
+            def route(request: str):
+                return {}
+
+    def test_matching_etag_gets_304(self, client):
+        etag = client.get("/vix/2025-03-10").headers["etag"]
+        response = client.get("/vix/2025-03-10", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert client.calls == ["2025-03-10"]
+
+    def test_wildcard_on_rejected_request(self, client):
+        assert client.get("/vix/bad", headers={"If-None-Match": "*"}).status_code == 400
+        assert client.get("/vix/bad", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}).status_code == 400
+
+    def test_wildcard_after_render(self, client):
+        assert client.get("/vix/2025-03-10", headers={"If-None-Match": "*"}).status_code == 304
+        assert client.calls == ["2025-03-10"]
+
+    def test_replayed_etag_on_rejected_request(self, client):
+        etag = rc._etag(("vix", (("trade_date", "bad"),), "v1"))
+        assert client.get("/vix/bad", headers={"If-None-Match": etag}).status_code == 400
@@ -0,0 +1,122 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.single_flight import SingleFlight, request_key
+
+KEY = ("chain.chain", (("symbol", "NIFTY"),), "v1")
+
+
+def wait_for(condition, timeout_s: float = 5.0):
+    deadline = time.monotonic() + timeout_s
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def release_when_waiting(flight: SingleFlight, followers: int, release: threading.Event):
+    def watch():
+        wait_for(lambda: flight.coalesced[KEY[0]] == followers)
+        release.set()
+    threading.Thread(target=watch).start()
+
+
+def run_burst(flight: SingleFlight, fn, n: int) -> tuple[list, list]:
+    # n concurrent callers on KEY
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(flight.do(KEY, fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results, errors
+
+
+class TestSingleFlight:
+
+    def test_followers_share_leader_result(self):
+        flight  = SingleFlight()
+        release = threading.Event()
+        calls   = []
+
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            return object()
+
+        release_when_waiting(flight, 3, release)
+        results, errors = run_burst(flight, compute, 4)
+        assert not errors
+        assert len(calls) == 1
+        assert len({id(r) for r in results}) == 1
+        stats = flight.stats()
+        assert (stats["executed"], stats["coalesced"], stats["coalescing_rate"]) == (1, 3, 0.75)
+        assert stats["endpoints"]["chain.chain"]["coalescing_rate"] == 0.75
+        assert stats["in_flight"] == 0
+
+    def test_followers_share_exception(self):
+        flight  = SingleFlight()
+        release = threading.Event()
+
+        def compute():
+            release.wait(5)
+            raise ValueError("bad book")
+
+        release_when_waiting(flight, 2, release)
+        results, errors = run_burst(flight, compute, 3)
+        assert not results
+        assert len(errors) == 3 and all(str(e) == "bad book" for e in errors)
+        assert flight.stats()["errors"] == 1
+
+    def test_key_released_after_error(self):
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            flight.do(KEY, fail)
+        assert flight.stats()["in_flight"] == 0
+        # the next call runs again rather than replaying the failure
+        assert flight.do(KEY, lambda: 42) == 42
+        assert flight.stats()["executed"] == 2
+
+    def test_sequential_calls_not_coalesced(self):
+        flight = SingleFlight()
+        assert [flight.do(KEY, lambda: i) for i in range(3)] == [0, 1, 2]
+        assert flight.stats()["coalesced"] == 0
+
+    def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+        other  = ("chain.chain", (("symbol", "BANKNIFTY"),), "v1")
+        assert (flight.do(KEY, lambda: 1), flight.do(other, lambda: 2)) == (1, 2)
+        assert flight.stats()["executed"] == 2
+
+    def test_empty_stats(self):
+        stats = SingleFlight().stats()
+        assert (stats["executed"], stats["coalescing_rate"], stats["endpoints"]) == (0, 0.0, {})
+
+
+class TestRequestKey:
+
+    def _db(self, version: str):
+        return SimpleNamespace(generation=SimpleNamespace(version=version))
+
+    def test_csv_by_content_not_name(self):
+        a = request_key("var.analyze", self._db("v1"), b"symbol\nNIFTY\n", symbol="NIFTY", lookback_days=252)
+        b = request_key("var.analyze", self._db("v1"), b"symbol\nNIFTY\n", lookback_days=252, symbol="NIFTY")
+        c = request_key("var.analyze", self._db("v1"), b"symbol\nBANKNIFTY\n", symbol="NIFTY", lookback_days=252)
+        assert a == b
+        assert a != c
+
+    def test_data_version_in_key(self):
+        assert request_key("var.analyze", self._db("v1"), b"x") != request_key("var.analyze", self._db("v2"), b"x")
@@ -0,0 +1,137 @@
+import os
+import duckdb
+import pandas as pd
+import pytest
+from datetime import date
+from pathlib import Path
+from app import dependencies
+from src.core.fetch_config import FetchConfig
+from src.db.data_version import DataVersion
+from src.db.manifest import MANIFEST, write_manifest
+from src.db.snapshot import CURRENT, build_snapshot, current_snapshot, snapshot_meta
+
+
+def write_parquet(path: Path, df: pd.DataFrame):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(path, index=False)
+
+
+def make_config(tmp_path) -> FetchConfig:
+    config = FetchConfig(base_dir=tmp_path)
+    write_parquet(config.processed_dir / "vix" / "vix.parquet", pd.DataFrame({
+        "trade_date": [date(2025, 3, 11), date(2025, 3, 10)],
+        "close":      [14.2, 13.9],
+    }))
+    write_parquet(config.curated_dir / "futures" / "2025" / "futures.parquet", pd.DataFrame({
+        "trade_date":  [date(2025, 3, 10)],
+        "symbol":      ["NIFTY"],
+        "expiry_date": [date(2025, 3, 27)],
+        "settle":      [22450.0],
+    }))
+    return config
+
+
+class TestSnapshot:
+
+    def test_build_writes_current(self, tmp_path):
+        config = make_config(tmp_path)
+        path   = build_snapshot(config)
+        assert path.exists()
+        assert current_snapshot(config.snapshot_dir) == path
+
+    def test_views_keep_names_and_rows(self, tmp_path):
+        config = make_config(tmp_path)
+        con    = duckdb.connect(str(build_snapshot(config)), read_only=True)
+        assert con.execute("SELECT close FROM v_processed_vix WHERE trade_date = ?", [date(2025, 3, 10)]).fetchone() == (13.9,)
+        assert con.execute("SELECT COUNT(*) FROM v_curated_futures").fetchone() == (1,)
+
+    def test_tables_sorted_by_trade_date(self, tmp_path):
+        config = make_config(tmp_path)
+        con    = duckdb.connect(str(build_snapshot(config)), read_only=True)
+        dates  = [r[0] for r in con.execute("SELECT trade_date FROM t_processed_vix").fetchall()]
+        assert dates == sorted(dates)
+
+    def test_meta_records_data_version(self, tmp_path):
+        config  = make_config(tmp_path)
+        con     = duckdb.connect(str(build_snapshot(config)), read_only=True)
+        version = DataVersion([config.processed_dir, config.curated_dir], ttl_s=0).compute()
+        assert snapshot_meta(con)["data_version"] == version
+
+    def test_unchanged_data_reuses_file(self, tmp_path):
+        config = make_config(tmp_path)
+        assert build_snapshot(config) == build_snapshot(config)
+
+    def test_new_data_prunes_old_snapshots(self, tmp_path):
+        config = make_config(tmp_path)
+        first  = build_snapshot(config, keep=1)
+        write_parquet(config.processed_dir / "vix" / "vix_2.parquet", pd.DataFrame({
+            "trade_date": [date(2025, 3, 12)], "close": [14.0],
+        }))
+        second = build_snapshot(config, keep=1)
+        assert second != first
+        assert not first.exists()
+        assert current_snapshot(config.snapshot_dir) == second
+
+    def test_no_current_pointer(self, tmp_path):
+        assert current_snapshot(tmp_path / "snapshot") is None
+
+
+def set_mtime(path: Path, seconds: int):
+    os.utime(path, ns=(seconds * 10**9, seconds * 10**9))
+
+
+@pytest.fixture
+def published(tmp_path, monkeypatch):
+    # manifests written, then the snapshot built from them, as the pipeline publishes
+    config = make_config(tmp_path)
+    write_manifest(config.processed_dir)
+    write_manifest(config.curated_dir)
+    build_snapshot(config)
+    set_mtime(config.processed_dir / MANIFEST, 1_000)
+    set_mtime(config.curated_dir / MANIFEST, 1_000)
+    set_mtime(config.snapshot_dir / CURRENT, 2_000)
+
+    scans = []
+    scan  = DataVersion._scan
+    monkeypatch.setattr(DataVersion, "_scan", lambda self: scans.append(1) or scan(self))
+    monkeypatch.setattr(dependencies, "_config", lambda: config)
+    monkeypatch.setattr(dependencies, "SNAPSHOT", "auto")
+    config.scans = scans
+    yield config
+    dependencies.get_data_version.cache_clear()
+
+
+def open_generation():
+    generation = dependencies._open_generation()
+    generation.close()
+    return generation
+
+
+class TestOpenSnapshot:
+
+    def test_current_snapshot_opens_without_walk(self, published):
+        generation = open_generation()
+        assert generation.source.startswith("snapshot")
+        assert published.scans == []
+        assert generation.version == DataVersion([published.processed_dir, published.curated_dir]).compute()
+
+    def test_manifest_newer_than_snapshot_is_compared(self, published):
+        set_mtime(published.curated_dir / MANIFEST, 3_000)
+        assert open_generation().source.startswith("snapshot")
+        assert len(published.scans) == 1
+
+    def test_stale_snapshot_falls_back_to_views(self, published):
+        write_parquet(published.processed_dir / "vix" / "vix_2.parquet", pd.DataFrame({
+            "trade_date": [date(2025, 3, 12)], "close": [14.0],
+        }))
+        write_manifest(published.processed_dir)
+        dependencies.get_data_version.cache_clear()
+        assert dependencies._open_snapshot(published) is None
+        # the views registered next take their data version from the same walk
+        dependencies.get_data_version().current()
+        assert len(published.scans) == 1
+
+    def test_layer_without_manifest_is_compared(self, published):
+        (published.processed_dir / MANIFEST).unlink()
+        assert open_generation().source.startswith("snapshot")
+        assert len(published.scans) == 1
@@ -0,0 +1,46 @@
+import logging
+import duckdb
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from datetime import date
+from src.db.typed_views import typed_select
+
+logger = logging.getLogger("test_typed_views")
+
+
+def view_types(tmp_path, table: pa.Table) -> dict:
+    path = tmp_path / "x.parquet"
+    pq.write_table(table, path)
+    con = duckdb.connect()
+    source = f"read_parquet('{path}')"
+    con.execute(f"CREATE VIEW v AS {typed_select(con, source, 'v', logger)}")
+    return {row[0]: row[1] for row in con.execute("DESCRIBE v").fetchall()}, con
+
+
+class TestTypedSelect:
+
+    def test_date_columns_pass_through(self, tmp_path):
+        table = pa.table({"trade_date": pa.array([date(2025, 3, 10)], pa.date32()), "close": [1.0]})
+        path  = tmp_path / "x.parquet"
+        pq.write_table(table, path)
+        sql = typed_select(duckdb.connect(), f"read_parquet('{path}')", "v", logger)
+        assert "REPLACE" not in sql
+
+    def test_timestamp_cast_to_date(self, tmp_path, caplog):
+        table = pa.table({"trade_date": pd.to_datetime(["2025-03-10"]), "close": [1.0]})
+        with caplog.at_level(logging.WARNING):
+            types, con = view_types(tmp_path, table)
+        assert types["trade_date"] == "DATE"
+        assert con.execute("SELECT close FROM v WHERE trade_date = ?", [date(2025, 3, 10)]).fetchone() == (1.0,)
+        assert "Rebuild" in caplog.text
+
+    def test_varchar_cast_to_date(self, tmp_path):
+        types, _ = view_types(tmp_path, pa.table({"expiry_date": ["2025-03-31"]}))
+        assert types["expiry_date"] == "DATE"
+
+    def test_all_null_column_typed_as_date(self, tmp_path):
+        table = pa.table({"start_date": pa.array([date(2024, 1, 1)], pa.date32()), "end_date": pa.nulls(1)})
+        types, con = view_types(tmp_path, table)
+        assert types["end_date"] == "DATE"
+        assert con.execute("SELECT end_date FROM v").fetchone() == (None,)
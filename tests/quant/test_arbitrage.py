@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.quant.bs_vectorized import _bs_price_vec, compute_batch
+from src.quant.arbitrage import (
+    arbitrage_flags, arbitrage_summary,
+    ARB_VERTICAL, ARB_BUTTERFLY, ARB_CALENDAR, ARB_BRACKET,
+)
+
+STRIKES = np.arange(21000.0, 23001.0, 250.0)
+
+
+def make_chain_df(dte_list=(30,), vol=0.16):
+    rows = []
+    for dte in dte_list:
+        n = len(STRIKES)
+        for opt_type in ["CE", "PE"]:
+            price = _bs_price_vec(
+                np.full(n, 22000.0), STRIKES, np.full(n, dte / 365), np.full(n, 0.065),
+                np.full(n, 0.012), np.full(n, vol), np.full(n, opt_type == "CE"),
+            )
+            for K, p in zip(STRIKES, price):
+                rows.append({
+                    "trade_date": pd.Timestamp("2025-01-02"), "symbol": "NIFTY",
+                    "expiry_date": pd.Timestamp("2025-01-02") + pd.Timedelta(days=dte),
+                    "strike": K, "option_type": opt_type, "dte": dte,
+                    "spot": 22000.0, "div_yield": 1.2, "rate": 0.065, "settle": p,
+                })
+    return pd.DataFrame(rows)
+
+
+def row(df, strike, opt_type="CE", dte=30):
+    return int(np.flatnonzero(
+        (df["strike"] == strike) & (df["option_type"] == opt_type) & (df["dte"] == dte)
+    )[0])
+
+
+class TestArbitrageFlags:
+
+    def test_clean_chain_unflagged(self):
+        df = make_chain_df(dte_list=(30, 60))
+        assert (arbitrage_flags(df) == 0).all()
+
+    def test_call_rising_with_strike_flags_higher_strike(self):
+        df = make_chain_df()
+        i = row(df, 22500.0)
+        df.loc[i, "settle"] = df.loc[row(df, 22250.0), "settle"] + 20.0
+        flags = arbitrage_flags(df)
+        assert flags[i] & ARB_VERTICAL
+
+    def test_put_falling_with_strike_flags_lower_strike(self):
+        df = make_chain_df()
+        i = row(df, 21500.0, "PE")
+        df.loc[i, "settle"] = df.loc[row(df, 21750.0, "PE"), "settle"] + 20.0
+        assert arbitrage_flags(df)[i] & ARB_VERTICAL
+
+    def test_concave_price_flags_butterfly(self):
+        df = make_chain_df()
+        i = row(df, 22000.0)
+        lo, hi = df.loc[row(df, 21750.0), "settle"], df.loc[row(df, 22250.0), "settle"]
+        df.loc[i, "settle"] = (lo + hi) / 2 + 10.0
+        assert arbitrage_flags(df)[i] & ARB_BUTTERFLY
+
+    def test_cheaper_longer_call_flags_calendar(self):
+        df = make_chain_df(dte_list=(30, 60))
+        i = row(df, 22000.0, dte=60)
+        df.loc[i, "settle"] = df.loc[row(df, 22000.0, dte=30), "settle"] - 5.0
+        assert arbitrage_flags(df)[i] & ARB_CALENDAR
+
+    def test_price_above_max_vol_flags_bracket(self):
+        df = make_chain_df()
+        i = row(df, 22000.0)
+        df.loc[i, "settle"] = 30000.0
+        assert arbitrage_flags(df)[i] & ARB_BRACKET
+
+    def test_expired_and_unpriced_rows_ignored(self):
+        df = make_chain_df()
+        df["dte"] = 0
+        assert (arbitrage_flags(df) == 0).all()
+
+    def test_summary_counts_each_bit(self):
+        flags = np.array([0, ARB_VERTICAL | ARB_BUTTERFLY, ARB_BRACKET], dtype=np.int16)
+        summary = arbitrage_summary(flags)
+        assert summary == {"vertical": 1, "butterfly": 1, "calendar": 0, "bracket": 1}
+
+
+class TestSolverPrescreen:
+
+    def test_bracket_rows_are_nan_and_others_unchanged(self):
+        df = make_chain_df()
+        i = row(df, 22000.0)
+        df.loc[i, "settle"] = 30000.0
+        iv = compute_batch(df)["iv"]
+        assert np.isnan(iv[i])
+        others = np.delete(iv, i)
+        assert np.allclose(others[~np.isnan(others)], 0.16, atol=1e-4)
+
+    def test_price_within_tolerance_of_floor_still_solves(self):
+        df = make_chain_df(vol=0.001)
+        iv = compute_batch(df)["iv"]
+        assert (~np.isnan(iv)).any()
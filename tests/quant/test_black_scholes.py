@@ -1,6 +1,7 @@
 import pytest
 import math
-from src.quant.black_scholes import (BSMInputs,BSMResult,compute,_bs_price,_norm_cdf,_invert_iv,IV_LOWER_BOUND,IV_UPPER_BOUND,TOLERANCE,)
+from src.quant import black_scholes
+from src.quant.black_scholes import (BSMInputs,BSMResult,compute,compute_many,_bs_price,_norm_cdf,_invert_iv,IV_LOWER_BOUND,IV_UPPER_BOUND,TOLERANCE,)
 
 @pytest.fixture
 def atm_call():
@@ -468,6 +469,104 @@ class TestNullResultCompleteness:
         assert result.theta is not None
         assert result.rho   is not None
 
+
+# Solver Tests
+
+class TestNewtonSolver:
+
+    def _count_evals(self, monkeypatch):
+        calls = {"n": 0}
+        original = black_scholes._bs_price
+
+        def counting(*args):
+            calls["n"] += 1
+            return original(*args)
+
+        monkeypatch.setattr(black_scholes, "_bs_price", counting)
+        return calls
+
+    @pytest.mark.parametrize("strike,dte,vol", [
+        (22000.0, 30, 0.18),
+        (21000.0, 30, 0.25),
+        (23000.0, 7, 0.12),
+        (22000.0, 180, 0.40),
+        (19000.0, 90, 0.80),
+    ])
+    def test_converges_in_few_evaluations(self, monkeypatch, strike, dte, vol):
+        T = dte / 365.0
+        price = _bs_price(22000.0, strike, T, 0.065, 0.0123, vol, "CE")
+        calls = self._count_evals(monkeypatch)
+        iv = _invert_iv(price, 22000.0, strike, T, 0.065, 0.0123, "CE")
+        assert iv == pytest.approx(vol, abs=1e-4)
+        # two bracket endpoints plus a handful of Newton steps
+        assert calls["n"] <= 10
+
+    def test_deep_otm_falls_back_inside_bracket(self):
+        # vega is tiny at the low end; Newton steps leave the bracket and bisect
+        T = 7 / 365.0
+        price = _bs_price(22000.0, 24000.0, T, 0.065, 0.0123, 0.15, "CE")
+        iv = _invert_iv(price, 22000.0, 24000.0, T, 0.065, 0.0123, "CE")
+        assert iv is not None
+        assert IV_LOWER_BOUND <= iv <= IV_UPPER_BOUND
+        assert abs(_bs_price(22000.0, 24000.0, T, 0.065, 0.0123, iv, "CE") - price) < TOLERANCE
+
+    def test_no_bracket_returns_none(self):
+        assert _invert_iv(99999.0, 22000.0, 22000.0, 30 / 365.0, 0.065, 0.0123, "CE") is None
+
+
+# Batch Entry Point Tests
+
+class TestComputeMany:
+
+    def test_empty_inputs(self):
+        assert compute_many([], []) == []
+
+    def test_length_mismatch_raises(self, atm_call):
+        with pytest.raises(ValueError):
+            compute_many([atm_call], [100.0, 200.0])
+
+    def test_matches_scalar_compute(self, atm_call, atm_put, itm_call, otm_call, itm_put, otm_put, long_dte_call):
+        inputs = [atm_call, atm_put, itm_call, otm_call, itm_put, otm_put, long_dte_call]
+        prices = [
+            _bs_price(i.spot, i.strike, i.dte / 365.0, i.rate, i.div_yield, 0.18, i.option_type)
+            for i in inputs
+        ]
+        batch = compute_many(inputs, prices)
+        assert len(batch) == len(inputs)
+        for inp, price, got in zip(inputs, prices, batch):
+            want = compute(inp, price)
+            assert got.iv    == pytest.approx(want.iv,    abs=1e-4)
+            assert got.delta == pytest.approx(want.delta, abs=1e-4)
+            assert got.gamma == pytest.approx(want.gamma, rel=1e-3)
+            assert got.vega  == pytest.approx(want.vega,  rel=1e-3)
+            assert got.theta == pytest.approx(want.theta, rel=1e-3)
+            assert got.rho   == pytest.approx(want.rho,   rel=1e-3)
+
+    @pytest.mark.parametrize("vol", [0.008, 0.0101, 0.02, 4.9])
+    def test_matches_scalar_near_iv_bounds(self, vol):
+        inp   = BSMInputs(spot=22000.0, strike=22000.0, dte=30, rate=0.065, div_yield=0.0123, option_type="CE")
+        price = _bs_price(inp.spot, inp.strike, inp.dte / 365.0, inp.rate, inp.div_yield, vol, inp.option_type)
+        want  = compute(inp, price)
+        got   = compute_many([inp], [price])[0]
+        if want.iv is None:
+            assert got == want
+        else:
+            assert got.iv    == pytest.approx(want.iv,    abs=1e-4)
+            assert got.delta == pytest.approx(want.delta, abs=1e-4)
+
+    def test_below_scalar_lower_bound_is_none(self):
+        inp   = BSMInputs(spot=22000.0, strike=22000.0, dte=30, rate=0.065, div_yield=0.0123, option_type="CE")
+        price = _bs_price(inp.spot, inp.strike, inp.dte / 365.0, inp.rate, inp.div_yield, 0.008, inp.option_type)
+        assert compute(inp, price).iv is None
+        assert compute_many([inp], [price])[0] == BSMResult(iv=None, delta=None, gamma=None, vega=None, theta=None, rho=None)
+
+    def test_guarded_rows_are_none(self, atm_call, itm_call):
+        expired = BSMInputs(spot=22000.0, strike=22000.0, dte=0, rate=0.065, div_yield=0.0123, option_type="CE")
+        futures = BSMInputs(spot=22000.0, strike=22000.0, dte=30, rate=0.065, div_yield=0.0123, option_type="FUT")
+        results = compute_many([expired, futures, atm_call, itm_call], [300.0, 300.0, 99999.0, 10.0])
+        for result in results:
+            assert result == BSMResult(iv=None, delta=None, gamma=None, vega=None, theta=None, rho=None)
+
 #run
 """
 pytest tests/quant/test_black_scholes.py -v
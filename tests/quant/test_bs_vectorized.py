@@ -5,6 +5,8 @@ from src.quant.bs_vectorized import (
     compute_batch,
     _bs_price_vec,
     _vega_vec,
+    _greeks_vec,
+    HIGHER_ORDER_GREEKS,
     _norm_cdf,
     _norm_pdf,
     IV_LOWER,
@@ -488,6 +490,56 @@ class TestBatchBehavior:
         assert result["delta"][2] > 0    # ITM CE delta positive
         assert result["delta"][3] < 0    # ITM PE delta negative
 
+# Higher-order Greeks
+
+class TestHigherOrderGreeks:
+
+    S, K, T, r, q, vol = arr(22000.0), arr(22500.0), arr(30 / 365), arr(0.065), arr(0.012), arr(0.18)
+
+    def _greeks(self, is_call, **bump):
+        args = {"S": self.S, "K": self.K, "T": self.T, "r": self.r, "q": self.q, "sigma": self.vol}
+        args.update(bump)
+        return _greeks_vec(is_call=np.array([is_call]), higher_order=True, **args)
+
+    def test_default_returns_first_order_only(self):
+        out = _greeks_vec(self.S, self.K, self.T, self.r, self.q, self.vol, np.array([True]))
+        assert len(out) == 5
+
+    @pytest.mark.parametrize("is_call", [True, False])
+    def test_vanna_volga_match_finite_difference(self, is_call):
+        h = 1e-4
+        up = self._greeks(is_call, sigma=self.vol + h)
+        dn = self._greeks(is_call, sigma=self.vol - h)
+        _, _, _, _, _, vanna, volga, _, _ = self._greeks(is_call)
+        assert vanna[0] == pytest.approx((up[0][0] - dn[0][0]) / (2 * h) / 100, rel=1e-5)
+        assert volga[0] == pytest.approx((up[2][0] - dn[2][0]) / (2 * h) / 100, rel=1e-5)
+
+    @pytest.mark.parametrize("is_call", [True, False])
+    def test_charm_is_daily_delta_decay(self, is_call):
+        h = 1e-5
+        later   = self._greeks(is_call, T=self.T - h)
+        earlier = self._greeks(is_call, T=self.T + h)
+        charm   = self._greeks(is_call)[7]
+        assert charm[0] == pytest.approx((later[0][0] - earlier[0][0]) / (2 * h) / 365, rel=1e-5)
+
+    def test_speed_matches_finite_difference(self):
+        h = 1.0
+        up = self._greeks(True, S=self.S + h)
+        dn = self._greeks(True, S=self.S - h)
+        speed = self._greeks(True)[8]
+        assert speed[0] == pytest.approx((up[1][0] - dn[1][0]) / (2 * h), rel=1e-5)
+
+    def test_compute_batch_opt_in_keys(self):
+        result = compute_batch(make_df(), higher_order=True)
+        assert set(HIGHER_ORDER_GREEKS) <= set(result.keys())
+        assert not np.isnan(result["vanna"][0])
+
+    def test_compute_batch_invalid_row_higher_order_nan(self):
+        result = compute_batch(make_df(dte=0), higher_order=True)
+        for name in HIGHER_ORDER_GREEKS:
+            assert np.isnan(result[name][0])
+
+
 # Scalar vs Vectorized Agreement BS Model
 
 class TestScalarVectorizedAgreement:
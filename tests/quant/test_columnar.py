@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from src.quant.columnar import ColumnarTable
+from src.quant.portfolio import PositionResult, PositionTable
+
+
+class LegTable(ColumnarTable):
+    FIELDS     = ("name", "qty", "dte", "price")
+    STR_FIELDS = frozenset({"name"})
+    INT_FIELDS = frozenset({"qty", "dte"})
+
+
+def make_table():
+    return LegTable({
+        "name":  ["a", "b", "c"],
+        "qty":   [1, -2, 3],
+        "dte":   [7, None, 30],
+        "price": [10.5, None, 0.25],
+    })
+
+
+class TestColumnarTable:
+
+    def test_columns_are_numpy_arrays(self):
+        table = make_table()
+        assert table.qty.dtype == np.int64
+        assert table.price.dtype == np.float64
+        # nullable int column keeps NaN for the gap
+        assert np.isnan(table.dte[1])
+
+    def test_row_view_returns_python_scalars(self):
+        row = make_table()[0]
+        assert row.name == "a"
+        assert row.qty == 1 and isinstance(row.qty, int)
+        assert row.dte == 7 and isinstance(row.dte, int)
+        assert row.price == 10.5
+
+    def test_row_view_maps_nan_to_none(self):
+        row = make_table()[1]
+        assert row.dte is None
+        assert row.price is None
+
+    def test_row_view_has_no_instance_dict(self):
+        row = make_table()[0]
+        assert not hasattr(row, "__dict__")
+        with pytest.raises(AttributeError):
+            row.qty = 5
+
+    def test_negative_index_and_bounds(self):
+        table = make_table()
+        assert table[-1].name == "c"
+        with pytest.raises(IndexError):
+            table[3]
+
+    def test_iteration_and_len(self):
+        table = make_table()
+        assert len(table) == 3
+        assert [r.name for r in table] == ["a", "b", "c"]
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            make_table()[0].missing
+
+    def test_to_columns_is_json_ready(self):
+        cols = make_table().to_columns()
+        assert cols["dte"] == [7, None, 30]
+        assert cols["price"] == [10.5, None, 0.25]
+        assert all(type(v) is int for v in cols["qty"])
+
+    def test_to_records_matches_row_views(self):
+        table = make_table()
+        assert table.to_records() == [r.to_dict() for r in table]
+
+    def test_to_arrow_preserves_nulls(self):
+        arrow = make_table().to_arrow()
+        assert arrow.num_rows == 3
+        assert arrow.column("dte").null_count == 1
+        assert arrow.column("dte").to_pylist() == [7, None, 30]
+
+    def test_unequal_lengths_raise(self):
+        with pytest.raises(ValueError, match="unequal lengths"):
+            LegTable({"name": ["a"], "qty": [1, 2], "dte": [1], "price": [1.0]})
+
+    def test_missing_column_raises(self):
+        with pytest.raises(ValueError, match="missing columns"):
+            LegTable({"name": ["a"], "qty": [1]})
+
+
+class TestPositionTable:
+
+    def test_from_rows_round_trips_dataclass(self):
+        row = PositionResult(
+            symbol="NIFTY", expiry_date="2026-03-24", strike=22500.0, option_type="CE",
+            quantity=2, lot_size=75, entry_date="2026-03-10", entry_price=120.5,
+            current_price=None, mtm_pnl=0.0, scenario_pnl=0.0, total_pnl=0.0,
+            method="no_data", delta=None, gamma=None, vega=None, theta=None, rho=None,
+        )
+        table = PositionTable.from_rows([row])
+        assert table[0].to_dict() == row.__dict__
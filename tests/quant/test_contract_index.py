@@ -0,0 +1,97 @@
+from datetime import date
+
+import pandas as pd
+
+from src.quant.contract_index import ContractIndex, strike_paise
+
+
+def make_chain():
+    return pd.DataFrame({
+        "symbol":      ["NIFTY", "NIFTY", "NIFTY", "BANKNIFTY", "NIFTY"],
+        "expiry_date": [date(2026, 3, 26), date(2026, 3, 26), date(2026, 4, 30), date(2026, 3, 26), date(2026, 3, 26)],
+        "strike":      [22000.0, 22000.0, 22000.0, 48000.0, 22000.0],
+        "option_type": ["CE", "PE", "CE", "CE", "CE"],
+    })
+
+
+class TestContractIndex:
+
+    def test_scalar_get(self):
+        index = ContractIndex.from_frame(make_chain())
+        assert index.get("NIFTY", date(2026, 3, 26), 22000.0, "PE") == 1
+        assert index.get("BANKNIFTY", date(2026, 3, 26), 48000.0, "CE") == 3
+
+    def test_missing_contract_returns_none(self):
+        index = ContractIndex.from_frame(make_chain())
+        assert index.get("NIFTY", date(2026, 3, 26), 22100.0, "CE") is None
+        assert index.get("FINNIFTY", date(2026, 3, 26), 22000.0, "CE") is None
+        assert index.get("NIFTY", date(2026, 3, 26), 22000.0, "XX") is None
+
+    def test_duplicate_keys_keep_first_row(self):
+        index = ContractIndex.from_frame(make_chain())
+        assert index.get("NIFTY", date(2026, 3, 26), 22000.0, "CE") == 0
+        assert len(index) == 4
+
+    def test_bulk_lookup(self):
+        index = ContractIndex.from_frame(make_chain())
+        rows = index.lookup(
+            ["NIFTY", "NIFTY", "MIDCPNIFTY", "BANKNIFTY"],
+            [date(2026, 4, 30), date(2026, 3, 26), date(2026, 3, 26), date(2026, 3, 26)],
+            [22000.0, 22000.0, 12000.0, 48000.0],
+            ["CE", "PE", "CE", "CE"],
+        )
+        assert rows.tolist() == [2, 1, -1, 3]
+
+    def test_strike_matched_in_paise(self):
+        index = ContractIndex.from_frame(make_chain())
+        # float noise below half a paisa still resolves to the listed strike
+        assert index.get("NIFTY", date(2026, 3, 26), 22000.0000001, "PE") == 1
+        assert index.get("NIFTY", date(2026, 3, 26), 22000.01, "PE") is None
+
+    def test_string_and_date_expiries_agree(self):
+        index = ContractIndex.from_frame(make_chain())
+        assert index.get("NIFTY", "2026-04-30", 22000.0, "CE") == 2
+
+    def test_futures_frame_keys_on_symbol_and_expiry(self):
+        futures = pd.DataFrame({
+            "symbol":      ["NIFTY", "BANKNIFTY"],
+            "expiry_date": [date(2026, 3, 26), date(2026, 3, 26)],
+            "settle":      [22050.0, 48100.0],
+        })
+        index = ContractIndex.from_frame(futures)
+        assert index.get("BANKNIFTY", date(2026, 3, 26), 0.0, "XX") == 1
+
+    def test_empty_frame(self):
+        index = ContractIndex.from_frame(pd.DataFrame())
+        assert len(index) == 0
+        assert index.lookup(["NIFTY"], [date(2026, 3, 26)], [22000.0], ["CE"]).tolist() == [-1]
+
+    def test_strike_paise_rounds(self):
+        assert strike_paise([22000.0, 105.5, 99.999999]).tolist() == [2200000, 10550, 10000]
+
+
+class TestStrikes:
+
+    def make_ladder(self):
+        return pd.DataFrame({
+            "symbol":      ["NIFTY"] * 5 + ["BANKNIFTY"],
+            "expiry_date": [date(2026, 3, 26)] * 4 + [date(2026, 4, 30), date(2026, 3, 26)],
+            "strike":      [22100.0, 21950.5, 22000.0, 22100.0, 21000.0, 48000.0],
+            "option_type": ["CE", "CE", "PE", "PE", "CE", "CE"],
+        })
+
+    def test_strikes_sorted_per_type(self):
+        index = ContractIndex.from_frame(self.make_ladder())
+        assert index.strikes("NIFTY", date(2026, 3, 26), "CE").tolist() == [21950.5, 22100.0]
+        assert index.strikes("NIFTY", date(2026, 3, 26), "PE").tolist() == [22000.0, 22100.0]
+
+    def test_strikes_scoped_to_symbol_and_expiry(self):
+        index = ContractIndex.from_frame(self.make_ladder())
+        assert index.strikes("NIFTY", date(2026, 4, 30), "CE").tolist() == [21000.0]
+        assert index.strikes("BANKNIFTY", date(2026, 3, 26), "CE").tolist() == [48000.0]
+
+    def test_unknown_contract_returns_empty(self):
+        index = ContractIndex.from_frame(self.make_ladder())
+        assert len(index.strikes("FINNIFTY", date(2026, 3, 26), "CE")) == 0
+        assert len(index.strikes("NIFTY", date(2026, 5, 28), "CE")) == 0
+        assert len(index.strikes("NIFTY", date(2026, 3, 26), "XX")) == 0
@@ -1,6 +1,8 @@
 import math
+import numpy as np
+import pandas as pd
 import pytest
-from src.quant.futures_pricing import FuturesPricer
+from src.quant.futures_pricing import FuturesPricer, compute_futures_batch, FUTURES_QUANT_COLS
 
 class TestAnnualizedDte:
 
@@ -97,3 +99,56 @@ class TestDelta:
 
     def test_delta_is_float(self):
         assert isinstance(FuturesPricer.delta(), float)
+
+
+def make_term_df():
+    rows = []
+    for symbol, spot in [("NIFTY", 22000.0), ("BANKNIFTY", 48000.0)]:
+        for dte in [58, 30, 86]:
+            rows.append({
+                "trade_date": "2025-01-02", "symbol": symbol, "dte": dte,
+                "spot": spot, "rate": 0.065, "div_yield": 1.2,
+                "settle": spot * np.exp(0.055 * dte / 365),
+            })
+    return pd.DataFrame(rows)
+
+
+class TestFuturesBatch:
+
+    def test_matches_scalar_pricer(self):
+        df  = make_term_df()
+        out = FuturesPricer.batch(df)
+        row = df.iloc[0]
+        expected = FuturesPricer.theoretical_price(row["spot"], row["rate"], row["div_yield"] / 100, row["dte"] / 365)
+        assert out["theoretical_price"][0] == pytest.approx(expected)
+        assert out["basis"][0] == pytest.approx(row["settle"] - expected)
+
+    def test_implied_carry_and_repo(self):
+        out = compute_futures_batch(make_term_df())
+        assert np.allclose(out["implied_carry"], 0.055)
+        assert np.allclose(out["implied_repo"], 0.055 + 0.012)
+
+    def test_zero_dte_carry_is_nan(self):
+        df = make_term_df()
+        df["dte"] = 0
+        assert np.isnan(compute_futures_batch(df)["implied_carry"]).all()
+
+    def test_expiry_rank_per_symbol(self):
+        out = compute_futures_batch(make_term_df())
+        assert out["expiry_rank"].tolist() == [2, 1, 3, 2, 1, 3]
+
+    def test_calendar_spread_to_next_expiry(self):
+        df  = make_term_df()
+        out = compute_futures_batch(df)
+        near, nxt = 1, 0  # dte 30 → dte 58
+        assert out["calendar_spread"][near] == pytest.approx(df["settle"][nxt] - df["settle"][near])
+        assert np.isnan(out["calendar_spread"][2])  # far month has no next
+
+    def test_roll_yield_annualized(self):
+        out = compute_futures_batch(make_term_df())
+        assert out["roll_yield"][1] == pytest.approx(0.055)
+
+    def test_fair_spread_tracks_model_carry(self):
+        out = compute_futures_batch(make_term_df())
+        assert out["calendar_spread_fair"][1] > 0
+        assert list(out.keys()) == FUTURES_QUANT_COLS
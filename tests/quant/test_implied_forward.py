@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.quant.bs_vectorized import _bs_price_vec, compute_batch
+from src.quant.implied_forward import (
+    implied_forwards, attach_implied_div_yield, FORWARD_COLS, PARITY_PAIRS,
+)
+
+SPOT, RATE, Q_PCT, DTE = 22000.0, 0.065, 1.4, 30
+
+
+def make_options_df(strikes=None, dte=DTE, q_pct=Q_PCT, expiry="2025-01-30"):
+    strikes = np.arange(21000.0, 23001.0, 100.0) if strikes is None else np.asarray(strikes, dtype=float)
+    n = len(strikes)
+    rows = []
+    for opt_type in ["CE", "PE"]:
+        price = _bs_price_vec(
+            np.full(n, SPOT), strikes, np.full(n, dte / 365), np.full(n, RATE),
+            np.full(n, q_pct / 100), np.full(n, 0.16), np.full(n, opt_type == "CE"),
+        )
+        for K, p in zip(strikes, price):
+            rows.append({
+                "trade_date": pd.Timestamp("2024-12-31"), "symbol": "NIFTY",
+                "expiry_date": pd.Timestamp(expiry), "strike": K, "option_type": opt_type,
+                "settle": p, "dte": dte, "spot": SPOT, "rate": RATE, "div_yield": 1.0,
+            })
+    return pd.DataFrame(rows)
+
+
+class TestImpliedForwards:
+
+    def test_recovers_forward_and_yield(self):
+        out = implied_forwards(make_options_df())
+        expected_fwd = SPOT * np.exp((RATE - Q_PCT / 100) * DTE / 365)
+        assert out["forward"].iloc[0] == pytest.approx(expected_fwd, rel=1e-9)
+        assert out["implied_div_yield"].iloc[0] == pytest.approx(Q_PCT, abs=1e-6)
+
+    def test_columns_and_one_row_per_expiry(self):
+        df = pd.concat([make_options_df(), make_options_df(dte=58, expiry="2025-02-27")], ignore_index=True)
+        out = implied_forwards(df)
+        assert list(out.columns) == FORWARD_COLS
+        assert len(out) == 2
+
+    def test_uses_nearest_pairs_only(self):
+        out = implied_forwards(make_options_df())
+        assert out["n_pairs"].iloc[0] == PARITY_PAIRS
+
+    def test_unmatched_strikes_ignored(self):
+        df = make_options_df()
+        df = df[~((df["option_type"] == "PE") & (df["strike"] >= 22000))]
+        out = implied_forwards(df)
+        assert out["implied_div_yield"].iloc[0] == pytest.approx(Q_PCT, abs=1e-6)
+
+    def test_expired_and_zero_settle_excluded(self):
+        df = make_options_df(dte=0)
+        assert implied_forwards(df).empty
+        df = make_options_df()
+        df["settle"] = 0.0
+        assert implied_forwards(df).empty
+
+
+class TestImpliedQSource:
+
+    def test_attach_left_joins_on_expiry(self):
+        chain    = make_options_df()
+        attached = attach_implied_div_yield(chain, implied_forwards(chain))
+        assert len(attached) == len(chain)
+        assert attached["implied_div_yield"].notna().all()
+
+    def test_compute_batch_implied_solves_true_vol(self):
+        chain = attach_implied_div_yield(make_options_df(), implied_forwards(make_options_df()))
+        iv = compute_batch(chain, q_source="implied")["iv"]
+        assert np.allclose(iv[~np.isnan(iv)], 0.16, atol=1e-4)
+
+    def test_compute_batch_falls_back_to_div_yield(self):
+        chain = make_options_df()
+        chain["implied_div_yield"] = np.nan
+        implied = compute_batch(chain, q_source="implied")["iv"]
+        index   = compute_batch(chain)["iv"]
+        assert np.allclose(implied, index, equal_nan=True)
+
+    def test_invalid_q_source_raises(self):
+        with pytest.raises(ValueError, match="q_source"):
+            compute_batch(make_options_df(), q_source="futures")
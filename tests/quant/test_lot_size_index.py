@@ -0,0 +1,67 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from src.quant.lot_size_index import LotSizeIndex
+
+
+def make_lot_size_df():
+    return pd.DataFrame([
+        {"symbol": "NIFTY",     "start_date": date(2024, 1, 1),   "end_date": date(2024, 10, 27), "lot_size": 25},
+        {"symbol": "NIFTY",     "start_date": date(2024, 10, 28), "end_date": date(2025, 10, 27), "lot_size": 75},
+        {"symbol": "NIFTY",     "start_date": date(2025, 10, 28), "end_date": None,               "lot_size": 65},
+        {"symbol": "BANKNIFTY", "start_date": date(2024, 1, 1),   "end_date": None,               "lot_size": 15},
+    ])
+
+
+class TestLotSizeIndex:
+
+    def test_resolves_each_interval(self):
+        index = LotSizeIndex.from_frame(make_lot_size_df())
+        assert index.get("NIFTY", date(2024, 6, 1)) == 25
+        assert index.get("NIFTY", date(2025, 3, 10)) == 75
+        assert index.get("NIFTY", date(2026, 3, 10)) == 65
+
+    def test_interval_bounds_are_inclusive(self):
+        index = LotSizeIndex.from_frame(make_lot_size_df())
+        assert index.get("NIFTY", date(2024, 10, 27)) == 25
+        assert index.get("NIFTY", date(2024, 10, 28)) == 75
+
+    def test_open_ended_interval(self):
+        index = LotSizeIndex.from_frame(make_lot_size_df())
+        assert index.get("BANKNIFTY", date(2030, 1, 1)) == 15
+
+    def test_before_first_interval_defaults_to_one(self):
+        index = LotSizeIndex.from_frame(make_lot_size_df())
+        assert index.get("NIFTY", date(2023, 12, 31)) == 1
+
+    def test_unknown_symbol_defaults_to_one(self):
+        index = LotSizeIndex.from_frame(make_lot_size_df())
+        assert index.get("FINNIFTY", date(2025, 3, 10)) == 1
+
+    def test_gap_between_intervals_defaults_to_one(self):
+        df = pd.DataFrame([
+            {"symbol": "NIFTY", "start_date": date(2024, 1, 1), "end_date": date(2024, 3, 31), "lot_size": 50},
+            {"symbol": "NIFTY", "start_date": date(2024, 6, 1), "end_date": None,              "lot_size": 25},
+        ])
+        index = LotSizeIndex.from_frame(df)
+        assert index.get("NIFTY", date(2024, 4, 15)) == 1
+
+    def test_vectorized_mixed_symbols_and_dates(self):
+        index = LotSizeIndex.from_frame(make_lot_size_df())
+        sizes = index.lot_size(
+            ["NIFTY", "BANKNIFTY", "NIFTY", "MIDCPNIFTY"],
+            ["2024-06-01", "2025-03-10", "2026-03-10", "2025-03-10"],
+        )
+        assert sizes.dtype == np.int64
+        assert sizes.tolist() == [25, 15, 65, 1]
+
+    def test_unordered_input_rows(self):
+        index = LotSizeIndex.from_frame(make_lot_size_df().iloc[::-1])
+        assert index.get("NIFTY", date(2025, 3, 10)) == 75
+
+    def test_empty_frame(self):
+        index = LotSizeIndex.from_frame(pd.DataFrame())
+        assert len(index) == 0
+        assert index.lot_size(["NIFTY"], [date(2025, 3, 10)]).tolist() == [1]
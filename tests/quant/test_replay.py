@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import date
+
+from src.quant.bs_vectorized import _bs_price_vec
+from src.quant.replay import run_replay, SERIES_COLS
+
+
+DATES = [date(2026, 3, 10), date(2026, 3, 11), date(2026, 3, 12), date(2026, 3, 13)]
+SPOTS = [22000.0, 22100.0, 21900.0, 22200.0]
+EXPIRY = date(2026, 3, 12)
+
+
+def make_positions_df(**kwargs):
+    base = {
+        "symbol": "NIFTY",
+        "expiry_date": str(EXPIRY),
+        "strike": 22000.0,
+        "option_type": "CE",
+        "quantity": 2,
+        "entry_date": "2026-03-10",
+        "entry_price": 100.0,
+    }
+    base.update(kwargs)
+    return pd.DataFrame([base])
+
+
+def make_curated_options():
+    rows = []
+    for d, s in zip(DATES, SPOTS):
+        dte = (EXPIRY - d).days
+        if dte < 0:
+            continue
+        for opt_type in ["CE", "PE"]:
+            rows.append({
+                "trade_date": d, "symbol": "NIFTY", "expiry_date": EXPIRY,
+                "strike": 22000.0, "option_type": opt_type,
+                "dte": dte, "spot": s, "div_yield": 1.2, "rate": 0.065,
+                "settle": 120.0, "iv": 0.15 if dte > 0 else np.nan,
+                "delta": 0.5, "gamma": 0.001, "vega": 10.0, "theta": -5.0, "rho": 1.0,
+            })
+    return pd.DataFrame(rows)
+
+
+def make_curated_futures():
+    return pd.DataFrame([
+        {
+            "trade_date": d, "symbol": "NIFTY", "expiry_date": EXPIRY,
+            "dte": (EXPIRY - d).days, "spot": s, "div_yield": 1.2,
+            "rate": 0.065, "settle": s + 10,
+        }
+        for d, s in zip(DATES, SPOTS) if d <= EXPIRY
+    ])
+
+
+def make_lot_size_df():
+    return pd.DataFrame([
+        {"symbol": "NIFTY", "start_date": date(2025, 10, 28), "end_date": None, "lot_size": 65},
+    ])
+
+
+def replay(positions_df, start="2026-03-10", end="2026-03-13"):
+    return run_replay(
+        positions_df=positions_df,
+        curated_options=make_curated_options(),
+        curated_futures=make_curated_futures(),
+        lot_size_df=make_lot_size_df(),
+        start_date=start,
+        end_date=end,
+    )
+
+
+class TestSeriesShape:
+
+    def test_columns(self):
+        series = replay(make_positions_df())
+        assert list(series.columns) == SERIES_COLS
+
+    def test_one_row_per_trade_date_in_range(self):
+        series = replay(make_positions_df())
+        assert series["trade_date"].tolist() == DATES[:3]
+
+    def test_range_filter(self):
+        series = replay(make_positions_df(), start="2026-03-11", end="2026-03-11")
+        assert series["trade_date"].tolist() == [date(2026, 3, 11)]
+
+    def test_empty_range_returns_empty(self):
+        series = replay(make_positions_df(), start="2027-01-01", end="2027-01-31")
+        assert series.empty
+
+    def test_total_is_mtm_plus_realized(self):
+        series = replay(make_positions_df())
+        assert np.allclose(series["total_pnl"], series["mtm_pnl"] + series["realized_pnl"])
+
+
+class TestOptionReplay:
+
+    def test_open_leg_mtm_uses_bs_reprice(self):
+        series = replay(make_positions_df())
+        first = series.iloc[0]
+        price = _bs_price_vec(
+            np.array([22000.0]), np.array([22000.0]), np.array([2 / 365]),
+            np.array([0.065]), np.array([0.012]), np.array([0.15]), np.array([True]),
+        )[0]
+        assert first["mtm_pnl"] == pytest.approx((price - 100.0) * 2 * 65)
+        assert first["open_legs"] == 1
+
+    def test_expiry_day_realizes_intrinsic(self):
+        series = replay(make_positions_df())
+        expiry_row = series[series["trade_date"] == EXPIRY].iloc[0]
+        # spot on expiry 21900 → 22000 CE expires worthless
+        assert expiry_row["realized_pnl"] == pytest.approx((0.0 - 100.0) * 2 * 65)
+        assert expiry_row["mtm_pnl"] == 0.0
+        assert expiry_row["expired_legs"] == 1
+
+    def test_put_realizes_intrinsic(self):
+        series = replay(make_positions_df(option_type="PE"))
+        expiry_row = series[series["trade_date"] == EXPIRY].iloc[0]
+        assert expiry_row["realized_pnl"] == pytest.approx((100.0 - 100.0) * 2 * 65)
+
+    def test_greeks_scaled_by_quantity_and_lot(self):
+        series = replay(make_positions_df())
+        assert series.iloc[0]["net_delta"] == pytest.approx(0.5 * 2 * 65)
+        assert series.iloc[0]["net_vega"]  == pytest.approx(10.0 * 2 * 65)
+
+    def test_expired_leg_has_no_greeks(self):
+        series = replay(make_positions_df())
+        expiry_row = series[series["trade_date"] == EXPIRY].iloc[0]
+        assert expiry_row["net_delta"] == 0.0
+
+    def test_leg_excluded_before_entry_date(self):
+        series = replay(make_positions_df(entry_date="2026-03-11"))
+        first = series.iloc[0]
+        assert first["open_legs"] == 0
+        assert first["mtm_pnl"] == 0.0
+
+    def test_unknown_contract_is_no_data(self):
+        series = replay(make_positions_df(strike=25000.0))
+        before_expiry = series[series["trade_date"] < EXPIRY]
+        assert (before_expiry["no_data_legs"] == 1).all()
+        assert (before_expiry["total_pnl"] == 0.0).all()
+
+
+class TestFuturesReplay:
+
+    def test_futures_mtm_uses_spot(self):
+        series = replay(make_positions_df(option_type="XX", strike=0.0, entry_price=22000.0))
+        assert series.iloc[1]["mtm_pnl"] == pytest.approx((22100.0 - 22000.0) * 2 * 65)
+
+    def test_futures_realized_at_expiry(self):
+        series = replay(make_positions_df(option_type="XX", strike=0.0, entry_price=22000.0))
+        expiry_row = series[series["trade_date"] == EXPIRY].iloc[0]
+        assert expiry_row["realized_pnl"] == pytest.approx((21900.0 - 22000.0) * 2 * 65)
+
+    def test_futures_delta_is_multiplier(self):
+        series = replay(make_positions_df(option_type="XX", strike=0.0, entry_price=22000.0))
+        assert series.iloc[0]["net_delta"] == pytest.approx(2 * 65)
@@ -1,8 +1,11 @@
 import math
+import numpy as np
+import pandas as pd
 import pytest
 from src.quant.scenario_engine import (
     MarketSnapshot, Shock, OptionContract, FuturesContract,
-    scenario_option, scenario_futures, ScenarioPnL,
+    scenario_option, scenario_futures, scenario_chain, ScenarioPnL,
+    shock_rate_bps,
 )
 
 
@@ -120,3 +123,83 @@ class TestScenarioFutures:
         result_no_vol = scenario_futures(snap, contract, make_shock(spot=1.0, vol=0.0))
         result_vol    = scenario_futures(snap, contract, make_shock(spot=1.0, vol=5.0))
         assert abs(result_no_vol.pnl_total - result_vol.pnl_total) < 1e-6
+
+
+def make_chain_df():
+    rows = []
+    for strike in [21500.0, 22000.0, 22500.0]:
+        for opt_type in ["CE", "PE"]:
+            rows.append({
+                "strike": strike, "option_type": opt_type, "dte": 30,
+                "spot": 22000.0, "div_yield": 1.2, "rate": 0.065, "iv": 0.18,
+            })
+    return pd.DataFrame(rows)
+
+
+class TestScenarioChain:
+
+    def test_zero_shock_zero_pnl(self):
+        result = scenario_chain(make_chain_df(), make_shock())
+        assert np.allclose(result["pnl"], 0.0)
+
+    def test_matches_single_contract_reprice(self):
+        chain  = make_chain_df()
+        shock  = make_shock(spot=-2.0, vol=3.0, rate=25.0)
+        result = scenario_chain(chain, shock)
+        snapshot = MarketSnapshot(
+            spot=22000.0, iv=0.18, rate=0.065, div_yield=0.012, dte=30,
+            delta=None, gamma=None, vega=None, theta=None, rho=None,
+        )
+        single = scenario_option(
+            snapshot, OptionContract(strike=22000.0, option_type="CE", quantity=1, lot_size=1), shock
+        )
+        row = int(np.flatnonzero((chain["strike"] == 22000.0) & (chain["option_type"] == "CE"))[0])
+        assert result["pnl"][row] == pytest.approx(single.pnl_per_lot, rel=1e-9)
+
+    def test_spot_down_calls_lose_puts_gain(self):
+        chain  = make_chain_df()
+        result = scenario_chain(chain, make_shock(spot=-3.0))
+        is_call = (chain["option_type"] == "CE").to_numpy()
+        assert (result["pnl"][is_call] < 0).all()
+        assert (result["pnl"][~is_call] > 0).all()
+
+    def test_greeks_are_at_shocked_market(self):
+        base    = scenario_chain(make_chain_df(), make_shock())
+        shocked = scenario_chain(make_chain_df(), make_shock(spot=5.0))
+        assert (shocked["delta"][::2] > base["delta"][::2]).all()
+
+    def test_unpriced_rows_are_nan(self):
+        chain = make_chain_df()
+        chain.loc[0, "iv"]  = np.nan
+        chain.loc[1, "dte"] = 0
+        result = scenario_chain(chain, make_shock(spot=1.0))
+        assert np.isnan(result["pnl"][:2]).all()
+        assert np.isnan(result["delta"][:2]).all()
+        assert not np.isnan(result["pnl"][2:]).any()
+
+
+class TestTenorRateShocks:
+
+    def test_parallel_only_unchanged(self):
+        shock = make_shock(rate=25.0)
+        assert shock_rate_bps(shock, np.array([10, 200, 400])) == pytest.approx([25.0] * 3)
+
+    def test_tenor_bump_interpolated_at_dte(self):
+        shock = Shock(spot_shock_pct=0.0, vol_shock_abs=0.0, rate_shock_bps=0.0,
+                      tenor_shocks_bps={"3m": 0.0, "6m": 40.0, "1y": 0.0})
+        assert shock_rate_bps(shock, 30)  == pytest.approx(0.0)
+        assert shock_rate_bps(shock, 182) == pytest.approx(40.0)
+        assert shock_rate_bps(shock, 136.5) == pytest.approx(20.0)
+
+    def test_short_end_bump_moves_near_expiry_option(self):
+        near = Shock(spot_shock_pct=0.0, vol_shock_abs=0.0, rate_shock_bps=0.0,
+                     tenor_shocks_bps={"3m": 100.0})
+        result = scenario_option(make_snapshot(), make_contract(), near)
+        parallel = scenario_option(make_snapshot(), make_contract(), make_shock(rate=100.0))
+        assert result.pnl_per_lot == pytest.approx(parallel.pnl_per_lot)
+
+    def test_long_end_bump_ignored_by_near_expiry_chain(self):
+        far = Shock(spot_shock_pct=0.0, vol_shock_abs=0.0, rate_shock_bps=0.0,
+                    tenor_shocks_bps={"1y": 100.0})
+        result = scenario_chain(make_chain_df(), far)
+        assert np.allclose(result["pnl"], 0.0)
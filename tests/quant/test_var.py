@@ -130,3 +130,30 @@ class TestComputeVar:
         assert hasattr(result, "cvar_99")
         assert hasattr(result, "pnl_distribution")
         assert isinstance(result.pnl_distribution, list)
+
+    def test_pnl_distribution_rows_view_scenarios(self):
+        returns = [
+            ("2026-03-{:02d}".format(i), 22000, 21900, 0.001 * (i - 5))
+            for i in range(1, 11)
+        ]
+        db = make_mock_db(returns)
+        with patch("src.quant.var._compute_portfolio_pnl", return_value=-5000.0):
+            result = compute_var(
+                positions_df=make_positions_df(),
+                curated_options=pd.DataFrame(),
+                curated_futures=pd.DataFrame(),
+                lot_size_df=pd.DataFrame(),
+                symbol="NIFTY",
+                trade_date="2026-03-13",
+                db=db,
+                lookback_days=252,
+            )
+        # row views are only built when asked for
+        assert "pnl_distribution" not in vars(result)
+        assert len(result.pnl_distribution) == len(result.scenarios) == 10
+        assert result.pnl_distribution is result.pnl_distribution
+        assert isinstance(result.scenarios.portfolio_pnl, np.ndarray)
+        first = result.pnl_distribution[0]
+        assert first.date == "2026-03-01"
+        assert first.spot_return_pct == pytest.approx(-0.4)
+        assert first.portfolio_pnl == -5000.0
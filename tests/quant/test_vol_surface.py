@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.quant.bs_vectorized import compute_batch, _bs_price_vec
+from src.quant.vol_surface import (
+    SVIParams, VolSurface, fit_svi_slice, fit_svi_surface,
+    svi_total_variance, SURFACE_COLS, SVI_MIN_POINTS,
+)
+
+TRUE_PARAMS = SVIParams(a=0.002, b=0.05, rho=-0.6, m=0.01, sigma=0.08)
+
+
+def true_variance(k):
+    p = TRUE_PARAMS
+    return svi_total_variance(k, p.a, p.b, p.rho, p.m, p.sigma)
+
+
+def make_chain_df(dte: int = 30, spot: float = 22000.0, n_strikes: int = 31) -> pd.DataFrame:
+    rate, q_pct = 0.065, 1.2
+    T = dte / 365.0
+    F = spot * np.exp((rate - q_pct / 100) * T)
+    strikes = np.linspace(spot * 0.85, spot * 1.15, n_strikes)
+    k  = np.log(strikes / F)
+    iv = np.sqrt(true_variance(k) / T)
+    rows = []
+    for K, vol in zip(strikes, iv):
+        for opt_type in ["CE", "PE"]:
+            rows.append({
+                "trade_date": pd.Timestamp("2025-01-02"), "symbol": "NIFTY",
+                "expiry_date": pd.Timestamp("2025-01-02") + pd.Timedelta(days=dte),
+                "strike": K, "option_type": opt_type, "dte": dte,
+                "spot": spot, "div_yield": q_pct, "rate": rate, "iv": vol,
+            })
+    return pd.DataFrame(rows)
+
+
+class TestSVIFormula:
+
+    def test_minimum_variance_at_m(self):
+        k = np.linspace(-0.3, 0.3, 601)
+        w = true_variance(k)
+        assert w.min() > 0
+
+    def test_wings_are_linear(self):
+        # far wings slope → b(1 ± rho)
+        p = TRUE_PARAMS
+        slope = (true_variance(5.0) - true_variance(4.0))
+        assert slope == pytest.approx(p.b * (1 + p.rho), rel=1e-3)
+
+
+class TestFitSlice:
+
+    def test_recovers_known_parameters(self):
+        k = np.linspace(-0.15, 0.1, 40)
+        params, rmse = fit_svi_slice(k, true_variance(k))
+        assert params.rho   == pytest.approx(TRUE_PARAMS.rho,   abs=1e-2)
+        assert params.m     == pytest.approx(TRUE_PARAMS.m,     abs=1e-2)
+        assert params.sigma == pytest.approx(TRUE_PARAMS.sigma, rel=5e-2)
+        assert rmse < 1e-5
+
+    def test_fitted_curve_matches_input(self):
+        k = np.linspace(-0.15, 0.1, 40)
+        w = true_variance(k)
+        p, _ = fit_svi_slice(k, w)
+        assert np.allclose(svi_total_variance(k, p.a, p.b, p.rho, p.m, p.sigma), w, atol=1e-5)
+
+    def test_noisy_input_stays_arbitrage_bounded(self):
+        rng = np.random.default_rng(7)
+        k = np.linspace(-0.15, 0.1, 40)
+        w = true_variance(k) * (1 + rng.normal(0, 0.02, len(k)))
+        p, _ = fit_svi_slice(k, w)
+        assert p.b >= 0
+        assert -1 <= p.rho <= 1
+
+
+class TestFitSurface:
+
+    def test_one_row_per_slice(self):
+        df = pd.concat([make_chain_df(dte=30), make_chain_df(dte=60)], ignore_index=True)
+        surface = fit_svi_surface(df)
+        assert len(surface) == 2
+        assert list(surface.columns) == SURFACE_COLS
+
+    def test_uses_only_otm_points(self):
+        surface = fit_svi_surface(make_chain_df(n_strikes=31))
+        assert surface["n_points"].iloc[0] == 31
+
+    def test_sparse_slice_skipped(self):
+        df = make_chain_df(n_strikes=SVI_MIN_POINTS - 3)
+        assert fit_svi_surface(df).empty
+
+    def test_expired_rows_ignored(self):
+        df = make_chain_df()
+        df["dte"] = 0
+        assert fit_svi_surface(df).empty
+
+    def test_atm_iv_reasonable(self):
+        surface = fit_svi_surface(make_chain_df())
+        expected = np.sqrt(true_variance(0.0) / (30 / 365))
+        assert surface["atm_iv"].iloc[0] == pytest.approx(expected, rel=1e-3)
+
+
+class TestVolSurfaceEvaluator:
+
+    @pytest.fixture
+    def surface(self):
+        df = pd.concat([make_chain_df(dte=30), make_chain_df(dte=60)], ignore_index=True)
+        return VolSurface(fit_svi_surface(df))
+
+    def test_reproduces_input_iv(self, surface):
+        chain = make_chain_df(dte=30)
+        iv = surface.iv(chain["strike"].to_numpy(), 30)
+        assert np.allclose(iv, chain["iv"].to_numpy(), atol=1e-4)
+
+    def test_scalar_input_returns_scalar_shape(self, surface):
+        assert surface.iv(22000.0, 30).shape == ()
+
+    def test_interpolated_expiry_between_slices(self, surface):
+        iv_30 = surface.iv(22000.0, 30)
+        iv_60 = surface.iv(22000.0, 60)
+        iv_45 = surface.iv(22000.0, 45)
+        assert min(iv_30, iv_60) - 1e-6 <= iv_45 <= max(iv_30, iv_60) + 1e-6
+
+    def test_sticky_delta_moves_smile_with_spot(self, surface):
+        # same moneyness after a 5% rally → same IV
+        base    = surface.iv(22000.0, 30)
+        shifted = surface.iv(22000.0 * 1.05, 30, spot=22000.0 * 1.05)
+        assert shifted == pytest.approx(base, abs=1e-6)
+
+    def test_parallel_shock(self, surface):
+        base    = surface.iv(22000.0, 30)
+        shocked = surface.shocked(parallel=2.0).iv(22000.0, 30)
+        assert shocked == pytest.approx(base + 0.02, abs=1e-9)
+
+    def test_skew_shock_steepens_puts(self, surface):
+        base    = surface.iv(20000.0, 30)
+        shocked = surface.shocked(skew=-10.0).iv(20000.0, 30)
+        assert shocked > base
+
+    def test_empty_params_raises(self):
+        with pytest.raises(ValueError, match="zero SVI slices"):
+            VolSurface(pd.DataFrame(columns=SURFACE_COLS))
+
+    def test_round_trip_through_batch_solver(self, surface):
+        # surface IV priced back through the batch engine recovers itself
+        chain = make_chain_df(dte=30)
+        T = np.full(len(chain), 30 / 365)
+        chain["settle"] = _bs_price_vec(
+            chain["spot"].to_numpy(), chain["strike"].to_numpy(), T,
+            chain["rate"].to_numpy(), chain["div_yield"].to_numpy() / 100,
+            surface.iv(chain["strike"].to_numpy(), 30),
+            chain["option_type"].to_numpy() == "CE",
+        )
+        solved = compute_batch(chain)["iv"]
+        ok = ~np.isnan(solved)
+        assert ok.sum() > len(chain) * 0.9
+        assert np.allclose(solved[ok], surface.iv(chain["strike"].to_numpy(), 30)[ok], atol=1e-3)
@@ -1,5 +1,11 @@
+import numpy as np
+import pandas as pd
 import pytest
-from src.quant.yield_curve import TenorRates, interpolate_rate, TENOR_DAYS
+from src.quant.yield_curve import (
+    TenorRates, interpolate_rate, TENOR_DAYS,
+    YieldCurve, YieldCurveCache, TENOR_COLUMNS,
+    tenor_weights, tenor_shift_bps, twist_shocks, key_rate_rho,
+)
 
 
 
@@ -142,3 +148,111 @@ class TestOutputConvention:
         for dte in [0, 45, 91, 120, 182, 270, 365, 400]:
             r = interpolate_rate(rates, dte)
             assert 0.03 < r < 0.12
+
+
+class TestYieldCurve:
+
+    def test_vectorized_matches_scalar(self, rates):
+        dte   = np.array([0, 45, 91, 120, 182, 270, 365, 400])
+        curve = YieldCurve.from_tenor_rates(rates)
+        expected = [interpolate_rate(rates, int(d)) for d in dte]
+        assert np.allclose(curve.rate(dte), expected)
+
+    def test_additional_tenor(self):
+        curve = YieldCurve([91, 182, 365, 730], [0.064, 0.065, 0.066, 0.070])
+        assert curve.rate(547.5) == pytest.approx(0.068)
+        assert curve.rate(1000) == pytest.approx(0.070)
+
+    def test_unsorted_tenors_sorted(self):
+        curve = YieldCurve([365, 91, 182], [0.066, 0.064, 0.065])
+        assert curve.rate(91) == pytest.approx(0.064)
+
+    def test_tenor_count_mismatch_raises(self):
+        with pytest.raises(ValueError):
+            YieldCurve([91, 182], [0.06, 0.06, 0.06])
+
+    def test_discount_factor(self, rates):
+        curve = YieldCurve.from_tenor_rates(rates)
+        assert curve.discount_factor(45) == pytest.approx(np.exp(-0.0644 * 45 / 365))
+
+    def test_parallel_shift(self, rates):
+        curve = YieldCurve.from_tenor_rates(rates).shifted(25)
+        assert curve.rate(200) == pytest.approx(interpolate_rate(rates, 200) + 0.0025)
+
+    def test_twist_moves_ends_independently(self, steep_rates):
+        base    = YieldCurve.from_tenor_rates(steep_rates)
+        twisted = base.twisted(short_bps=-50, long_bps=50)
+        assert twisted.rate(30)  == pytest.approx(base.rate(30)  - 0.005)
+        assert twisted.rate(400) == pytest.approx(base.rate(400) + 0.005)
+
+    def test_per_row_curves(self):
+        curve = YieldCurve([91, 182], [[0.06, 0.07], [0.05, 0.05]])
+        r = curve.rate([150, 150], curve_idx=[0, 1])
+        assert r[0] > 0.06 and r[1] == pytest.approx(0.05)
+
+
+class TestYieldCurveCache:
+
+    def _rows(self):
+        return pd.DataFrame({
+            "trade_date": [pd.Timestamp("2025-01-01")] * 2 + [pd.Timestamp("2025-01-02")],
+            "dte":        [30, 200, 30],
+            "rate_3m":    [6.0, 6.0, 5.0],
+            "rate_6m":    [6.5, 6.5, 5.5],
+            "rate_1y":    [7.0, 7.0, 6.0],
+        })
+
+    def test_one_curve_per_date(self):
+        cache = YieldCurveCache.from_columns(self._rows(), TENOR_COLUMNS)
+        assert len(cache.curve) == 2
+
+    def test_rate_per_row_uses_own_date(self):
+        df    = self._rows()
+        cache = YieldCurveCache.from_columns(df, TENOR_COLUMNS)
+        r     = cache.rate(df["trade_date"], df["dte"])
+        assert r[0] == pytest.approx(0.06)
+        assert r[2] == pytest.approx(0.05)
+
+    def test_from_gbond_long_format(self):
+        gbond = pd.DataFrame({
+            "trade_date": ["2025-01-01"] * 3,
+            "tenor":      ["3m", "6m", "1y"],
+            "yield_pct":  [6.0, 6.5, 7.0],
+        })
+        cache = YieldCurveCache.from_gbond(gbond)
+        assert "2025-01-01" in cache
+        assert cache.curve_for("2025-01-01").rate(365) == pytest.approx(0.07)
+
+
+class TestTenorShocks:
+
+    def test_weights_sum_to_one(self):
+        w = tenor_weights([0, 45, 120, 182, 300, 500])
+        assert np.allclose(w.sum(axis=1), 1.0)
+
+    def test_weights_between_tenors(self):
+        w = tenor_weights([136.5])
+        assert np.allclose(w[0], [0.5, 0.5, 0.0])
+
+    def test_shift_matches_reinterpolated_curve(self, rates):
+        bumps = {"3m": 10.0, "6m": -5.0, "1y": 20.0}
+        dte   = np.array([30, 120, 250, 400])
+        base  = YieldCurve.from_tenor_rates(rates)
+        moved = base.shifted([bumps["3m"], bumps["6m"], bumps["1y"]])
+        assert np.allclose(tenor_shift_bps(bumps, dte) / 10000, moved.rate(dte) - base.rate(dte))
+
+    def test_empty_shocks_are_zero(self):
+        assert (tenor_shift_bps(None, np.array([30, 90])) == 0).all()
+
+    def test_twist_endpoints(self):
+        shocks = twist_shocks(short_bps=-25, long_bps=25)
+        assert shocks["3m"] == pytest.approx(-25)
+        assert shocks["1y"] == pytest.approx(25)
+        assert -25 < shocks["6m"] < 25
+
+    def test_key_rate_rho_sums_to_parallel(self):
+        rho = np.array([3.0, -1.5, 2.0])
+        krr = key_rate_rho(rho, [30, 150, 400])
+        assert np.allclose(krr.sum(axis=1), rho)
+        assert krr[0, 0] == pytest.approx(3.0)
+        assert krr[2, 2] == pytest.approx(2.0)